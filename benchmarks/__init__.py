@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+效能基準測試腳本
+"""
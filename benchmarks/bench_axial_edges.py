@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+軸向曲線邊效能比較
+
+以相同的壁面重建精度（自適應取樣的容許偏差）比較直線邊與 spline 邊所需的層數、
+塊數與 blockMeshDict 大小；中間點取自量測曲線，重建經過中間點，彎曲處所需的層數較少
+
+執行方式：
+    python -m benchmarks.bench_axial_edges --tolerance 0.01 0.001 --edge-points 0 2 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.core.layer_sampler import LayerSampler
+from src.core.mesh_generator import MeshGenerator
+from src.models.mesh_params import MeshParameters
+from src.models.point_cloud import PointCloud
+
+
+def _walls(n: int = 200_000) -> tuple[PointCloud, PointCloud]:
+    """前段為直管、後段彎曲的量測內外壁"""
+    z = np.linspace(0.0, 100.0, n)
+    bend = np.where(z > 40.0, 3.0 * np.sin((z - 40.0) / 6.0) ** 2, 0.0)
+    inner = PointCloud.from_columns(10.0 + bend, np.zeros(n), z)
+    outer = PointCloud.from_columns(20.0 + 0.5 * bend, np.zeros(n), z)
+    return inner, outer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tolerance", type=float, nargs="+", default=[0.01, 0.001], help="容許偏差"
+    )
+    parser.add_argument(
+        "--edge-points", type=int, nargs="+", default=[0, 2, 4], help="中間點數"
+    )
+    parser.add_argument("--max-layers", type=int, default=5000, help="層數上限")
+    args = parser.parse_args()
+
+    inner, outer = _walls()
+    print(
+        f"{'tolerance':>9} {'points':>6} {'layers':>7} {'blocks':>7} "
+        f"{'dict MB':>8} {'sample s':>8} {'emit s':>7}"
+    )
+    for tolerance in args.tolerance:
+        for edge_points in args.edge_points:
+            sampler = LayerSampler(inner, outer)
+            start = time.perf_counter()
+            inner_samples, outer_samples = sampler.sample_adaptive(
+                tolerance, args.max_layers, edge_points
+            )
+            sample_time = time.perf_counter() - start
+
+            params = MeshParameters(
+                n_cells_radial=10, n_cells_circum=40, axial_edge_points=edge_points
+            )
+            generator = MeshGenerator(params, profile="compact")
+            start = time.perf_counter()
+            mesh = generator.build_mesh(inner_samples, outer_samples)
+            size = len(generator.to_bytes(inner_samples, outer_samples))
+            emit_time = time.perf_counter() - start
+
+            layers = mesh.n_vertices // 8
+            print(
+                f"{tolerance:>9g} {edge_points:>6} {layers:>7} {mesh.n_blocks:>7} "
+                f"{size / 1e6:>8.3f} {sample_time:>8.3f} {emit_time:>7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+blockMeshDict 輸出效能比較
+
+比較舊的逐行 f-string 寫入與向量化批次格式化的輸出吞吐量，
+並確認兩者輸出逐位元組一致
+
+執行方式：
+    python -m benchmarks.bench_emission --layers 5000
+"""
+
+import argparse
+import math
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.core.mesh_generator import MeshGenerator
+from src.models.mesh_params import MeshParameters
+
+
+def _legacy_generate(params: MeshParameters, inner, outer, path: Path) -> None:
+    """舊版輸出方式（每個頂點、圓弧、hex、面各一次 f.write）"""
+    n = len(inner)
+    nr = params.n_cells_radial
+    nq = params.n_cells_circum // 4
+    na = params.n_cells_axial
+    sqrt_half = math.sqrt(0.5)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(MeshGenerator.HEADER_TEMPLATE.format(scale=params.scale_factor))
+
+        f.write("vertices\n(\n")
+        for i, (inner_pt, outer_pt) in enumerate(zip(inner, outer)):
+            for label, r, offset in (("內圈", inner_pt[0], 0), ("外圈", outer_pt[0], 4)):
+                z = inner_pt[2]
+                f.write(f"    // 層 {i + 1} - {label}頂點，z = {z:.3f}\n")
+                v = i * 8 + offset
+                f.write(f"    ({r:.6f}  0.000000  {z:.6f})  // 頂點 {v + 0}\n")
+                f.write(f"    (0.000000  {r:.6f}  {z:.6f})  // 頂點 {v + 1}\n")
+                f.write(f"    ({-r:.6f}  0.000000  {z:.6f})  // 頂點 {v + 2}\n")
+                f.write(f"    (0.000000  {-r:.6f}  {z:.6f})  // 頂點 {v + 3}\n")
+        f.write(");\n\n")
+
+        f.write("blocks\n(\n")
+        for i in range(n - 1):
+            f.write(f"    // 連接層 {i + 1} 和層 {i + 2} 的塊\n")
+            for quad in range(4):
+                v0 = i * 8 + quad
+                v1 = i * 8 + (quad + 1) % 4
+                v4 = i * 8 + 4 + quad
+                v5 = i * 8 + 4 + (quad + 1) % 4
+                f.write(f"    hex ({v0} {v4} {v5} {v1} {v0 + 8} {v4 + 8} {v5 + 8} {v1 + 8}) ")
+                f.write(f"({nr} {nq} {na}) simpleGrading (1 1 1)\n")
+        f.write(");\n\n")
+
+        f.write("edges\n(\n")
+        signs = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+        for i, (inner_pt, outer_pt) in enumerate(zip(inner, outer)):
+            z = inner_pt[2]
+            for label, r, offset in (("內圈", inner_pt[0], 0), ("外圈", outer_pt[0], 4)):
+                d = r * sqrt_half
+                f.write(f"    // 層 {i + 1} - {label}弧，z = {z:.3f}\n")
+                for quad, (sx, sy) in enumerate(signs):
+                    a = i * 8 + offset + quad
+                    b = i * 8 + offset + (quad + 1) % 4
+                    dx = d if sx > 0 else -d
+                    dy = d if sy > 0 else -d
+                    f.write(f"    arc {a} {b} ({dx:.6f} {dy:.6f} {z:.6f})\n")
+        f.write(");\n\n")
+
+        f.write("boundary\n(\n")
+        f.write("    inlet\n    {\n        type patch;\n        faces\n        (\n")
+        f.write("            // 底面（第一層）\n")
+        for quad in range(4):
+            f.write(f"            ({quad} {4 + quad} {4 + (quad + 1) % 4} {(quad + 1) % 4})\n")
+        f.write("        );\n    }\n")
+        last = (n - 1) * 8
+        f.write("    outlet\n    {\n        type patch;\n        faces\n        (\n")
+        f.write("            // 頂面（最後一層）\n")
+        for quad in range(4):
+            q1 = (quad + 1) % 4
+            f.write(f"            ({last + quad} {last + q1} {last + 4 + q1} {last + 4 + quad})\n")
+        f.write("        );\n    }\n")
+        f.write("    innerWall\n    {\n        type wall;\n        faces\n        (\n")
+        for i in range(n - 1):
+            for quad in range(4):
+                v0 = i * 8 + quad
+                v1 = i * 8 + (quad + 1) % 4
+                f.write(f"            ({v0} {v1} {v1 + 8} {v0 + 8})\n")
+        f.write("        );\n    }\n")
+        f.write("    outerWall\n    {\n        type wall;\n        faces\n        (\n")
+        for i in range(n - 1):
+            for quad in range(4):
+                v4 = i * 8 + 4 + quad
+                v5 = i * 8 + 4 + (quad + 1) % 4
+                f.write(f"            ({v4} {v4 + 8} {v5 + 8} {v5})\n")
+        f.write("        );\n    }\n")
+
+        f.write(");\n\nmergePatchPairs\n(\n);\n\n")
+        f.write(
+            "// ************************************************************************* //\n"
+        )
+
+
+def _samples(layers: int) -> tuple[np.ndarray, np.ndarray]:
+    """產生測試用的內外曲線取樣點"""
+    z = np.linspace(0.0, 100.0, layers)
+    inner = np.column_stack([10.0 + np.sin(z), np.zeros(layers), z])
+    outer = np.column_stack([20.0 + np.cos(z), np.zeros(layers), z])
+    return inner, outer
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", type=int, default=5000, help="層數")
+    parser.add_argument("--repeat", type=int, default=3, help="重複次數（取最佳）")
+    args = parser.parse_args()
+
+    params = MeshParameters(num_layers=args.layers)
+    inner, outer = _samples(args.layers)
+    generator = MeshGenerator(params)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fast_path = Path(tmp) / "fast"
+        legacy_path = Path(tmp) / "legacy"
+
+        fast_time = min(
+            _timed(generator.generate, inner, outer, fast_path)
+            for _ in range(args.repeat)
+        )
+        legacy_time = min(
+            _timed(_legacy_generate, params, inner.tolist(), outer.tolist(), legacy_path)
+            for _ in range(args.repeat)
+        )
+
+        size_mb = fast_path.stat().st_size / 1e6
+        print(f"layers = {args.layers}, output = {size_mb:.1f} MB")
+        print(f"vectorized : {fast_time:8.3f} s  ({size_mb / fast_time:7.1f} MB/s)")
+        print(f"legacy     : {legacy_time:8.3f} s  ({size_mb / legacy_time:7.1f} MB/s)")
+        print(f"speedup    : {legacy_time / fast_time:8.1f} x")
+        assert fast_path.read_bytes() == legacy_path.read_bytes(), "兩種輸出不一致"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+gzip 壓縮輸出效能比較
+
+比較純文字與 gzip 壓縮輸出的耗時與寫入位元組數
+
+執行方式：
+    python -m benchmarks.bench_gzip --layers 100 500 5000 --level 6
+"""
+
+import argparse
+import gzip
+import tempfile
+import time
+from pathlib import Path
+
+from src.core.mesh_generator import MeshGenerator
+from src.core.output_writer import DEFAULT_COMPRESSLEVEL
+from src.models.mesh_params import MeshParameters
+
+from .bench_emission import _samples
+
+
+def _best_time(func, repeat: int) -> float:
+    """重複執行並取最佳耗時"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--layers", type=int, nargs="+", default=[100, 500, 5000], help="層數"
+    )
+    parser.add_argument(
+        "--level", type=int, default=DEFAULT_COMPRESSLEVEL, help="壓縮等級 0~9"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="重複次數（取最佳）")
+    args = parser.parse_args()
+
+    print(
+        f"{'layers':>7} {'plain s':>9} {'plain MB':>9} "
+        f"{'gzip s':>9} {'gzip MB':>9} {'ratio':>7}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        plain_path = Path(tmp) / "blockMeshDict"
+        gzip_path = Path(tmp) / "blockMeshDict.gz"
+
+        for layers in args.layers:
+            params = MeshParameters(num_layers=layers)
+            inner, outer = _samples(layers)
+            plain = MeshGenerator(params)
+            packed = MeshGenerator(params, compresslevel=args.level)
+
+            plain_time = _best_time(
+                lambda: plain.to_path(inner, outer, plain_path), args.repeat
+            )
+            gzip_time = _best_time(
+                lambda: packed.to_path(inner, outer, gzip_path), args.repeat
+            )
+
+            plain_size = plain_path.stat().st_size
+            gzip_size = gzip_path.stat().st_size
+            print(
+                f"{layers:>7} {plain_time:>9.3f} {plain_size / 1e6:>9.2f} "
+                f"{gzip_time:>9.3f} {gzip_size / 1e6:>9.2f} "
+                f"{plain_size / gzip_size:>6.1f}x"
+            )
+            assert gzip.decompress(gzip_path.read_bytes()) == plain_path.read_bytes()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+CSV/TXT 匯入效能比較
+
+比較舊的 pandas python 解析器路徑與 C 解析器快速路徑
+
+執行方式：
+    python -m benchmarks.bench_ingest --rows 2000000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.core.ingest import read_text_points
+
+
+def _legacy_read_csv(path: Path) -> np.ndarray:
+    """舊版讀取方式（pandas python 解析器 + 標題偵測）"""
+    df = pd.read_csv(path, header=None, sep=None, engine="python")
+    try:
+        pd.to_numeric(df.iloc[0])
+    except (ValueError, TypeError):
+        df = df.iloc[1:]
+    return df.iloc[:, :3].astype(float).values
+
+
+def _write_sample(path: Path, rows: int) -> None:
+    """寫入測試用的點位檔案"""
+    rng = np.random.default_rng(0)
+    z = np.sort(rng.uniform(0.0, 100.0, rows))
+    x = np.where(rng.random(rows) < 0.5, 10.0, 20.0) + rng.normal(0.0, 0.1, rows)
+    points = np.column_stack([x, np.zeros(rows), z])
+    np.savetxt(path, points, fmt="%.6f", delimiter=",", header="X,Y,Z", comments="")
+
+
+def _timed(func, *args) -> tuple[float, np.ndarray]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="點位數")
+    parser.add_argument("--skip-legacy", action="store_true", help="略過舊版路徑")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "points.csv"
+        _write_sample(path, args.rows)
+        size_mb = path.stat().st_size / 1e6
+        print(f"rows = {args.rows}, file = {size_mb:.1f} MB")
+
+        fast_time, fast = _timed(read_text_points, path)
+        print(f"fast (C tokenizer)   : {fast_time:8.3f} s")
+
+        if not args.skip_legacy:
+            legacy_time, legacy = _timed(_legacy_read_csv, path)
+            print(f"legacy (python)      : {legacy_time:8.3f} s")
+            print(f"speedup              : {legacy_time / fast_time:8.1f} x")
+            assert np.array_equal(fast, legacy), "兩種路徑結果不一致"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+polyMesh 直接輸出效能比較
+
+比較 ascii 與 binary 格式寫出 polyMesh 的耗時與檔案大小，並讀回驗證
+
+執行方式：
+    python -m benchmarks.bench_polymesh --layers 10 100
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.core.foam_io import read_polymesh
+from src.core.mesh_generator import MeshGenerator
+from src.core.polymesh import write_polymesh
+from src.models.mesh_params import MeshParameters
+
+from .bench_emission import _samples
+
+
+def _dir_size(path: Path) -> int:
+    """目錄內檔案總大小"""
+    return sum(p.stat().st_size for p in path.iterdir())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--layers", type=int, nargs="+", default=[10, 100], help="層數"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'layers':>7} {'cells':>10} {'build s':>8} {'ascii s':>8} {'ascii MB':>9} "
+        f"{'binary s':>8} {'binary MB':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for layers in args.layers:
+            inner, outer = _samples(layers)
+            generator = MeshGenerator(MeshParameters(num_layers=layers))
+
+            start = time.perf_counter()
+            polymesh = generator.build_polymesh(inner, outer)
+            build_time = time.perf_counter() - start
+
+            row = [f"{layers:>7} {polymesh.n_cells:>10} {build_time:>8.3f}"]
+            for fmt in ("ascii", "binary"):
+                output_dir = Path(tmp) / fmt / "polyMesh"
+                start = time.perf_counter()
+                write_polymesh(polymesh, output_dir, fmt)
+                elapsed = time.perf_counter() - start
+                row.append(f"{elapsed:>8.3f} {_dir_size(output_dir) / 1e6:>9.2f}")
+
+                loaded = read_polymesh(output_dir)
+                assert np.array_equal(loaded.faces, polymesh.faces)
+                assert np.array_equal(loaded.neighbour, polymesh.neighbour)
+            print(" ".join(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+輸出檔案快取模組
+
+以「輸入資料指紋 + 所有參數欄位 + 產生器版本」的標準化雜湊為鍵值，
+儲存生成好的 blockMeshDict；相同輸入再次生成時直接以硬連結（不支援時複製）
+放到輸出位置，不需重新組合與寫入全文。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from ..models.point_cloud import PointCloud
+from .disk_cache import DEFAULT_MAX_BYTES, DiskCache, default_cache_dir
+from .output_writer import file_digest, file_matches, place_file
+
+# 快取格式版本，變更儲存內容時需遞增
+ARTIFACT_CACHE_VERSION = 1
+
+
+def geometry_fingerprint(*clouds: PointCloud) -> str:
+    """
+    計算取樣幾何的指紋
+
+    Args:
+        clouds: 取樣點雲（如內、外曲線取樣）
+
+    Returns:
+        str: 十六進位指紋字串
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for cloud in clouds:
+        columns = np.ascontiguousarray(cloud.columns)
+        digest.update(f"{columns.dtype.str}:{columns.shape}".encode())
+        digest.update(columns.data)
+    return digest.hexdigest()
+
+
+def artifact_key(
+    generator: str,
+    version: int,
+    *params: Any,
+    data: Optional[str] = None,
+    **options: Any,
+) -> str:
+    """
+    計算輸出快取鍵值
+
+    參數資料類別依型別名稱與所有欄位轉為排序鍵的 JSON，
+    浮點數以 repr 表示，因此相同數值必得相同鍵值。
+
+    Args:
+        generator: 產生器名稱
+        version: 產生器版本（輸出格式變更時遞增）
+        params: 參數資料類別
+        data: 輸入資料指紋（可選）
+        options: 其他影響輸出的選項（如輸出格式），需可轉為 JSON
+
+    Returns:
+        str: 十六進位鍵值
+    """
+    canonical = {
+        "cache_version": ARTIFACT_CACHE_VERSION,
+        "generator": generator,
+        "version": version,
+        "params": [
+            {"type": type(p).__name__, "fields": asdict(p)}
+            for p in params
+            if is_dataclass(p)
+        ],
+        "data": data,
+        "options": options,
+    }
+    text = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ArtifactCache(DiskCache):
+    """生成結果快取（依大小上限 LRU 淘汰）"""
+
+    ARTIFACT_FILE = "blockMeshDict"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        link: bool = True,
+    ):
+        """
+        初始化輸出快取
+
+        Args:
+            cache_dir: 快取目錄（預設為使用者快取目錄下的 artifacts/）
+            max_bytes: 快取總大小上限（位元組）
+            link: 是否優先以硬連結放置檔案
+        """
+        if cache_dir is None:
+            cache_dir = default_cache_dir() / "artifacts"
+        super().__init__(cache_dir, max_bytes)
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """命中統計"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def fetch(self, key: str, output_file: str | Path) -> bool:
+        """
+        將快取項目放到輸出位置
+
+        項目內容以雜湊驗證，若檔案曾被修改（例如輸出檔的硬連結被就地編輯）
+        則刪除該項目並視為未命中。輸出檔案內容已相同時不取代，保留其修改時間。
+
+        Args:
+            key: artifact_key() 取得的鍵值
+            output_file: 輸出檔案路徑
+
+        Returns:
+            bool: 是否命中
+        """
+        meta = self.read_meta(key)
+        if meta is not None and meta.get("version") == ARTIFACT_CACHE_VERSION:
+            artifact = self.entry_dir(key) / self.ARTIFACT_FILE
+            size, digest = meta.get("size"), meta.get("digest")
+            if file_matches(artifact, size, digest):
+                if not file_matches(output_file, size, digest):
+                    place_file(artifact, output_file, self.link)
+                self.hits += 1
+                return True
+            self.remove(key)
+
+        self.misses += 1
+        return False
+
+    def store(self, key: str, source_file: str | Path) -> Path:
+        """
+        將生成好的檔案存入快取
+
+        Args:
+            key: artifact_key() 取得的鍵值
+            source_file: 已生成的檔案
+
+        Returns:
+            Path: 項目目錄
+        """
+        staging = self.new_staging_dir()
+        artifact = staging / self.ARTIFACT_FILE
+        place_file(source_file, artifact, self.link)
+
+        meta = {
+            "version": ARTIFACT_CACHE_VERSION,
+            "size": artifact.stat().st_size,
+            "digest": file_digest(artifact),
+        }
+        return self.commit(key, staging, meta)
+
+    def get_or_create(
+        self,
+        key: str,
+        output_file: str | Path,
+        create: Callable[[Path], Any],
+    ) -> bool:
+        """
+        命中時直接放置快取檔案，否則呼叫 create 生成後存入快取
+
+        Args:
+            key: artifact_key() 取得的鍵值
+            output_file: 輸出檔案路徑
+            create: 生成函數，參數為輸出檔案路徑
+
+        Returns:
+            bool: 是否命中
+        """
+        output_path = Path(output_file)
+        if self.fetch(key, output_path):
+            return True
+
+        create(output_path)
+        try:
+            self.store(key, output_path)
+        except OSError:
+            # 快取寫入失敗不影響生成結果
+            pass
+        return False
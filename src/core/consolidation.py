@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+塊合併模組
+
+半徑沿 Z 呈線性變化的連續多層（例如直管段、錐形段）不需要逐層切成塊：
+中間層都落在首尾兩層連線上時，整段合併為一個塊，軸向網格數為各段之和。
+合併只刪除中間層，保留層的頂點、圓弧與邊界面不變。
+取樣含曲線邊中間點時，共線判斷涵蓋段內的所有取樣點。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# 每對相鄰層之間的塊數
+BLOCKS_PER_PAIR = 4
+
+
+@dataclass
+class Consolidation:
+    """塊合併結果"""
+
+    # 保留的層索引（遞增，含首尾兩層）
+    keep: NDArray
+
+    # 合併前的層數
+    n_layers: int
+
+    @property
+    def spans(self) -> NDArray:
+        """各合併塊涵蓋的原始層段數，形狀 (len(keep) - 1,)"""
+        return np.diff(self.keep)
+
+    @property
+    def blocks_saved(self) -> int:
+        """合併省下的塊數"""
+        return BLOCKS_PER_PAIR * (self.n_layers - len(self.keep))
+
+
+def _run_is_collinear(
+    z: NDArray,
+    radii: NDArray,
+    start: int,
+    stop: int,
+    tolerance: float,
+    stride: int = 1,
+) -> bool:
+    """第 start ~ stop 層之間的取樣點是否都落在首尾兩層的連線上"""
+    start, stop = start * stride, stop * stride
+    if stop - start < 2:
+        return True
+    t = (z[start + 1 : stop] - z[start]) / (z[stop] - z[start])
+    chord = radii[:, start, None] + (radii[:, stop] - radii[:, start])[:, None] * t
+    return bool(np.all(np.abs(radii[:, start + 1 : stop] - chord) <= tolerance))
+
+
+def consolidate_layers(
+    z: ArrayLike, radii: ArrayLike, tolerance: float, stride: int = 1
+) -> Consolidation:
+    """
+    找出半徑共線的連續層段，只保留各段的首尾層
+
+    自每段起點以倍增再二分的方式找出最長的共線段，
+    每次檢查以向量化比對段內所有中間層。
+
+    Args:
+        z: 各取樣點 Z 座標，形狀 (N,)，第 k·stride 個為第 k 層
+        radii: 各壁面各取樣點半徑，形狀 (W, N)
+        tolerance: 中間層與首尾連線的容許偏差（0 為只合併完全共線）
+        stride: 相鄰兩層在取樣點中的間隔（含曲線邊中間點；1 為每點一層）
+
+    Returns:
+        Consolidation: 合併結果
+    """
+    z = np.asarray(z, dtype=np.float64)
+    radii = np.atleast_2d(np.asarray(radii, dtype=np.float64))
+    if tolerance < 0:
+        raise ValueError(f"容許偏差不可為負: {tolerance}")
+    if stride < 1 or (len(z) - 1) % stride:
+        raise ValueError(f"取樣點數 {len(z)} 不符合層間隔 {stride}")
+    n_layers = (len(z) - 1) // stride + 1
+    if n_layers < 2:
+        return Consolidation(np.arange(n_layers), n_layers)
+
+    keep = [0]
+    start = 0
+    last = n_layers - 1
+    while start < last:
+        # 倍增找出第一個不共線的終點，再於其間二分
+        good, step = start + 1, 2
+        while good < last:
+            stop = min(start + step, last)
+            if not _run_is_collinear(z, radii, start, stop, tolerance, stride):
+                break
+            good, step = stop, 2 * step
+        else:
+            keep.append(last)
+            break
+
+        bad = min(start + step, last)
+        while bad - good > 1:
+            middle = (good + bad) // 2
+            if _run_is_collinear(z, radii, start, middle, tolerance, stride):
+                good = middle
+            else:
+                bad = middle
+        keep.append(good)
+        start = good
+
+    return Consolidation(np.array(keep), n_layers)
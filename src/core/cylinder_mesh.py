@@ -3,19 +3,45 @@
 圓柱網格生成器模組
 
 將 M4 模板功能完全轉換為 Python 實作
-生成以 X 軸為高度方向的圓柱形 blockMeshDict
+生成以 X 軸為高度方向的圓柱形 blockMeshDict；
+對稱模式只輸出半域或四分之一域的 O-grid 扇形，切面為 symmetryPlane
 """
 
 import math
+from dataclasses import replace
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
+
+from ..models.block_mesh import BlockMesh, Patch
 from ..models.mesh_params import CylinderMeshParams
+from .artifact_cache import artifact_key
+from .grading import MultiGrading, check_sections, wall_grading
+from .dict_writer import (
+    FACE_LINE,
+    HEX_LINE,
+    block_fields,
+    iter_compact_dict,
+    patch_text,
+)
+from .output_profile import PROFILE_ANNOTATED, PROFILE_COMPACT, check_profile
+from .output_writer import (
+    atomic_output,
+    check_compresslevel,
+    encode_output,
+    write_chunks,
+    write_if_changed,
+)
+from .progress import ProgressReporter
 
 
 class CylinderMeshGenerator:
     """圓柱網格生成器"""
 
+    # 輸出格式版本，相同參數的輸出內容改變時需遞增（使輸出快取失效）
+    VERSION = 1
+
     # OpenFOAM blockMeshDict 檔案頭模板
     HEADER_TEMPLATE = """/*--------------------------------*- C++ -*----------------------------------*\\
 | =========                 |                                                 |
@@ -38,62 +64,437 @@ scale   1.0;
 
 """
 
-    def __init__(self, params: CylinderMeshParams):
+    # hex 塊的頂點：中心方形 1 塊、內圓環扇形 4 塊
+    BLOCKS = [
+        (1, 0, 3, 2, 9, 8, 11, 10),
+        (0, 4, 7, 3, 8, 12, 15, 11),
+        (3, 7, 6, 2, 11, 15, 14, 10),
+        (2, 6, 5, 1, 10, 14, 13, 9),
+        (1, 5, 4, 0, 9, 13, 12, 8),
+    ]
+
+    # 各塊的 cellZone（對應 ZONE_NAMES）
+    ZONES = [0, 1, 1, 1, 1]
+    ZONE_NAMES = ["square", "innerCircle"]
+
+    # 入口、出口面：中心方形 + 四個扇形
+    INLET_FACES = [(0, 1, 2, 3), (0, 3, 7, 4), (3, 2, 6, 7), (2, 1, 5, 6), (1, 0, 4, 5)]
+    OUTLET_FACES = [
+        (8, 11, 10, 9),
+        (8, 12, 15, 11),
+        (11, 15, 14, 10),
+        (10, 14, 13, 9),
+        (9, 13, 12, 8),
+    ]
+
+    # 對稱模式截面上內方形的點位角度（度，Y-Z 平面上自 +Y 起算）、是否含中心點，
+    # 以及切面 patch（名稱、法向），各模式的點位依角度遞增排列
+    SECTIONS = {
+        "half": ((0, 45, 135, 180), False, (("symmetryZ", 2),)),
+        "quarter": ((0, 45, 90), True, (("symmetryZ", 2), ("symmetryY", 1))),
+    }
+    SYMMETRY_LABELS = {"half": "半域", "quarter": "四分之一域"}
+
+    def __init__(
+        self,
+        params: CylinderMeshParams,
+        profile: str = PROFILE_ANNOTATED,
+        compresslevel: Optional[int] = None,
+    ):
         """
         初始化生成器
 
         Args:
             params: 圓柱網格參數
+            profile: 輸出格式（"annotated" 或 "compact"）
+            compresslevel: 寫入檔案時的 gzip 壓縮等級 0~9（None 為不壓縮）
         """
         self.params = params
+        self.profile = check_profile(profile)
+        self.compresslevel = check_compresslevel(compresslevel)
 
         # 預計算角度值（度）
         self._angles = [-45, -135, 135, 45]  # 四個角點
         self._edge_angles = [0, -90, 180, 90]  # 邊中點
 
-    def generate(self, output_file: str | Path) -> str:
+    def artifact_key(self) -> str:
+        """計算輸出快取鍵值（所有參數欄位與版本）"""
+        return artifact_key(
+            type(self).__name__,
+            self.VERSION,
+            self.params,
+            profile=self.profile,
+            compresslevel=self.compresslevel,
+        )
+
+    @property
+    def compact(self) -> bool:
+        """是否為 compact 輸出格式"""
+        return self.profile == PROFILE_COMPACT
+
+    def generate(
+        self, output_file: str | Path, progress: Optional[ProgressReporter] = None
+    ) -> str:
         """
         生成 blockMeshDict 檔案
 
+        先寫入暫存檔再取代目標檔案；失敗或取消時不會留下寫到一半的檔案。
+        設定 compresslevel 時檔案以 gzip 壓縮。
+
         Args:
             output_file: 輸出檔案路徑
+            progress: 進度回報器（可選），逐段回報並檢查取消
+
+        Returns:
+            生成的 blockMeshDict 內容（未壓縮）
+        """
+        content = self.to_bytes(progress)
+
+        if progress is not None:
+            progress.report(90, "stage_writing")
+        with atomic_output(output_file, binary=True) as f:
+            write_chunks(encode_output([content], self.compresslevel), f)
+
+        return content.decode("utf-8")
+
+    def iter_chunks(
+        self, progress: Optional[ProgressReporter] = None
+    ) -> Iterator[bytes]:
+        """
+        逐段產生 UTF-8 編碼的 blockMeshDict 內容
+
+        Args:
+            progress: 進度回報器（可選）
+
+        Yields:
+            bytes: 編碼後的文字區塊
+        """
+        for text in self._iter_sections(progress or ProgressReporter()):
+            yield text.encode("utf-8")
+
+    def write_to(
+        self, fileobj: BinaryIO, progress: Optional[ProgressReporter] = None
+    ) -> int:
+        """
+        將 blockMeshDict 串流寫入二進位檔案物件
+
+        Args:
+            fileobj: 二進位寫入物件（檔案、管線、gzip 串流等）
+            progress: 進度回報器（可選）
 
         Returns:
-            生成的 blockMeshDict 內容
+            int: 寫入的位元組數
+        """
+        return write_chunks(self.iter_chunks(progress), fileobj)
+
+    def to_bytes(self, progress: Optional[ProgressReporter] = None) -> bytes:
+        """取得完整的 blockMeshDict 內容（UTF-8）"""
+        return b"".join(self.iter_chunks(progress))
+
+    def to_path(
+        self, output_file: str | Path, progress: Optional[ProgressReporter] = None
+    ) -> Path:
+        """
+        將 blockMeshDict 串流寫入檔案（原子取代；設定 compresslevel 時以 gzip 壓縮）
+
+        Args:
+            output_file: 輸出檔案路徑
+            progress: 進度回報器（可選）
+
+        Returns:
+            Path: 輸出檔案路徑
         """
         output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(output_path, binary=True) as f:
+            write_chunks(self._file_chunks(progress), f)
+        return output_path
 
-        content = self._build_content()
+    def update_path(
+        self, output_file: str | Path, progress: Optional[ProgressReporter] = None
+    ) -> bool:
+        """
+        僅在內容改變時寫入檔案（內容相同時保留原檔與其修改時間）
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        Args:
+            output_file: 輸出檔案路徑
+            progress: 進度回報器（可選）
 
-        return content
+        Returns:
+            bool: 檔案是否改變
+        """
+        return write_if_changed(self._file_chunks(progress), output_file)
+
+    def _file_chunks(self, progress: Optional[ProgressReporter]) -> Iterable[bytes]:
+        """寫入檔案的區塊（依 compresslevel 壓縮）"""
+        return encode_output(self.iter_chunks(progress), self.compresslevel)
 
     def _build_content(self) -> str:
         """構建完整的 blockMeshDict 內容"""
-        lines = [self.HEADER_TEMPLATE]
+        return "".join(self._iter_sections(ProgressReporter()))
+
+    def cell_counts(self) -> Tuple[int, int]:
+        """
+        網格數與完整圓柱的網格數（對稱模式減少的網格數）
+
+        Returns:
+            Tuple[int, int]: (本模式網格數, 完整圓柱網格數)
+        """
+        full = CylinderMeshGenerator(replace(self.params, symmetry="full"))
+        return self.build_mesh().n_cells, full.build_mesh().n_cells
+
+    def axial_grading(self) -> MultiGrading | float:
+        """
+        高度方向的網格數與漸變
+
+        Returns:
+            MultiGrading | float: 設定第一格高度或多段漸變時為多段漸變
+            （含總網格數），否則為單一擴展比（網格數為 n_cells_height）
+        """
+        p = self.params
+        if p.first_cell_height > 0:
+            return wall_grading(p.height, p.first_cell_height, p.max_cell_height)
+        if p.axial_sections:
+            return MultiGrading(p.n_cells_height, check_sections(p.axial_sections))
+        return p.axial_grading
+
+    def _apply_axial_grading(self, mesh: BlockMesh) -> BlockMesh:
+        """將高度方向（各塊的第 3 方向）的網格數與漸變套用至中間表示"""
+        grading = self.axial_grading()
+        if isinstance(grading, MultiGrading):
+            mesh.cells[:, 2] = grading.n_cells
+            mesh.multi_grading[2] = grading.sections
+        else:
+            mesh.grading[:, 2] = grading
+        return mesh
+
+    def build_mesh(self) -> BlockMesh:
+        """
+        建立中間表示（所有輸出皆走訪此結果）
+
+        Returns:
+            BlockMesh: 底面、頂面各 8 個頂點（內方形 4 點、外圈 4 點）、5 個塊、16 段圓弧；
+            對稱模式見 _build_section_mesh
+        """
+        if self.params.symmetry in self.SECTIONS:
+            return self._apply_axial_grading(self._build_section_mesh())
+
+        p = self.params
+        heights = (p.base_x, p.outlet_x)
+
+        vertices = [
+            self._calc_vertex(is_outer, i, x_pos)
+            for x_pos in heights
+            for is_outer in (False, True)
+            for i in range(4)
+        ]
+
+        # 圓弧依序為底面外圈、頂面外圈、底面內方形、頂面內方形
+        arc_edges = []
+        arc_points = []
+        for is_outer in (True, False):
+            for level, x_pos in enumerate(heights):
+                base = 8 * level + (4 if is_outer else 0)
+                for i in range(4):
+                    arc_edges.append((base + (i + 1) % 4, base + i))
+                    arc_points.append(self._calc_edge_point(is_outer, i, x_pos))
+
+        enclosure = [
+            (4 + i, 4 + (i + 1) % 4, 12 + (i + 1) % 4, 12 + i) for i in range(4)
+        ]
+        square = (p.n_cells_square, p.n_cells_square, p.n_cells_height)
+        sector = (p.n_cells_inner, p.n_cells_square, p.n_cells_height)
+
+        mesh = BlockMesh(
+            vertices=vertices,
+            blocks=self.BLOCKS,
+            cells=[square] + [sector] * 4,
+            grading=np.ones((len(self.BLOCKS), 3)),
+            arc_edges=arc_edges,
+            arc_points=arc_points,
+            patches=[
+                Patch("Enclosure", "patch", enclosure),
+                Patch("inlet", "patch", self.INLET_FACES),
+                Patch("outlet", "patch", self.OUTLET_FACES),
+            ],
+            zones=self.ZONES,
+            zone_names=self.ZONE_NAMES,
+        )
+        return self._apply_axial_grading(mesh)
+
+    def _build_section_mesh(self) -> BlockMesh:
+        """
+        建立半域或四分之一域的中間表示
+
+        每層依序為內方形點位、外圈點位（與內方形點位同角度）、中心點（僅四分之一域）；
+        中心塊由內方形點位（與中心點）圍成，相鄰兩個點位角度之間各有一個扇形塊，
+        扇形的圓周網格數依角度比例（90° 為 n_cells_square）。
+        """
+        p = self.params
+        angles, has_center, planes = self.SECTIONS[p.symmetry]
+        n = len(angles)
+        per_level = 2 * n + int(has_center)
+        center = 2 * n
+
+        section = [self._section_point(False, a) for a in angles]
+        section += [self._section_point(True, a) for a in angles]
+        if has_center:
+            section.append((0.0, 0.0))
+        vertices = [
+            (x_pos, y, z) for x_pos in (p.base_x, p.outlet_x) for y, z in section
+        ]
+
+        # 中心塊：逆時針排列（自 +X 看），半域以切面上的兩個內方形點位為起點
+        core = (center, 0, 1, 2) if has_center else (n - 1, 0, 1, 2)
+        half_square = p.n_cells_square // 2
+        core_cells = (half_square if has_center else p.n_cells_square, half_square)
+        sectors = [(k, n + k, n + k + 1, k + 1) for k in range(n - 1)]
+        bottoms = [core] + sectors
+        blocks = [face + tuple(v + per_level for v in face) for face in bottoms]
+        cells = [core_cells + (p.n_cells_height,)] + [
+            (
+                p.n_cells_inner,
+                p.n_cells_square * (angles[k + 1] - angles[k]) // 90,
+                p.n_cells_height,
+            )
+            for k in range(n - 1)
+        ]
+
+        # 圓弧依序為底面外圈、頂面外圈、底面內方形、頂面內方形
+        arc_edges = []
+        arc_points = []
+        for is_outer in (True, False):
+            for level, x_pos in enumerate((p.base_x, p.outlet_x)):
+                base = per_level * level + (n if is_outer else 0)
+                for k in range(n - 1):
+                    arc_edges.append((base + k, base + k + 1))
+                    y, z = self._section_arc_point(is_outer, angles[k], angles[k + 1])
+                    arc_points.append((x_pos, y, z))
+
+        # 切面：座標分量（1 為 Y、2 為 Z）為 0 的底面邊，沿高度方向延伸
+        edges = [e for face in bottoms for e in zip(face, face[1:] + face[:1])]
+        enclosure = [
+            self._side_face(n + k, n + k + 1, per_level) for k in range(n - 1)
+        ]
+        patches = [
+            Patch("Enclosure", "patch", enclosure),
+            # 入口、出口面的法向量指向域外（與完整模式的 INLET_FACES、OUTLET_FACES 相同）
+            Patch("inlet", "patch", [face[::-1] for face in bottoms]),
+            Patch(
+                "outlet",
+                "patch",
+                [tuple(v + per_level for v in face) for face in bottoms],
+            ),
+        ]
+        for name, axis in planes:
+            cut = [
+                self._side_face(a, b, per_level)
+                for a, b in edges
+                if section[a][axis - 1] == 0 and section[b][axis - 1] == 0
+            ]
+            patches.append(Patch(name, "symmetryPlane", cut))
+
+        return BlockMesh(
+            vertices=vertices,
+            blocks=blocks,
+            cells=cells,
+            grading=np.ones((len(blocks), 3)),
+            arc_edges=arc_edges,
+            arc_points=arc_points,
+            patches=patches,
+            zones=[0] + [1] * len(sectors),
+            zone_names=self.ZONE_NAMES,
+        )
+
+    @staticmethod
+    def _side_face(a: int, b: int, per_level: int) -> Tuple[int, int, int, int]:
+        """底面邊 a-b 沿高度方向延伸的側面"""
+        return (a, b, b + per_level, a + per_level)
+
+    @staticmethod
+    def _direction(angle: float) -> Tuple[float, float]:
+        """Y-Z 平面上的單位方向（90° 的倍數取精確值）"""
+        rad = math.radians(angle)
+        y, z = math.cos(rad), math.sin(rad)
+        if angle % 90 == 0:
+            y, z = float(round(y)), float(round(z))
+        return y, z
+
+    def _section_point(self, is_outer: bool, angle: float) -> Tuple[float, float]:
+        """對稱模式的截面點位：外圈、內方形角點（45° 方向）或內方形邊中點"""
+        p = self.params
+        y, z = self._direction(angle)
+        if is_outer:
+            return p.radius * y, p.radius * z
+        if angle % 90 == 45:
+            s = p.inner_square_side
+            return math.copysign(s, y), math.copysign(s, z)
+        return p.inner_square_curve * y, p.inner_square_curve * z
+
+    def _section_arc_point(
+        self, is_outer: bool, start: float, end: float
+    ) -> Tuple[float, float]:
+        """
+        截面上 start ~ end 度之間圓弧的中點
+
+        內方形的每一邊為經過兩角點與邊中點的圓弧（同完整圓柱）；
+        邊中點與角點之間的半段取同一圓上的中點。
+        """
+        p = self.params
+        middle = 0.5 * (start + end)
+        if is_outer:
+            y, z = self._direction(middle)
+            return p.radius * y, p.radius * z
+        if end - start == 90:
+            y, z = self._direction(middle)
+            return p.inner_square_curve * y, p.inner_square_curve * z
+
+        # 邊中點在 side 度方向；以該邊的局部座標（u 為法向、v 為切向）計算後旋轉
+        side = start if start % 90 == 0 else end
+        s, sc = p.inner_square_side, p.inner_square_curve
+        center = (2 * s * s - sc * sc) / (2 * (s - sc))
+        radius = sc - center
+        half = 0.5 * math.atan2(s, s - center)
+        u = center + radius * math.cos(half)
+        v = math.copysign(radius * math.sin(half), middle - side)
+        cos, sin = self._direction(side)
+        return u * cos - v * sin, u * sin + v * cos
+
+    def _iter_sections(self, progress: ProgressReporter) -> Iterator[str]:
+        """逐段產生 blockMeshDict 內容"""
+        mesh = self.build_mesh()
+        if self.compact:
+            yield from iter_compact_dict(mesh, progress)
+            return
+
+        yield self.HEADER_TEMPLATE
 
         # 頂點
-        lines.append(self._build_vertices())
+        progress.report(0, "stage_vertices")
+        yield self._build_vertices(mesh)
 
         # 塊
-        lines.append(self._build_blocks())
+        progress.report(20, "stage_blocks")
+        yield self._build_blocks(mesh)
 
         # 邊緣
-        lines.append(self._build_edges())
+        progress.report(40, "stage_edges")
+        yield self._build_edges(mesh)
 
         # 邊界
-        lines.append(self._build_patches())
+        progress.report(60, "stage_boundary")
+        yield self._build_patches(mesh)
 
         # 結尾
-        lines.append("mergePatchPairs\n(\n);\n")
-        lines.append(
+        yield "mergePatchPairs\n(\n);\n"
+        yield (
             "\n// ************************************************************************* //\n"
         )
 
-        return "".join(lines)
+    def _square_angles(self) -> List[float]:
+        """每層內方形點位的角度（完整圓柱為四個角點）"""
+        if self.params.symmetry in self.SECTIONS:
+            return list(self.SECTIONS[self.params.symmetry][0])
+        return list(self._angles)
 
     def _calc_vertex(
         self, is_outer: bool, angle_idx: int, x_pos: float
@@ -160,155 +561,82 @@ scale   1.0;
 
         return (x_pos, y, z)
 
-    def _build_vertices(self) -> str:
+    def _build_vertices(self, mesh: BlockMesh) -> str:
         """構建頂點定義"""
-        p = self.params
         lines = ["vertices\n(\n"]
-
-        # 底面頂點 (b = bottom, x = base_x)
-        lines.append("    // 底面頂點 (x = base_x)\n")
-
-        # 內方形頂點 s0b-s3b
-        for i in range(4):
-            x, y, z = self._calc_vertex(False, i, p.base_x)
-            lines.append(f"    ({x:.6f} {y:.6f} {z:.6f})  // s{i}b = {i}\n")
-
-        # 外圈頂點 r0b-r3b
-        for i in range(4):
-            x, y, z = self._calc_vertex(True, i, p.base_x)
-            lines.append(f"    ({x:.6f} {y:.6f} {z:.6f})  // r{i}b = {i + 4}\n")
-
-        # 頂面頂點 (t = top, x = outlet_x)
-        lines.append("\n    // 頂面頂點 (x = outlet_x)\n")
-
-        # 內方形頂點 s0t-s3t
-        for i in range(4):
-            x, y, z = self._calc_vertex(False, i, p.outlet_x)
-            lines.append(f"    ({x:.6f} {y:.6f} {z:.6f})  // s{i}t = {i + 8}\n")
-
-        # 外圈頂點 r0t-r3t
-        for i in range(4):
-            x, y, z = self._calc_vertex(True, i, p.outlet_x)
-            lines.append(f"    ({x:.6f} {y:.6f} {z:.6f})  // r{i}t = {i + 12}\n")
+        per_level = mesh.n_vertices // 2
+        n_square = len(self._square_angles())
+
+        for index, (x, y, z) in enumerate(mesh.vertices.tolist()):
+            if index == 0:
+                # 底面頂點 (b = bottom)
+                lines.append("    // 底面頂點 (x = base_x)\n")
+            elif index == per_level:
+                # 頂面頂點 (t = top)
+                lines.append("\n    // 頂面頂點 (x = outlet_x)\n")
+
+            # 內方形頂點 s0~、外圈頂點 r0~、中心點 c（僅四分之一域）
+            position = index % per_level
+            kind, number = divmod(position, n_square)
+            label = "src"[kind] + (str(number) if kind < 2 else "")
+            level = "b" if index < per_level else "t"
+            label = f"{label}{level}"
+            lines.append(f"    ({x:.6f} {y:.6f} {z:.6f})  // {label} = {index}\n")
 
         lines.append(");\n\n")
         return "".join(lines)
 
-    def _build_blocks(self) -> str:
+    def _build_blocks(self, mesh: BlockMesh) -> str:
         """構建塊定義"""
-        p = self.params
-        ns = p.n_cells_square
-        ni = p.n_cells_inner
-        nh = p.n_cells_height
-
+        fields = block_fields(mesh, 0, mesh.n_blocks)
         lines = ["blocks\n(\n"]
 
         # 中心方形塊 (block0)
-        lines.append("    // block0: 中心方形\n")
-        lines.append(
-            f"    hex (1 0 3 2 9 8 11 10) square ({ns} {ns} {nh}) simpleGrading (1 1 1)\n"
-        )
+        label = self.SYMMETRY_LABELS.get(self.params.symmetry)
+        if label is None:
+            lines.append("    // block0: 中心方形\n")
+        else:
+            lines.append(f"    // block0: 中心方形（{label}）\n")
+        lines.append(HEX_LINE % tuple(fields[0]))
 
-        # 四個扇形塊 (block1-4)
-        # block1: s0-r0-r3-s3
-        lines.append("\n    // block1-4: 內圓環四個扇形\n")
-        lines.append(
-            f"    hex (0 4 7 3 8 12 15 11) innerCircle ({ni} {ns} {nh}) simpleGrading (1 1 1)\n"
-        )
-        lines.append(
-            f"    hex (3 7 6 2 11 15 14 10) innerCircle ({ni} {ns} {nh}) simpleGrading (1 1 1)\n"
-        )
-        lines.append(
-            f"    hex (2 6 5 1 10 14 13 9) innerCircle ({ni} {ns} {nh}) simpleGrading (1 1 1)\n"
-        )
-        lines.append(
-            f"    hex (1 5 4 0 9 13 12 8) innerCircle ({ni} {ns} {nh}) simpleGrading (1 1 1)\n"
-        )
+        # 扇形塊 (block1-4，對稱模式為其中一部分)
+        n_sectors = len(fields) - 1
+        if label is None:
+            lines.append("\n    // block1-4: 內圓環四個扇形\n")
+        else:
+            lines.append(f"\n    // block1-{n_sectors}: 內圓環 {n_sectors} 個扇形\n")
+        for row in fields[1:]:
+            lines.append(HEX_LINE % tuple(row))
 
         lines.append(");\n\n")
         return "".join(lines)
 
-    def _build_edges(self) -> str:
+    def _build_edges(self, mesh: BlockMesh) -> str:
         """構建邊緣定義（圓弧）"""
-        p = self.params
+        comments = [
+            "    // 底面外圈弧\n",
+            "\n    // 頂面外圈弧\n",
+            "\n    // 底面內方形弧\n",
+            "\n    // 頂面內方形弧\n",
+        ]
         lines = ["edges\n(\n"]
 
-        # 底面圓弧
-        lines.append("    // 底面外圈弧\n")
-        for i in range(4):
-            v1 = 4 + (i + 1) % 4
-            v2 = 4 + i
-            x, y, z = self._calc_edge_point(True, i, p.base_x)
-            lines.append(f"    arc {v1} {v2} ({x:.6f} {y:.6f} {z:.6f})\n")
-
-        # 頂面圓弧
-        lines.append("\n    // 頂面外圈弧\n")
-        for i in range(4):
-            v1 = 12 + (i + 1) % 4
-            v2 = 12 + i
-            x, y, z = self._calc_edge_point(True, i, p.outlet_x)
-            lines.append(f"    arc {v1} {v2} ({x:.6f} {y:.6f} {z:.6f})\n")
-
-        # 底面內方形弧（輕微彎曲）
-        lines.append("\n    // 底面內方形弧\n")
-        for i in range(4):
-            v1 = (i + 1) % 4
-            v2 = i
-            x, y, z = self._calc_edge_point(False, i, p.base_x)
-            lines.append(f"    arc {v1} {v2} ({x:.6f} {y:.6f} {z:.6f})\n")
-
-        # 頂面內方形弧
-        lines.append("\n    // 頂面內方形弧\n")
-        for i in range(4):
-            v1 = 8 + (i + 1) % 4
-            v2 = 8 + i
-            x, y, z = self._calc_edge_point(False, i, p.outlet_x)
+        arcs = zip(mesh.arc_edges.tolist(), mesh.arc_points.tolist())
+        per_group = len(mesh.arc_edges) // len(comments)
+        for index, ((v1, v2), (x, y, z)) in enumerate(arcs):
+            if index % per_group == 0:
+                lines.append(comments[index // per_group])
             lines.append(f"    arc {v1} {v2} ({x:.6f} {y:.6f} {z:.6f})\n")
 
         lines.append(");\n\n")
         return "".join(lines)
 
-    def _build_patches(self) -> str:
+    def _build_patches(self, mesh: BlockMesh) -> str:
         """構建邊界 patch 定義"""
-        lines = ["boundary\n(\n"]
+        blocks = []
+        for patch in mesh.patches:
+            head, tail = patch_text(patch.name, patch.type)
+            faces = "".join(FACE_LINE % tuple(face) for face in patch.faces.tolist())
+            blocks.append(head + faces + tail)
 
-        # 外壁 (Enclosure)
-        lines.append(
-            "    Enclosure\n    {\n        type patch;\n        faces\n        (\n"
-        )
-        for i in range(4):
-            v1 = 4 + i
-            v2 = 4 + (i + 1) % 4
-            v3 = 12 + (i + 1) % 4
-            v4 = 12 + i
-            lines.append(f"            ({v1} {v2} {v3} {v4})\n")
-        lines.append("        );\n    }\n\n")
-
-        # 入口 (inlet) - 底面
-        lines.append(
-            "    inlet\n    {\n        type patch;\n        faces\n        (\n"
-        )
-        # 中心方形
-        lines.append("            (0 1 2 3)\n")
-        # 四個扇形
-        lines.append("            (0 3 7 4)\n")
-        lines.append("            (3 2 6 7)\n")
-        lines.append("            (2 1 5 6)\n")
-        lines.append("            (1 0 4 5)\n")
-        lines.append("        );\n    }\n\n")
-
-        # 出口 (outlet) - 頂面
-        lines.append(
-            "    outlet\n    {\n        type patch;\n        faces\n        (\n"
-        )
-        # 中心方形
-        lines.append("            (8 11 10 9)\n")
-        # 四個扇形
-        lines.append("            (8 12 15 11)\n")
-        lines.append("            (11 15 14 10)\n")
-        lines.append("            (10 14 13 9)\n")
-        lines.append("            (9 13 12 8)\n")
-        lines.append("        );\n    }\n")
-
-        lines.append(");\n\n")
-        return "".join(lines)
+        return "boundary\n(\n" + "\n".join(blocks) + ");\n\n"
@@ -10,14 +10,24 @@
 
 from __future__ import annotations
 
+import shutil
+import tempfile
+import weakref
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Tuple, Optional
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
-from numpy.typing import NDArray
-from scipy.interpolate import interp1d
+from numpy.typing import DTypeLike, NDArray
+
+from ..models.point_cloud import PointCloud
+from .ingest import iter_point_chunks, read_excel_points, read_text_points
+from .layer_sampler import LayerSampler
+from .progress import ProgressReporter
+
+if TYPE_CHECKING:
+    from .point_cache import PointCache
 
 
 @dataclass
@@ -44,6 +54,19 @@ class DataStatistics:
             "avg_x": self.avg_x,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DataStatistics":
+        """由字典建立"""
+        return cls(
+            total_points=int(data["total_points"]),
+            inner_points=int(data["inner_points"]),
+            outer_points=int(data["outer_points"]),
+            x_range=tuple(data["x_range"]),
+            y_range=tuple(data["y_range"]),
+            z_range=tuple(data["z_range"]),
+            avg_x=float(data["avg_x"]),
+        )
+
 
 class DataReader:
     """
@@ -57,24 +80,35 @@ class DataReader:
     資料格式要求：
     - 三欄資料：X, Y, Z 座標
     - 無標題行（或自動偵測）
+
+    讀取後的點位以 PointCloud 保存：依 Z 排序並將內曲線排在前段、
+    外曲線排在後段，inner_points / outer_points 為共用記憶體的視圖。
     """
 
     SUPPORTED_EXTENSIONS = {".xlsx", ".xls", ".csv", ".txt"}
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        cache: Optional["PointCache"] = None,
+        dtype: DTypeLike = np.float64,
+    ):
         """
         初始化資料讀取器
 
         Args:
             file_path: 資料檔案路徑
+            cache: 點位解析快取（可選），檔案未變更時直接載入解析結果
+            dtype: 點位儲存型別（np.float32 可減半記憶體用量）
         """
         self.file_path = Path(file_path)
-        self._points: Optional[NDArray] = None
-        self._inner_points: Optional[NDArray] = None
-        self._outer_points: Optional[NDArray] = None
+        self._cache = cache
+        self._dtype = np.dtype(dtype)
+        self._points: Optional[PointCloud] = None
+        self._inner_points: Optional[PointCloud] = None
+        self._outer_points: Optional[PointCloud] = None
         self._statistics: Optional[DataStatistics] = None
-        self._inner_interp: Optional[Tuple] = None
-        self._outer_interp: Optional[Tuple] = None
+        self._sampler: Optional[LayerSampler] = None
 
     @classmethod
     def get_file_filter(cls) -> str:
@@ -93,45 +127,133 @@ class DataReader:
         ext = Path(file_path).suffix.lower()
         return ext in cls.SUPPORTED_EXTENSIONS
 
-    def read(self) -> NDArray:
+    def read(self, progress: Optional[ProgressReporter] = None) -> PointCloud:
         """
         讀取資料檔案
 
+        Args:
+            progress: 進度回報器（可選），於各階段之間回報進度並檢查取消，
+                取消時拋出 OperationCancelled
+
         Returns:
-            NDArray: 形狀為 (N, 3) 的座標陣列
+            PointCloud: 依 Z 排序、內曲線在前外曲線在後的點雲
         """
+        if progress is None:
+            progress = ProgressReporter()
+
         if not self.file_path.exists():
             raise FileNotFoundError(f"檔案不存在: {self.file_path}")
 
+        cache_key = None
+        if self._cache is not None:
+            progress.report(0, "stage_cache_lookup")
+            cache_key = self._cache.key_for(self.file_path, self._dtype)
+            if self._load_cached(cache_key):
+                progress.report(100, "stage_done")
+                return self._points
+
+        progress.report(10, "stage_parsing")
         ext = self.file_path.suffix.lower()
 
         if ext in (".xlsx", ".xls"):
-            self._points = self._read_excel()
+            points = self._read_excel()
         elif ext == ".csv":
-            self._points = self._read_csv()
+            points = self._read_csv()
         elif ext == ".txt":
-            self._points = self._read_txt()
+            points = self._read_txt()
         else:
             raise ValueError(f"不支援的檔案格式: {ext}")
 
-        self._process_points()
+        progress.report(70, "stage_processing")
+        self._process_points(points)
+
+        if cache_key is not None:
+            progress.report(90, "stage_caching")
+            try:
+                self._cache.store(
+                    cache_key,
+                    self._points,
+                    len(self._inner_points),
+                    self._statistics,
+                )
+            except OSError:
+                # 快取寫入失敗不影響讀取結果
+                pass
+
+        progress.report(100, "stage_done")
         return self._points
 
+    def read_chunked(
+        self, work_dir: Optional[str] = None, chunk_rows: int = 1_000_000
+    ) -> PointCloud:
+        """
+        分塊讀取超出記憶體的資料檔案
+
+        統計資訊以線上方式計算，內外曲線以外部合併排序寫入記憶體映射的
+        (3, N) 欄位檔案；之後 sample_layers() 直接在記憶體映射結果上取樣。
+
+        Args:
+            work_dir: 暫存 .npy 檔案的目錄（預設建立暫存目錄，讀取器釋放時刪除）
+            chunk_rows: 每塊列數
+
+        Returns:
+            PointCloud: 記憶體映射的點雲（內曲線在前、外曲線在後）
+        """
+        from .out_of_core import chunked_ingest
+
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"檔案不存在: {self.file_path}")
+
+        if work_dir is None:
+            work_dir = tempfile.mkdtemp(prefix="blockmesh-studio-")
+            weakref.finalize(self, shutil.rmtree, work_dir, True)
+
+        result = chunked_ingest(
+            lambda: iter_point_chunks(self.file_path, chunk_rows),
+            work_dir,
+            chunk_rows,
+            self._dtype,
+        )
+
+        self._set_points(result.points, result.n_inner)
+        self._statistics = result.statistics
+        return self._points
+
+    def _load_cached(self, key: str) -> bool:
+        """由快取載入解析結果，命中時回傳 True"""
+        cached = self._cache.load(key)
+        if cached is None:
+            return False
+
+        self._set_points(cached.points, cached.n_inner)
+        self._statistics = cached.statistics
+        return True
+
+    def _set_points(self, points: PointCloud, n_inner: int) -> None:
+        """設定點雲，內外曲線為前後兩段的視圖"""
+        self._points = points
+        self._inner_points = points.slice(0, n_inner)
+        self._outer_points = points.slice(n_inner, len(points))
+
+        # 取樣器於第一次取樣時建立
+        self._sampler = None
+
     def _read_excel(self) -> NDArray:
-        """讀取 Excel 檔案"""
+        """讀取 Excel 檔案（.xlsx 以唯讀模式串流讀取）"""
+        if self.file_path.suffix.lower() == ".xlsx":
+            return read_excel_points(self.file_path)
+
+        # .xls 不支援 openpyxl，仍使用 pandas
         df = pd.read_excel(self.file_path, header=None)
         return self._extract_coordinates(df)
 
     def _read_csv(self) -> NDArray:
-        """讀取 CSV 檔案"""
-        # 嘗試自動偵測分隔符
-        df = pd.read_csv(self.file_path, header=None, sep=None, engine="python")
-        return self._extract_coordinates(df)
+        """讀取 CSV 檔案（自動偵測分隔符、註解與標題行）"""
+        return read_text_points(self.file_path)
 
     def _read_txt(self) -> NDArray:
         """讀取 TXT 檔案（空格/Tab 分隔）"""
-        df = pd.read_csv(self.file_path, header=None, sep=r"\s+", engine="python")
-        return self._extract_coordinates(df)
+        return read_text_points(self.file_path, whitespace_only=True)
 
     def _extract_coordinates(self, df: pd.DataFrame) -> NDArray:
         """從 DataFrame 中提取座標"""
@@ -151,77 +273,37 @@ class DataReader:
         points = df.iloc[:, :3].astype(float).values
         return points
 
-    def _process_points(self) -> None:
-        """處理點位資料：排序並分離內外曲線"""
-        if self._points is None:
-            return
+    def _process_points(self, points: NDArray) -> None:
+        """處理點位資料：依 Z 排序並將內外曲線分為前後兩段"""
+        cloud = PointCloud.from_array(points, self._dtype)
 
-        # 按 Z 座標排序
-        sorted_indices = self._points[:, 2].argsort()
-        self._points = self._points[sorted_indices]
+        # 已依 Z 遞增的資料不需排序
+        order = None if cloud.is_sorted_z() else np.argsort(cloud.z, kind="stable")
 
         # 計算平均 X 值用於分離內外曲線
-        avg_x = np.mean(self._points[:, 0])
+        avg_x = float(np.mean(cloud.x, dtype=np.float64))
+        is_inner = (cloud.x if order is None else cloud.x[order]) < avg_x
+        n_inner = int(np.count_nonzero(is_inner))
 
-        # 分離內外曲線
-        self._inner_points = self._points[self._points[:, 0] < avg_x]
-        self._outer_points = self._points[self._points[:, 0] >= avg_x]
+        # 以一次索引完成排序與分段（已分段時不需重排）
+        if order is not None or not is_inner[:n_inner].all():
+            partition = np.concatenate(
+                [np.flatnonzero(is_inner), np.flatnonzero(~is_inner)]
+            )
+            cloud = cloud.take(partition if order is None else order[partition])
 
-        # 確保按 Z 排序
-        self._inner_points = self._inner_points[self._inner_points[:, 2].argsort()]
-        self._outer_points = self._outer_points[self._outer_points[:, 2].argsort()]
+        self._set_points(cloud, n_inner)
 
         # 計算統計資訊
+        minimum, maximum = cloud.bounds()
         self._statistics = DataStatistics(
-            total_points=len(self._points),
-            inner_points=len(self._inner_points),
-            outer_points=len(self._outer_points),
-            x_range=(float(self._points[:, 0].min()), float(self._points[:, 0].max())),
-            y_range=(float(self._points[:, 1].min()), float(self._points[:, 1].max())),
-            z_range=(float(self._points[:, 2].min()), float(self._points[:, 2].max())),
-            avg_x=float(avg_x),
-        )
-
-        # 建立插值函數
-        self._create_interpolators()
-
-    def _create_interpolators(self) -> None:
-        """建立插值函數"""
-        if self._inner_points is None or self._outer_points is None:
-            return
-
-        # 內曲線插值
-        z_inner = self._inner_points[:, 2]
-        self._inner_interp = (
-            interp1d(
-                z_inner,
-                self._inner_points[:, 0],
-                kind="linear",
-                fill_value="extrapolate",
-            ),
-            interp1d(
-                z_inner,
-                self._inner_points[:, 1],
-                kind="linear",
-                fill_value="extrapolate",
-            ),
-        )
-
-        # 外曲線插值
-        z_outer = self._outer_points[:, 2]
-        self._outer_interp = (
-            interp1d(
-                z_outer,
-                self._outer_points[:, 0],
-                kind="linear",
-                fill_value="extrapolate",
-            ),
-            interp1d(
-                z_outer,
-                self._outer_points[:, 1],
-                kind="linear",
-                fill_value="extrapolate",
-            ),
+            total_points=len(cloud),
+            inner_points=n_inner,
+            outer_points=len(cloud) - n_inner,
+            x_range=(float(minimum[0]), float(maximum[0])),
+            y_range=(float(minimum[1]), float(maximum[1])),
+            z_range=(float(minimum[2]), float(maximum[2])),
+            avg_x=avg_x,
         )
 
     @property
@@ -230,54 +312,47 @@ class DataReader:
         return self._statistics
 
     @property
-    def inner_points(self) -> Optional[NDArray]:
-        """取得內曲線點位"""
+    def points(self) -> Optional[PointCloud]:
+        """取得全部點位（內曲線在前、外曲線在後）"""
+        return self._points
+
+    @property
+    def inner_points(self) -> Optional[PointCloud]:
+        """取得內曲線點位（依 Z 排序）"""
         return self._inner_points
 
     @property
-    def outer_points(self) -> Optional[NDArray]:
-        """取得外曲線點位"""
+    def outer_points(self) -> Optional[PointCloud]:
+        """取得外曲線點位（依 Z 排序）"""
         return self._outer_points
 
-    def sample_layers(self, num_layers: int) -> Tuple[NDArray, NDArray]:
+    def sample_layers(
+        self, num_layers: int, tolerance: float = 0.0, edge_points: int = 0
+    ) -> Tuple[PointCloud, PointCloud]:
         """
         在指定層數上取樣內外曲線
 
+        結果依層數快取，重複取樣相同層數時直接回傳（唯讀點雲）。
+        tolerance 大於 0 時改為自適應取樣，num_layers 為層數上限，
+        實際層數為 (回傳點雲的長度 - 1) // (edge_points + 1) + 1。
+
         Args:
-            num_layers: 取樣層數
+            num_layers: 取樣層數（自適應取樣時為上限）
+            tolerance: 自適應取樣的容許偏差（0 為均勻取樣）
+            edge_points: 相鄰兩層之間的曲線邊中間點數（0 為直線邊）
 
         Returns:
-            Tuple[NDArray, NDArray]: (內曲線取樣, 外曲線取樣)
+            Tuple[PointCloud, PointCloud]: (內曲線取樣, 外曲線取樣)
         """
-        if self._inner_interp is None or self._outer_interp is None:
+        if self._inner_points is None or self._outer_points is None:
             raise RuntimeError("請先呼叫 read() 讀取資料")
 
-        # 決定 Z 範圍
-        z_min = max(self._inner_points[:, 2].min(), self._outer_points[:, 2].min())
-        z_max = min(self._inner_points[:, 2].max(), self._outer_points[:, 2].max())
-
-        # 均勻取樣
-        z_samples = np.linspace(z_min, z_max, num_layers)
-
-        # 內曲線取樣
-        inner_samples = np.column_stack(
-            [
-                self._inner_interp[0](z_samples),
-                self._inner_interp[1](z_samples),
-                z_samples,
-            ]
-        )
-
-        # 外曲線取樣
-        outer_samples = np.column_stack(
-            [
-                self._outer_interp[0](z_samples),
-                self._outer_interp[1](z_samples),
-                z_samples,
-            ]
-        )
+        if self._sampler is None:
+            self._sampler = LayerSampler(self._inner_points, self._outer_points)
 
-        return inner_samples, outer_samples
+        if tolerance > 0:
+            return self._sampler.sample_adaptive(tolerance, num_layers, edge_points)
+        return self._sampler.sample(num_layers, edge_points)
 
 
 # 保持向後相容
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+blockMeshDict 文字輸出模組
+
+提供以模板分批格式化多列文字的共用函數，以及走訪 BlockMesh 中間表示
+產生 compact 格式 blockMeshDict 的通用寫出器；各生成器的 annotated 格式
+同樣由 BlockMesh 的陣列取值，只是加上各自的註解排版。
+"""
+
+from typing import Callable, Iterable, Iterator, List, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..models.block_mesh import BlockMesh
+from .grading import grading_text
+from .output_profile import compact_floats
+from .progress import ProgressReporter
+
+# 每次批次格式化的最大列數，同時決定進度回報與取消檢查的間隔
+EMIT_CHUNK_ROWS = 512
+
+# compact 格式的檔案頭（無註解）
+COMPACT_HEADER = """FoamFile
+{
+    version     2.0;
+    format      ascii;
+    class       dictionary;
+    object      blockMeshDict;
+}
+
+scale %s;
+
+"""
+
+# 檔案結尾
+FOOTER = ");\n\nmergePatchPairs\n(\n);\n"
+
+# 各列的格式模板
+VERTEX_LINE = "    (%s %s %s)\n"
+ARC_LINE = "    arc %s %s (%s %s %s)\n"
+FACE_LINE = "            (%s %s %s %s)\n"
+
+# hex 塊：8 個頂點、cellZone（含前置空白，無則為空字串）、網格數、漸變
+HEX_LINE = "    hex (%s %s %s %s %s %s %s %s)%s (%s %s %s) simpleGrading (%s %s %s)\n"
+HEX_FIELDS = 15
+
+
+def format_values(fmt: str, values: Iterable) -> List[str]:
+    """以單一 % 運算將每個值格式化為字串"""
+    values = tuple(values)
+    if not values:
+        return []
+    return ("\0".join([fmt] * len(values)) % values).split("\0")
+
+
+def int_fields(values: NDArray) -> NDArray:
+    """
+    將整數陣列格式化為同形狀的字串物件陣列
+
+    同一批的頂點索引通常集中在一小段範圍且重複出現（同一頂點屬於多個塊、面），
+    範圍不大時先格式化整段範圍再查表，每個值只格式化一次。
+    """
+    if values.size == 0:
+        return np.empty(values.shape, dtype=object)
+    low = int(values.min())
+    span = int(values.max()) - low + 1
+    if span > 2 * values.size:
+        texts = list(map(str, values.ravel().tolist()))
+        return np.array(texts, dtype=object).reshape(values.shape)
+    table = np.array(list(map(str, range(low, low + span))), dtype=object)
+    return table[values - low]
+
+
+def float_fields(values: NDArray, compact: bool = True) -> NDArray:
+    """
+    將浮點數陣列格式化為同形狀的字串物件陣列
+
+    Args:
+        values: 浮點數陣列
+        compact: True 為最短表示，False 為固定小數 6 位
+
+    Returns:
+        NDArray: 字串物件陣列
+    """
+    flat = values.ravel().tolist()
+    texts = compact_floats(flat) if compact else format_values("%.6f", flat)
+    return np.array(texts, dtype=object).reshape(values.shape)
+
+
+def block_fields(mesh: BlockMesh, start: int, stop: int) -> NDArray:
+    """
+    將第 start ~ stop-1 個塊格式化為 HEX_LINE 的欄位
+
+    網格數與漸變通常只有少數幾種組合，每種組合只格式化一次。
+
+    Args:
+        mesh: 中間表示
+        start: 起始塊索引
+        stop: 結束塊索引（不含）
+
+    Returns:
+        NDArray: 形狀 (stop - start, HEX_FIELDS) 的字串物件陣列
+    """
+    fields = np.empty((stop - start, HEX_FIELDS), dtype=object)
+    fields[:, :8] = int_fields(mesh.blocks[start:stop])
+
+    zone_names = np.array([""] + [f" {name}" for name in mesh.zone_names], dtype=object)
+    fields[:, 8] = zone_names[mesh.zones[start:stop] + 1]
+
+    specs = np.hstack([mesh.cells[start:stop], mesh.grading[start:stop]])
+    if len(specs) and np.all(specs == specs[0]):
+        unique, inverse = specs[:1], np.zeros(len(specs), dtype=np.intp)
+    else:
+        unique, inverse = np.unique(specs, axis=0, return_inverse=True)
+    texts = np.array(
+        [
+            [str(int(n)) for n in spec[:3]] + compact_floats(spec[3:].tolist())
+            for spec in unique
+        ],
+        dtype=object,
+    ).reshape(len(unique), 6)
+    fields[:, 9:] = texts[inverse.ravel()]
+
+    # 多段漸變取代該方向的擴展比
+    for axis, sections in mesh.multi_grading.items():
+        fields[:, 12 + axis] = grading_text(sections)
+    return fields
+
+
+def iter_rows(
+    template: str,
+    order: Sequence[int],
+    make_fields: Callable[[int, int], NDArray],
+    n_rows: int,
+    progress: ProgressReporter,
+    start: int,
+    end: int,
+    stage: str,
+) -> Iterator[str]:
+    """
+    以模板分批產生多列文字
+
+    每批最多 EMIT_CHUNK_ROWS 列，只格式化該批所需的欄位，
+    依 order 取出已格式化的字串填入模板的 %s；記憶體用量只與批次大小有關。
+
+    Args:
+        template: 單列的 %s 模板
+        order: 模板佔位符依序對應的欄位索引
+        make_fields: 產生第 lo ~ hi-1 列欄位的函數
+        n_rows: 總列數
+        progress: 進度回報器
+        start: 階段起始百分比
+        end: 階段結束百分比
+        stage: 階段說明
+
+    Yields:
+        str: 每批的文字
+    """
+    # 模板拆為字面片段，與欄位交錯後以一次 join 組合（比 % 格式化快）
+    literals = template.split("%s")
+    n_values = len(literals) - 1
+    order = list(order)
+    if n_values != len(order):
+        raise ValueError(f"模板有 {n_values} 個佔位符，但欄位順序有 {len(order)} 個")
+
+    for lo in range(0, n_rows, EMIT_CHUNK_ROWS):
+        progress.report_step(start, end, lo, n_rows, stage)
+        hi = min(lo + EMIT_CHUNK_ROWS, n_rows)
+        parts = np.empty((hi - lo, 2 * n_values + 1), dtype=object)
+        parts[:, 0::2] = literals
+        parts[:, 1::2] = make_fields(lo, hi)[:, order]
+        yield "".join(parts.ravel().tolist())
+
+
+def curve_template(mesh: BlockMesh) -> str:
+    """曲線邊單列的 %s 模板：類型、兩端頂點、K 個中間點"""
+    n_points = mesh.curve_points.shape[1]
+    points = " ".join(["(%s %s %s)"] * n_points)
+    return f"    {mesh.curve_type} %s %s ({points})\n"
+
+
+def iter_curve_edges(
+    mesh: BlockMesh,
+    progress: ProgressReporter,
+    start: int,
+    end: int,
+    compact: bool = True,
+) -> Iterator[str]:
+    """
+    分批產生曲線邊（spline、polyLine）的各列
+
+    Args:
+        mesh: 中間表示
+        progress: 進度回報器
+        start: 階段起始百分比
+        end: 階段結束百分比
+        compact: True 為最短表示，False 為固定小數 6 位
+
+    Yields:
+        str: 每批的文字
+    """
+    n_points = mesh.curve_points.shape[1]
+
+    def curve_fields(lo: int, hi: int) -> NDArray:
+        points = mesh.curve_points[lo:hi].reshape(hi - lo, 3 * n_points)
+        return np.hstack(
+            [int_fields(mesh.curve_edges[lo:hi]), float_fields(points, compact)]
+        )
+
+    yield from iter_rows(
+        curve_template(mesh),
+        range(2 + 3 * n_points),
+        curve_fields,
+        len(mesh.curve_edges),
+        progress,
+        start,
+        end,
+        "stage_edges",
+    )
+
+
+def patch_text(name: str, patch_type: str) -> tuple[str, str]:
+    """
+    patch 區塊的開頭與結尾文字
+
+    Args:
+        name: patch 名稱
+        patch_type: patch 類型
+
+    Returns:
+        tuple[str, str]: (開頭, 結尾)
+    """
+    head = f"    {name}\n    {{\n        type {patch_type};\n        faces\n        (\n"
+    return head, "        );\n    }\n"
+
+
+def iter_compact_dict(mesh: BlockMesh, progress: ProgressReporter) -> Iterator[str]:
+    """
+    走訪中間表示，逐段產生 compact 格式的 blockMeshDict
+
+    Args:
+        mesh: 中間表示
+        progress: 進度回報器
+
+    Yields:
+        str: 文字區塊
+    """
+    yield COMPACT_HEADER % compact_floats([mesh.scale])[0]
+    yield from iter_dict_body(mesh, progress)
+
+
+def iter_dict_body(
+    mesh: BlockMesh, progress: ProgressReporter, compact: bool = True
+) -> Iterator[str]:
+    """
+    走訪中間表示，逐段產生檔案頭之後的各區段（vertices ~ mergePatchPairs）
+
+    Args:
+        mesh: 中間表示
+        progress: 進度回報器
+        compact: True 為最短表示，False 為固定小數 6 位
+
+    Yields:
+        str: 文字區塊
+    """
+    yield "vertices\n(\n"
+    yield from iter_rows(
+        VERTEX_LINE,
+        range(3),
+        lambda lo, hi: float_fields(mesh.vertices[lo:hi], compact),
+        mesh.n_vertices,
+        progress,
+        0,
+        30,
+        "stage_vertices",
+    )
+    yield ");\n\n"
+
+    yield "blocks\n(\n"
+    yield from iter_rows(
+        HEX_LINE,
+        range(HEX_FIELDS),
+        lambda lo, hi: block_fields(mesh, lo, hi),
+        mesh.n_blocks,
+        progress,
+        30,
+        45,
+        "stage_blocks",
+    )
+    yield ");\n\n"
+
+    def arc_fields(lo: int, hi: int) -> NDArray:
+        return np.hstack(
+            [
+                int_fields(mesh.arc_edges[lo:hi]),
+                float_fields(mesh.arc_points[lo:hi], compact),
+            ]
+        )
+
+    # 有曲線邊時圓弧佔 45~70%、曲線邊佔 70~85%
+    arcs_end = 70 if len(mesh.curve_edges) else 85
+    yield "edges\n(\n"
+    yield from iter_rows(
+        ARC_LINE,
+        range(5),
+        arc_fields,
+        len(mesh.arc_edges),
+        progress,
+        45,
+        arcs_end,
+        "stage_edges",
+    )
+    yield from iter_curve_edges(mesh, progress, arcs_end, 85, compact)
+    yield ");\n\n"
+
+    progress.report(85, "stage_boundary")
+    yield "boundary\n(\n"
+    n_patches = len(mesh.patches)
+    for index, patch in enumerate(mesh.patches):
+        head, tail = patch_text(patch.name, patch.type)
+        yield head
+        yield from iter_rows(
+            FACE_LINE,
+            range(4),
+            lambda lo, hi, faces=patch.faces: int_fields(faces[lo:hi]),
+            len(patch.faces),
+            progress,
+            85 + 15 * index // n_patches,
+            85 + 15 * (index + 1) // n_patches,
+            "stage_boundary",
+        )
+        yield tail
+    yield FOOTER
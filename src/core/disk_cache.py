@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+磁碟快取基礎模組
+
+以目錄為單位儲存快取項目，依總大小上限做 LRU 淘汰：
+- 每個項目為 <cache_dir>/<key>/，內含 meta.json 與資料檔
+- meta.json 的修改時間即為最後使用時間
+- 寫入先放在暫存目錄，完成後再改名，避免留下不完整的項目
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import uuid
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+META_FILE = "meta.json"
+
+# 預設快取大小上限 (2 GiB)
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def default_cache_dir() -> Path:
+    """取得使用者快取目錄"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "blockmesh-studio"
+
+
+def _dir_size(path: Path) -> int:
+    """計算目錄內檔案總大小"""
+    return sum(p.stat().st_size for p in path.iterdir() if p.is_file())
+
+
+class DiskCache:
+    """以目錄為項目、依大小上限 LRU 淘汰的磁碟快取"""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        初始化快取
+
+        Args:
+            cache_dir: 快取目錄
+            max_bytes: 快取總大小上限（位元組）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def entry_dir(self, key: str) -> Path:
+        """取得項目目錄"""
+        return self.cache_dir / key
+
+    def read_meta(self, key: str) -> Optional[dict]:
+        """讀取項目的 meta.json，並更新最後使用時間；不存在時回傳 None"""
+        meta_path = self.entry_dir(key) / META_FILE
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def new_staging_dir(self) -> Path:
+        """建立寫入用的暫存目錄"""
+        staging = self.cache_dir / f".tmp-{uuid.uuid4().hex}"
+        staging.mkdir(parents=True)
+        return staging
+
+    def commit(self, key: str, staging: Path, meta: dict) -> Path:
+        """
+        將暫存目錄提交為快取項目並執行淘汰
+
+        Args:
+            key: 項目鍵值
+            staging: new_staging_dir() 建立並寫好資料的目錄
+            meta: 寫入 meta.json 的內容
+
+        Returns:
+            Path: 項目目錄
+        """
+        (staging / META_FILE).write_text(
+            json.dumps(meta, ensure_ascii=False), encoding="utf-8"
+        )
+        target = self.entry_dir(key)
+        try:
+            os.replace(staging, target)
+        except OSError:
+            # 目錄已存在（損壞的舊項目或其他程序剛寫入）：刪除後重試一次
+            shutil.rmtree(target, ignore_errors=True)
+            try:
+                os.replace(staging, target)
+            except OSError:
+                shutil.rmtree(staging, ignore_errors=True)
+        self.evict(keep=key)
+        return target
+
+    def entries(self) -> List[Tuple[float, int, Path]]:
+        """列出所有項目 (最後使用時間, 大小, 目錄)，由舊到新"""
+        if not self.cache_dir.is_dir():
+            return []
+
+        result = []
+        for entry in self.cache_dir.iterdir():
+            meta_path = entry / META_FILE
+            if entry.name.startswith(".") or not meta_path.is_file():
+                continue
+            try:
+                result.append((meta_path.stat().st_mtime, _dir_size(entry), entry))
+            except OSError:
+                continue
+        result.sort(key=lambda item: item[0])
+        return result
+
+    def total_bytes(self) -> int:
+        """快取總大小"""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        淘汰最久未使用的項目直到總大小不超過上限
+
+        Args:
+            keep: 不淘汰的項目鍵值（通常為剛寫入的項目）
+
+        Returns:
+            int: 淘汰的項目數
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            # Windows 下仍被映射的檔案無法刪除，略過即可
+            shutil.rmtree(entry, ignore_errors=True)
+            if not entry.exists():
+                total -= size
+                removed += 1
+        return removed
+
+    def remove(self, key: str) -> None:
+        """刪除單一項目（不存在時忽略）"""
+        shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+
+    def clear(self) -> None:
+        """清除所有項目"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
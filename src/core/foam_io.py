@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+"""
+OpenFOAM 串列檔案讀寫模組
+
+寫出 polyMesh 與場檔案常用的 labelList、scalarField、vectorField、faceList：
+- ascii：以模板分批格式化（同 blockMeshDict 的寫出方式）
+- binary：與 OpenFOAM 的 `format binary;` 相同，長度後接 ( 原始位元組 )，
+  直接輸出陣列的 tobytes()，不做逐元素的文字格式化
+
+讀取函數可還原上述兩種格式，供測試與輸出驗證使用。
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..models.poly_mesh import PolyMesh, PolyPatch
+from .dict_writer import float_fields, int_fields, iter_rows
+from .output_writer import atomic_output, write_chunks
+from .progress import ProgressReporter
+
+FORMAT_ASCII = "ascii"
+FORMAT_BINARY = "binary"
+FOAM_FORMATS = (FORMAT_ASCII, FORMAT_BINARY)
+
+# OpenFOAM 預設編譯的 label（32 位元）與 scalar（64 位元），小端序
+LABEL_DTYPE = np.dtype("<i4")
+SCALAR_DTYPE = np.dtype("<f8")
+FOAM_ARCH = "LSB;label=32;scalar=64"
+
+# 串列類別與每列的值數
+LIST_COLUMNS = {"labelList": 1, "scalarField": 1, "vectorField": 3}
+
+FOAM_HEADER = """FoamFile
+{
+    version     2.0;
+    format      %s;
+    arch        "%s";
+    class       %s;%s
+    object      %s;
+}
+
+"""
+
+_HEADER_ENTRY = re.compile(rb'(\w+)\s+("[^"]*"|[^;]*);')
+_COUNT = re.compile(rb"\s*(\d+)\s*\(")
+_PATCH = re.compile(r"(\w+)\s*\{([^}]*)\}")
+
+# ascii 串列內的括號以空白取代（faceList 的 4(a b c d) 點數與索引相連）
+_STRIP_PARENS = bytes.maketrans(b"()", b"  ")
+
+
+def check_format(fmt: str) -> str:
+    """
+    檢查 OpenFOAM 檔案格式名稱
+
+    Args:
+        fmt: 格式名稱
+
+    Returns:
+        str: 原格式名稱
+
+    Raises:
+        ValueError: 不支援的格式
+    """
+    if fmt not in FOAM_FORMATS:
+        available = ", ".join(FOAM_FORMATS)
+        raise ValueError(f"不支援的 OpenFOAM 檔案格式: {fmt}（可用: {available}）")
+    return fmt
+
+
+def foam_header(
+    fmt: str,
+    cls: str,
+    obj: str,
+    location: Optional[str] = None,
+    note: Optional[str] = None,
+) -> str:
+    """
+    FoamFile 檔案頭
+
+    Args:
+        fmt: "ascii" 或 "binary"
+        cls: class 欄位
+        obj: object 欄位（檔名）
+        location: location 欄位（可選）
+        note: note 欄位（可選）
+
+    Returns:
+        str: 檔案頭
+    """
+    extra = ""
+    if note:
+        extra += f'\n    note        "{note}";'
+    if location:
+        extra += f'\n    location    "{location}";'
+    return FOAM_HEADER % (fmt, FOAM_ARCH, cls, extra, obj)
+
+
+def list_class(values: NDArray) -> str:
+    """
+    依陣列形狀與型別判斷串列類別
+
+    Args:
+        values: (N,) 整數、(N,) 浮點數或 (N, 3) 浮點數陣列
+
+    Returns:
+        str: "labelList"、"scalarField" 或 "vectorField"
+
+    Raises:
+        ValueError: 不支援的形狀或型別
+    """
+    if values.ndim == 1 and np.issubdtype(values.dtype, np.integer):
+        return "labelList"
+    if np.issubdtype(values.dtype, np.floating):
+        if values.ndim == 1:
+            return "scalarField"
+        if values.ndim == 2 and values.shape[1] == 3:
+            return "vectorField"
+    raise ValueError(f"不支援的串列形狀或型別: {values.shape} {values.dtype}")
+
+
+def _binary_list(values: NDArray, dtype: np.dtype) -> Iterator[bytes]:
+    """binary 串列：長度、換行、( 原始位元組 )"""
+    yield f"{len(values)}\n(".encode("ascii")
+    yield np.ascontiguousarray(values, dtype=dtype).tobytes()
+    yield b")\n"
+
+
+def _ascii_list(
+    template: str,
+    make_fields: Callable[[int, int], NDArray],
+    n_rows: int,
+    progress: ProgressReporter,
+    span: Tuple[int, int],
+    stage: str,
+) -> Iterator[bytes]:
+    """ascii 串列：每列依模板分批格式化"""
+    yield f"{n_rows}\n(\n".encode("ascii")
+    columns = template.count("%s")
+    rows = iter_rows(
+        template, range(columns), make_fields, n_rows, progress, *span, stage
+    )
+    for text in rows:
+        yield text.encode("ascii")
+    yield b")\n"
+
+
+def iter_list(
+    values: ArrayLike,
+    fmt: str = FORMAT_ASCII,
+    progress: Optional[ProgressReporter] = None,
+    span: Tuple[int, int] = (0, 100),
+    stage: str = "stage_writing",
+) -> Iterator[bytes]:
+    """
+    逐段產生 labelList、scalarField 或 vectorField 的內容（不含檔案頭）
+
+    Args:
+        values: (N,) 整數、(N,) 浮點數或 (N, 3) 浮點數陣列
+        fmt: "ascii" 或 "binary"
+        progress: 進度回報器（可選，僅 ascii 逐批回報）
+        span: 進度百分比範圍
+        stage: 階段說明
+
+    Yields:
+        bytes: 內容區塊
+    """
+    values = np.asarray(values)
+    cls = list_class(values)
+    if check_format(fmt) == FORMAT_BINARY:
+        dtype = LABEL_DTYPE if cls == "labelList" else SCALAR_DTYPE
+        yield from _binary_list(values, dtype)
+        return
+
+    if progress is None:
+        progress = ProgressReporter()
+    if cls == "labelList":
+        template, fields = "%s\n", lambda lo, hi: int_fields(values[lo:hi, None])
+    elif cls == "scalarField":
+        template, fields = "%s\n", lambda lo, hi: float_fields(values[lo:hi, None])
+    else:
+        template, fields = "(%s %s %s)\n", lambda lo, hi: float_fields(values[lo:hi])
+    yield from _ascii_list(template, fields, len(values), progress, span, stage)
+
+
+def iter_face_list(
+    faces: ArrayLike,
+    fmt: str = FORMAT_ASCII,
+    progress: Optional[ProgressReporter] = None,
+    span: Tuple[int, int] = (0, 100),
+    stage: str = "stage_writing",
+) -> Iterator[bytes]:
+    """
+    逐段產生面串列的內容（不含檔案頭）
+
+    ascii 為 faceList（每列 n(a b ...)）；binary 為 faceCompactList：
+    各面起點索引（F + 1 個）與攤平的點索引兩個串列。
+
+    Args:
+        faces: 面的點索引，形狀 (F, n)
+        fmt: "ascii" 或 "binary"
+        progress: 進度回報器（可選，僅 ascii 逐批回報）
+        span: 進度百分比範圍
+        stage: 階段說明
+
+    Yields:
+        bytes: 內容區塊
+    """
+    faces = np.asarray(faces)
+    n_faces, size = faces.shape
+    if check_format(fmt) == FORMAT_BINARY:
+        yield from _binary_list(np.arange(0, size * n_faces + 1, size), LABEL_DTYPE)
+        yield b"\n"
+        yield from _binary_list(faces.ravel(), LABEL_DTYPE)
+        return
+
+    if progress is None:
+        progress = ProgressReporter()
+    template = f"{size}(" + " ".join(["%s"] * size) + ")\n"
+
+    def fields(lo: int, hi: int) -> NDArray:
+        return int_fields(faces[lo:hi])
+
+    yield from _ascii_list(template, fields, n_faces, progress, span, stage)
+
+
+def face_list_class(fmt: str) -> str:
+    """面串列在指定格式下的 class 名稱"""
+    return "faceCompactList" if fmt == FORMAT_BINARY else "faceList"
+
+
+def write_foam_list(
+    output_file: str | Path,
+    values: ArrayLike,
+    fmt: str = FORMAT_ASCII,
+    location: Optional[str] = None,
+    note: Optional[str] = None,
+    progress: Optional[ProgressReporter] = None,
+    span: Tuple[int, int] = (0, 100),
+    stage: str = "stage_writing",
+) -> Path:
+    """
+    以原子方式寫出單一串列檔案（labelList、scalarField、vectorField 或 faceList）
+
+    Args:
+        output_file: 輸出檔案路徑，檔名即為 object 欄位
+        values: 串列內容；整數 (F, n) 陣列視為面串列
+        fmt: "ascii" 或 "binary"
+        location: location 欄位（可選）
+        note: note 欄位（可選）
+        progress: 進度回報器（可選）
+        span: 進度百分比範圍
+        stage: 階段說明
+
+    Returns:
+        Path: 輸出檔案路徑
+    """
+    output_path = Path(output_file)
+    values = np.asarray(values)
+    check_format(fmt)
+    if values.ndim == 2 and np.issubdtype(values.dtype, np.integer):
+        cls = face_list_class(fmt)
+        body = iter_face_list(values, fmt, progress, span, stage)
+    else:
+        cls = list_class(values)
+        body = iter_list(values, fmt, progress, span, stage)
+
+    header = foam_header(fmt, cls, output_path.name, location, note)
+    with atomic_output(output_path, binary=True) as f:
+        f.write(header.encode("ascii"))
+        write_chunks(body, f)
+    return output_path
+
+
+def _skip_comments(data: bytes, pos: int) -> int:
+    """略過空白與 C++ 註解"""
+    while True:
+        while pos < len(data) and data[pos : pos + 1].isspace():
+            pos += 1
+        if data.startswith(b"//", pos):
+            end = data.find(b"\n", pos)
+            pos = len(data) if end < 0 else end + 1
+        elif data.startswith(b"/*", pos):
+            end = data.find(b"*/", pos)
+            pos = len(data) if end < 0 else end + 2
+        else:
+            return pos
+
+
+def read_header(data: bytes) -> Tuple[Dict[str, str], int]:
+    """
+    解析 FoamFile 檔案頭
+
+    Args:
+        data: 檔案內容
+
+    Returns:
+        Tuple[Dict[str, str], int]: (檔案頭欄位, 內容起點)
+
+    Raises:
+        ValueError: 找不到 FoamFile 檔案頭
+    """
+    start = data.find(b"FoamFile")
+    open_pos = data.find(b"{", start)
+    close_pos = data.find(b"}", open_pos)
+    if start < 0 or open_pos < 0 or close_pos < 0:
+        raise ValueError("找不到 FoamFile 檔案頭")
+    header = {
+        key.decode("ascii"): value.decode("ascii").strip().strip('"')
+        for key, value in _HEADER_ENTRY.findall(data[open_pos + 1 : close_pos])
+    }
+    return header, _skip_comments(data, close_pos + 1)
+
+
+def arch_dtypes(arch: str) -> Tuple[np.dtype, np.dtype]:
+    """
+    依 arch 欄位決定 binary 的 label 與 scalar 型別
+
+    Args:
+        arch: 例如 "LSB;label=32;scalar=64"（空字串為預設值）
+
+    Returns:
+        Tuple[np.dtype, np.dtype]: (label 型別, scalar 型別)
+    """
+    order = ">" if "MSB" in arch else "<"
+    label = re.search(r"label=(\d+)", arch)
+    scalar = re.search(r"scalar=(\d+)", arch)
+    label_bits = int(label.group(1)) if label else 32
+    scalar_bits = int(scalar.group(1)) if scalar else 64
+    return (
+        np.dtype(f"{order}i{label_bits // 8}"),
+        np.dtype(f"{order}f{scalar_bits // 8}"),
+    )
+
+
+def _read_list(
+    data: bytes, pos: int, binary: bool, dtype: np.dtype, columns: int, nested: bool
+) -> Tuple[NDArray, int]:
+    """
+    從 pos 讀取一個串列
+
+    Args:
+        data: 檔案內容
+        pos: 串列長度的起點
+        binary: 是否為 binary 格式
+        dtype: 元素型別
+        columns: binary 每列的值數
+        nested: ascii 每列是否以括號包住（vector、face）
+
+    Returns:
+        Tuple[NDArray, int]: (一維元素陣列, 串列結束後的位置)
+    """
+    match = _COUNT.match(data, _skip_comments(data, pos))
+    if match is None:
+        raise ValueError(f"位置 {pos} 不是串列")
+    count = int(match.group(1))
+    body = match.end()
+
+    native = dtype.newbyteorder("=")
+    if binary:
+        end = body + count * columns * dtype.itemsize
+        if data[end : end + 1] != b")":
+            raise ValueError("binary 串列長度與內容不符")
+        return np.frombuffer(data[body:end], dtype=dtype).astype(native), end + 1
+
+    # ascii：每列各有一個右括號時，串列的右括號為第 count + 1 個
+    closing = np.flatnonzero(np.frombuffer(data[body:], dtype=np.uint8) == ord(")"))
+    end = body + int(closing[count if nested else 0])
+    tokens = data[body:end].translate(_STRIP_PARENS).split()
+    return np.array(tokens).astype(native), end + 1
+
+
+def read_foam_list(input_file: str | Path) -> NDArray:
+    """
+    讀取 labelList、scalarField、vectorField、faceList 或 faceCompactList 檔案
+
+    Args:
+        input_file: 檔案路徑
+
+    Returns:
+        NDArray: (N,) 或 (N, 3) 陣列；面串列為 (F, n)（各面點數須相同）
+
+    Raises:
+        ValueError: 不支援的 class 或內容格式錯誤
+    """
+    data = Path(input_file).read_bytes()
+    header, pos = read_header(data)
+    binary = header.get("format") == FORMAT_BINARY
+    label_dtype, scalar_dtype = arch_dtypes(header.get("arch", ""))
+    cls = header.get("class", "")
+
+    if cls in LIST_COLUMNS:
+        columns = LIST_COLUMNS[cls]
+        dtype = label_dtype if cls == "labelList" else scalar_dtype
+        values, _ = _read_list(data, pos, binary, dtype, columns, columns > 1)
+        return values.reshape(-1, 3) if columns == 3 else values
+
+    if cls == "faceCompactList":
+        offsets, pos = _read_list(data, pos, binary, label_dtype, 1, False)
+        flat, _ = _read_list(data, pos, binary, label_dtype, 1, False)
+        sizes = np.diff(offsets)
+    elif cls == "faceList" and not binary:
+        tokens, _ = _read_list(data, pos, False, label_dtype, 1, True)
+        # 每列為 n(a b ...)，去除括號後依序為點數與點索引
+        size = int(tokens[0]) if len(tokens) else 0
+        rows = tokens.reshape(-1, size + 1) if size else tokens.reshape(0, 1)
+        sizes, flat = rows[:, 0], rows[:, 1:].ravel()
+    else:
+        raise ValueError(f"不支援的串列 class: {cls}")
+
+    if len(sizes) == 0:
+        return np.empty((0, 0), dtype=flat.dtype)
+    if np.any(sizes != sizes[0]):
+        raise ValueError("僅支援各面點數相同的面串列")
+    return flat.reshape(len(sizes), int(sizes[0]))
+
+
+def read_boundary(input_file: str | Path) -> List[PolyPatch]:
+    """
+    讀取 polyMesh 的 boundary 檔案
+
+    Args:
+        input_file: 檔案路徑
+
+    Returns:
+        List[PolyPatch]: 邊界 patch
+    """
+    data = Path(input_file).read_bytes()
+    _, pos = read_header(data)
+    patches = []
+    for name, body in _PATCH.findall(data[pos:].decode("utf-8")):
+        entries = dict(re.findall(r"(\w+)\s+([^;]*);", body))
+        patches.append(
+            PolyPatch(
+                name, entries["type"], int(entries["startFace"]), int(entries["nFaces"])
+            )
+        )
+    return patches
+
+
+def read_polymesh(polymesh_dir: str | Path) -> PolyMesh:
+    """
+    讀取 polyMesh 目錄（ascii 或 binary）
+
+    Args:
+        polymesh_dir: polyMesh 目錄
+
+    Returns:
+        PolyMesh: 網格
+    """
+    directory = Path(polymesh_dir)
+    return PolyMesh(
+        points=read_foam_list(directory / "points"),
+        faces=read_foam_list(directory / "faces"),
+        owner=read_foam_list(directory / "owner"),
+        neighbour=read_foam_list(directory / "neighbour"),
+        patches=read_boundary(directory / "boundary"),
+    )
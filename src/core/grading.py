@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+網格漸變模組
+
+blockMesh 的 simpleGrading 每個方向可以是單一擴展比，
+或多段漸變 ((長度比例 網格數比例 擴展比) ...)：各段依長度與網格數比例分配，
+段內再依該段的擴展比分割。
+
+另提供由目標第一格高度與最大網格尺寸計算多段漸變的輔助函數：
+兩端自第一格高度等比成長至最大尺寸，中段均勻，
+與全長均勻分割成第一格高度相比，只需一小部分的網格數；
+以及將兩側邊界層的厚度、層數與擴展比表示為多段漸變的函數。
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .output_profile import compact_floats
+
+# 自動漸變相鄰兩格的預設成長比
+DEFAULT_GROWTH = 1.2
+
+
+@dataclass
+class MultiGrading:
+    """單一方向的多段漸變"""
+
+    # 該方向的總網格數
+    n_cells: int
+
+    # 各段的 (長度比例, 網格數比例, 擴展比)，形狀 (S, 3)
+    sections: NDArray
+
+
+def check_sections(sections: ArrayLike) -> NDArray:
+    """
+    檢查多段漸變並正規化長度比例與網格數比例（各自總和為 1）
+
+    Args:
+        sections: 各段的 (長度比例, 網格數比例, 擴展比)
+
+    Returns:
+        NDArray: 形狀 (S, 3) 的浮點數陣列
+
+    Raises:
+        ValueError: 形狀不符或含非正值
+    """
+    sections = np.array(sections, dtype=np.float64).reshape(-1, 3)
+    if len(sections) == 0:
+        raise ValueError("多段漸變至少需要一段")
+    if np.any(sections <= 0) or not np.all(np.isfinite(sections)):
+        raise ValueError("多段漸變的長度比例、網格數比例與擴展比必須大於 0")
+    sections[:, :2] /= sections[:, :2].sum(axis=0)
+    return sections
+
+
+def grading_text(sections: ArrayLike) -> str:
+    """
+    多段漸變在 simpleGrading 中的文字，例如 ((0.2 0.3 4) (0.8 0.7 1))
+
+    Args:
+        sections: 各段的 (長度比例, 網格數比例, 擴展比)
+
+    Returns:
+        str: 最短表示的文字
+    """
+    values = np.asarray(sections, dtype=np.float64).reshape(-1, 3)
+    texts = compact_floats(values.ravel().tolist())
+    rows = [" ".join(texts[3 * i : 3 * i + 3]) for i in range(len(values))]
+    return "(" + " ".join(f"({row})" for row in rows) + ")"
+
+
+def graded_fractions(n_cells: int, ratio: float) -> NDArray:
+    """
+    依 simpleGrading 擴展比計算分割點位置
+
+    Args:
+        n_cells: 網格數
+        ratio: 擴展比（最後一格與第一格的長度比）
+
+    Returns:
+        NDArray: 0 ~ 1 的 n_cells + 1 個分割點
+    """
+    if n_cells == 1 or ratio == 1.0:
+        return np.linspace(0.0, 1.0, n_cells + 1)
+    growth = ratio ** (1.0 / (n_cells - 1))
+    return (1.0 - growth ** np.arange(n_cells + 1)) / (1.0 - growth**n_cells)
+
+
+def section_fractions(n_cells: int, sections: ArrayLike) -> NDArray:
+    """
+    依多段漸變計算分割點位置（同 blockMesh：各段網格數四捨五入，最後一段取餘數）
+
+    Args:
+        n_cells: 總網格數
+        sections: 各段的 (長度比例, 網格數比例, 擴展比)
+
+    Returns:
+        NDArray: 0 ~ 1 的 n_cells + 1 個分割點
+
+    Raises:
+        ValueError: 有任一段分不到網格
+    """
+    sections = check_sections(sections)
+    counts = np.rint(sections[:, 1] * n_cells).astype(np.int64)
+    counts[-1] = n_cells - counts[:-1].sum()
+    if np.any(counts < 1):
+        raise ValueError(f"總網格數 {n_cells} 不足以分配給 {len(sections)} 段漸變")
+    starts = np.concatenate([[0.0], np.cumsum(sections[:, 0])])
+    parts = [
+        start + length * graded_fractions(n, ratio)[:-1]
+        for start, (length, _, ratio), n in zip(starts, sections, counts.tolist())
+    ]
+    return np.concatenate(parts + [[1.0]])
+
+
+def layer_grading(
+    n_core: int,
+    inner_thickness: float,
+    inner_layers: int,
+    outer_thickness: float,
+    outer_layers: int,
+    expansion_ratio: float,
+) -> MultiGrading:
+    """
+    將兩側壁面的邊界層表示為多段漸變
+
+    內側段自壁面以 expansion_ratio 逐層成長，外側段鏡像，
+    其餘長度以 n_core 格均勻分割。
+
+    Args:
+        n_core: 中段的網格數
+        inner_thickness: 內側邊界層厚度（相對於全長的比例）
+        inner_layers: 內側邊界層層數
+        outer_thickness: 外側邊界層厚度（相對於全長的比例）
+        outer_layers: 外側邊界層層數
+        expansion_ratio: 相鄰兩層的厚度比
+
+    Returns:
+        MultiGrading: 總網格數為 n_core + inner_layers + outer_layers
+    """
+    core = 1.0 - inner_thickness - outer_thickness
+    if n_core < 1 or core <= 0:
+        raise ValueError("邊界層厚度總和必須小於 1，且中段至少 1 格")
+    inner_ratio = expansion_ratio ** (inner_layers - 1)
+    outer_ratio = expansion_ratio ** (outer_layers - 1)
+    sections = [
+        (inner_thickness, inner_layers, inner_ratio),
+        (core, n_core, 1.0),
+        (outer_thickness, outer_layers, 1.0 / outer_ratio),
+    ]
+    n_cells = n_core + inner_layers + outer_layers
+    return MultiGrading(n_cells, check_sections(sections))
+
+
+def wall_grading(
+    length: float,
+    first_cell: float,
+    max_cell: float,
+    ends: int = 2,
+    growth: float = DEFAULT_GROWTH,
+) -> MultiGrading:
+    """
+    由第一格高度與最大網格尺寸計算多段漸變
+
+    漸變段自 first_cell 以 growth 等比成長，最後一格不超過 max_cell；
+    其餘長度以不超過 max_cell 的均勻網格填滿。
+    兩端漸變段總長超過全長時減少漸變段的網格數，
+    剩餘長度小於漸變段最後一格時併入漸變段。
+
+    Args:
+        length: 該方向的全長
+        first_cell: 端點第一格的高度
+        max_cell: 最大網格尺寸（不小於 first_cell）
+        ends: 1 為只在起點加密，2 為兩端加密
+        growth: 相鄰兩格的成長比（大於 1）
+
+    Returns:
+        MultiGrading: 總網格數與各段漸變
+    """
+    if length <= 0 or first_cell <= 0:
+        raise ValueError("全長與第一格高度必須大於 0")
+    if max_cell < first_cell:
+        raise ValueError(f"最大網格尺寸 {max_cell} 不可小於第一格高度 {first_cell}")
+    if ends not in (1, 2):
+        raise ValueError(f"加密端數必須為 1 或 2: {ends}")
+    if growth <= 1:
+        raise ValueError(f"成長比必須大於 1: {growth}")
+    if ends * first_cell > length:
+        raise ValueError(f"第一格高度 {first_cell} 超過全長 {length}")
+
+    def graded_length(n: int) -> float:
+        return first_cell * (growth**n - 1.0) / (growth - 1.0)
+
+    # 成長至不超過 max_cell 的網格數（容許浮點誤差）
+    n_graded = int(math.log(max_cell / first_cell) / math.log(growth) + 1e-9) + 1
+    while n_graded > 1 and ends * graded_length(n_graded) > length:
+        n_graded -= 1
+
+    graded = graded_length(n_graded)
+    core = length - ends * graded
+    ratio = growth ** (n_graded - 1)
+    if core < first_cell * ratio:
+        # 剩餘長度不足一格時併入漸變段，第一格略為放大
+        graded, n_core = length / ends, 0
+    else:
+        n_core = math.ceil(core / max_cell - 1e-9)
+
+    sections = [(graded, n_graded, ratio)]
+    if n_core:
+        sections.append((core, n_core, 1.0))
+    if ends == 2:
+        sections.append((graded, n_graded, 1.0 / ratio))
+
+    n_cells = ends * n_graded + n_core
+    return MultiGrading(n_cells, check_sections(sections))
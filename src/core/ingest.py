@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+快速資料匯入模組
+
+將點位資料直接解析為連續的 float64 (N, 3) 陣列：
+- CSV/TXT：以 pandas C 解析器讀取，由檔案開頭的少量樣本偵測分隔符、
+  `#` 註解行與標題行，只解析前三欄
+- Excel (.xlsx)：以 openpyxl 唯讀模式逐行讀取前三欄，填入可成長的緩衝區，
+  記憶體用量只與輸出陣列大小成正比
+- 分塊讀取：以固定列數的區塊逐塊產生點位，供超出記憶體的資料使用
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+
+# 偵測時讀取的檔案開頭位元組數
+SNIFF_BYTES = 64 * 1024
+
+# 偵測時最多檢查的資料行數
+SNIFF_LINES = 50
+
+# 候選分隔符（None 表示空白字元）
+CANDIDATE_DELIMITERS = (",", ";", "\t", "|")
+
+COMMENT_CHAR = "#"
+
+# Excel 逐行讀取時每次轉換為陣列的列數
+EXCEL_BLOCK_ROWS = 4096
+
+# Excel 緩衝區的初始容量（無法得知工作表列數時）
+EXCEL_INITIAL_ROWS = 65536
+
+
+@dataclass(frozen=True)
+class TextFormat:
+    """文字檔案格式偵測結果"""
+
+    # 分隔符，None 表示以連續空白分隔
+    delimiter: Optional[str]
+
+    # 第一個資料行是否為標題行
+    has_header: bool
+
+    # 欄數（依第一個資料行）
+    n_columns: int
+
+    @property
+    def pandas_sep(self) -> str:
+        """轉換為 pandas C 解析器可用的分隔符"""
+        return self.delimiter if self.delimiter is not None else r"\s+"
+
+
+def _is_number(token: str) -> bool:
+    """檢查字串是否可轉為數值"""
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _split(line: str, delimiter: Optional[str]) -> List[str]:
+    """依分隔符切分一行"""
+    if delimiter is None:
+        return line.split()
+    return [token.strip() for token in line.split(delimiter)]
+
+
+def _head_lines(file_path: Path) -> List[str]:
+    """讀取檔案開頭樣本中非空白、非註解的資料行"""
+    with open(file_path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+
+    text = head.decode("utf-8", errors="replace")
+    lines = text.splitlines()
+    # 最後一行可能被截斷
+    if len(head) == SNIFF_BYTES and len(lines) > 1:
+        lines = lines[:-1]
+
+    data_lines = []
+    for line in lines:
+        stripped = line.split(COMMENT_CHAR, 1)[0].strip()
+        if stripped:
+            data_lines.append(stripped)
+        if len(data_lines) >= SNIFF_LINES:
+            break
+    return data_lines
+
+
+def sniff_text_format(
+    file_path: str | Path, whitespace_only: bool = False
+) -> TextFormat:
+    """
+    由檔案開頭樣本偵測文字格式
+
+    Args:
+        file_path: 資料檔案路徑
+        whitespace_only: 只使用空白分隔（TXT 格式）
+
+    Returns:
+        TextFormat: 偵測結果
+
+    Raises:
+        ValueError: 檔案沒有任何資料行
+    """
+    lines = _head_lines(Path(file_path))
+    if not lines:
+        raise ValueError(f"檔案沒有資料: {file_path}")
+
+    # 標題行不參與分隔符偵測
+    body = lines[1:] or lines
+
+    delimiter: Optional[str] = None
+    if not whitespace_only:
+        for candidate in CANDIDATE_DELIMITERS:
+            counts = {line.count(candidate) for line in body}
+            if len(counts) == 1 and counts.pop() >= 1:
+                delimiter = candidate
+                break
+
+    first = _split(lines[0], delimiter)
+    has_header = not all(_is_number(token) for token in first)
+    n_columns = len(_split(body[0], delimiter)) if has_header else len(first)
+
+    return TextFormat(delimiter=delimiter, has_header=has_header, n_columns=n_columns)
+
+
+def read_text_points(
+    file_path: str | Path, whitespace_only: bool = False
+) -> NDArray[np.float64]:
+    """
+    以 C 解析器讀取 CSV/TXT 點位
+
+    Args:
+        file_path: 資料檔案路徑
+        whitespace_only: 只使用空白分隔（TXT 格式）
+
+    Returns:
+        NDArray: 形狀為 (N, 3) 的連續 float64 座標陣列
+    """
+    fmt = sniff_text_format(file_path, whitespace_only=whitespace_only)
+    if fmt.n_columns < 3:
+        raise ValueError(f"資料需要至少 3 欄 (X, Y, Z)，目前只有 {fmt.n_columns} 欄")
+
+    df = pd.read_csv(
+        file_path,
+        sep=fmt.pandas_sep,
+        header=0 if fmt.has_header else None,
+        comment=COMMENT_CHAR,
+        usecols=[0, 1, 2],
+        dtype=np.float64,
+        engine="c",
+        skip_blank_lines=True,
+    )
+    return np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+
+
+def iter_text_chunks(
+    file_path: str | Path, chunk_rows: int, whitespace_only: bool = False
+) -> Iterator[NDArray[np.float64]]:
+    """
+    分塊讀取 CSV/TXT 點位
+
+    Args:
+        file_path: 資料檔案路徑
+        chunk_rows: 每塊列數
+        whitespace_only: 只使用空白分隔（TXT 格式）
+
+    Yields:
+        NDArray: 形狀為 (k, 3) 的連續 float64 座標區塊，k <= chunk_rows
+    """
+    fmt = sniff_text_format(file_path, whitespace_only=whitespace_only)
+    if fmt.n_columns < 3:
+        raise ValueError(f"資料需要至少 3 欄 (X, Y, Z)，目前只有 {fmt.n_columns} 欄")
+
+    reader = pd.read_csv(
+        file_path,
+        sep=fmt.pandas_sep,
+        header=0 if fmt.has_header else None,
+        comment=COMMENT_CHAR,
+        usecols=[0, 1, 2],
+        dtype=np.float64,
+        engine="c",
+        skip_blank_lines=True,
+        chunksize=chunk_rows,
+    )
+    with reader:
+        for df in reader:
+            yield np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+
+
+def _iter_sheet_blocks(sheet, block_rows: int) -> Iterator[NDArray[np.float64]]:
+    """
+    以唯讀模式逐行讀取工作表的前三欄
+
+    略過空白列，第一個非空白列若非數值則視為標題行；
+    第一個資料列需有三欄，之後任一資料列的 X、Y、Z 有空白皆視為錯誤。
+
+    Yields:
+        NDArray: 形狀為 (k, 3) 的座標區塊，k <= block_rows
+
+    Raises:
+        ValueError: 欄數不足或資料列有空白值
+    """
+    block: List[tuple] = []
+    first = True
+    checked = False
+
+    for row_number, row in enumerate(
+        sheet.iter_rows(max_col=3, values_only=True), start=1
+    ):
+        if all(value is None for value in row):
+            continue
+
+        if first:
+            first = False
+            if not all(_is_number(str(value)) for value in row if value is not None):
+                continue
+
+        if not checked:
+            checked = True
+            n_columns = sum(value is not None for value in row)
+            if n_columns < 3:
+                raise ValueError(f"資料需要至少 3 欄 (X, Y, Z)，目前只有 {n_columns} 欄")
+
+        if len(row) < 3 or None in row:
+            raise ValueError(f"第 {row_number} 列的 X、Y、Z 有空白值")
+        block.append(row)
+
+        if len(block) == block_rows:
+            yield np.array(block, dtype=np.float64)
+            block = []
+
+    if block:
+        yield np.array(block, dtype=np.float64)
+
+
+def iter_excel_chunks(
+    file_path: str | Path, chunk_rows: int
+) -> Iterator[NDArray[np.float64]]:
+    """
+    分塊串流讀取 Excel (.xlsx) 第一個工作表的點位
+
+    Args:
+        file_path: Excel 檔案路徑
+        chunk_rows: 每塊列數
+
+    Yields:
+        NDArray: 形狀為 (k, 3) 的 float64 座標區塊，k <= chunk_rows
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        yield from _iter_sheet_blocks(workbook.worksheets[0], chunk_rows)
+    finally:
+        workbook.close()
+
+
+def iter_point_chunks(
+    file_path: str | Path, chunk_rows: int
+) -> Iterator[NDArray[np.float64]]:
+    """
+    依副檔名分塊讀取點位
+
+    Args:
+        file_path: 資料檔案路徑 (.xlsx, .csv, .txt)
+        chunk_rows: 每塊列數
+
+    Returns:
+        Iterator[NDArray]: 形狀為 (k, 3) 的 float64 座標區塊
+    """
+    ext = Path(file_path).suffix.lower()
+    if ext == ".xlsx":
+        return iter_excel_chunks(file_path, chunk_rows)
+    if ext == ".csv":
+        return iter_text_chunks(file_path, chunk_rows)
+    if ext == ".txt":
+        return iter_text_chunks(file_path, chunk_rows, whitespace_only=True)
+    raise ValueError(f"分塊讀取不支援的檔案格式: {ext}")
+
+
+def read_excel_points(file_path: str | Path) -> NDArray[np.float64]:
+    """
+    串流讀取 Excel (.xlsx) 第一個工作表的點位
+
+    Args:
+        file_path: Excel 檔案路徑
+
+    Returns:
+        NDArray: 形狀為 (N, 3) 的連續 float64 座標陣列
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        capacity = sheet.max_row or EXCEL_INITIAL_ROWS
+        buffer = np.empty((capacity, 3), dtype=np.float64)
+        n = 0
+
+        for block in _iter_sheet_blocks(sheet, EXCEL_BLOCK_ROWS):
+            end = n + len(block)
+            if end > len(buffer):
+                grown = np.empty((max(end, 2 * len(buffer)), 3), dtype=np.float64)
+                grown[:n] = buffer[:n]
+                buffer = grown
+            buffer[n:end] = block
+            n = end
+    finally:
+        workbook.close()
+
+    if n == 0:
+        raise ValueError(f"檔案沒有資料: {file_path}")
+
+    # 就地縮減為實際大小
+    buffer.resize((n, 3), refcheck=False)
+    return buffer
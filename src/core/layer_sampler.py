@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+層取樣模組
+
+在內外曲線上以線性插值取樣各層座標：
+- 建立一次依 Z 排序的搜尋索引，大型（記憶體映射）資料只保留稀疏索引
+- 以向量化 searchsorted + 線性插值一次求出 X、Y 兩條曲線
+- 依層數快取最近的取樣結果，調整層數時不需重新建立插值
+- 自適應取樣：以誤差二分法在彎曲處加密、直線段放寬，
+  使分段線性重建與量測曲線的偏差不超過容許值
+- 曲線邊取樣：相鄰兩層之間另取等距的中間點，供 spline、polyLine 邊使用
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..models.point_cloud import PointCloud
+
+# 搜尋索引的最大長度，超過時改為每隔 stride 取一個 Z 值
+MAX_INDEX_SIZE = 1 << 16
+
+# 預設快取的層數設定數量
+DEFAULT_CACHE_SIZE = 8
+
+
+class WallCurve:
+    """依 Z 排序的單一壁面曲線，可在任意 Z 上插值 X、Y"""
+
+    def __init__(self, points: PointCloud):
+        """
+        初始化曲線
+
+        Args:
+            points: 依 Z 排序的點雲（可為記憶體映射）
+        """
+        n = len(points)
+        if n < 2:
+            raise ValueError(f"曲線至少需要 2 個點，目前只有 {n} 個")
+
+        self._points = points
+        self._n = n
+        self._stride = -(-n // MAX_INDEX_SIZE)
+        self._index = np.array(points.z[:: self._stride], dtype=np.float64)
+
+    @property
+    def points(self) -> PointCloud:
+        """依 Z 排序的點雲"""
+        return self._points
+
+    @property
+    def z_min(self) -> float:
+        """最小 Z"""
+        return float(self._points.z[0])
+
+    @property
+    def z_max(self) -> float:
+        """最大 Z"""
+        return float(self._points.z[-1])
+
+    def searchsorted(self, z: NDArray) -> NDArray:
+        """等同 np.searchsorted(points.z, z)，只讀取索引附近的點位"""
+        k = np.searchsorted(self._index, z)
+        if self._stride == 1:
+            return k
+
+        # 答案落在 ((k-1)*stride, k*stride] 之間，只需比對該區段
+        s = self._stride
+        base = np.maximum(k - 1, 0) * s + 1
+        positions = base[:, None] + np.arange(s - 1)
+        valid = positions < self._n
+        values = self._points.z[np.minimum(positions, self._n - 1)]
+        count = np.count_nonzero((values < z[:, None]) & valid, axis=1)
+        return np.where(k == 0, 0, base + count)
+
+    def evaluate(self, z: NDArray) -> NDArray:
+        """
+        在指定 Z 上線性插值（範圍外以端點線段外插）
+
+        Args:
+            z: 取樣 Z 座標
+
+        Returns:
+            NDArray: 形狀為 (2, M) 的 (X, Y)
+        """
+        hi = np.clip(self.searchsorted(z), 1, self._n - 1)
+        lo = hi - 1
+        columns = self._points.columns
+        p_lo = columns[:, lo].astype(np.float64, copy=False)
+        p_hi = columns[:, hi].astype(np.float64, copy=False)
+
+        dz = p_hi[2] - p_lo[2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = (p_hi[:2] - p_lo[:2]) / dz
+        # 重複 Z 值的零長度線段取下端點
+        slope[:, dz == 0] = 0.0
+        return slope * (z - p_lo[2]) + p_lo[:2]
+
+
+def _segment_max(values: NDArray, bounds: NDArray) -> NDArray:
+    """
+    各區段的最大值（區段 s 為 values[bounds[s]:bounds[s + 1]]，空區段為 0）
+
+    Args:
+        values: 依區段連續排列的數值
+        bounds: 遞增的區段邊界索引，形狀 (S + 1,)
+
+    Returns:
+        NDArray: 形狀 (S,)
+    """
+    result = np.zeros(len(bounds) - 1)
+    nonempty = np.diff(bounds) > 0
+    if np.any(nonempty):
+        # 略過空區段後，各非空區段的終點即為下一個非空區段的起點
+        result[nonempty] = np.maximum.reduceat(values, bounds[:-1][nonempty])
+    return result
+
+
+def refine_layers(z: NDArray, edge_points: int) -> NDArray:
+    """
+    在相鄰兩層之間插入等距的中間取樣點
+
+    結果每隔 edge_points + 1 個即為一層，其間為該段曲線邊的中間點。
+
+    Args:
+        z: 遞增的各層 Z 座標，形狀 (L,)
+        edge_points: 每段的中間點數（0 為不插入）
+
+    Returns:
+        NDArray: 形狀 ((L - 1)·(edge_points + 1) + 1,)
+    """
+    z = np.asarray(z, dtype=np.float64)
+    if edge_points < 0:
+        raise ValueError(f"中間點數不可為負: {edge_points}")
+    if edge_points == 0 or len(z) < 2:
+        return z
+    t = np.arange(edge_points + 1) / (edge_points + 1)
+    segments = z[:-1, None] + np.diff(z)[:, None] * t
+    return np.append(segments.ravel(), z[-1])
+
+
+def adaptive_layers(
+    curves: Sequence[WallCurve],
+    z_min: float,
+    z_max: float,
+    tolerance: float,
+    max_layers: int,
+    edge_points: int = 0,
+) -> NDArray:
+    """
+    以誤差二分法決定各層的 Z 座標
+
+    從兩端兩層開始，每輪一次計算所有區段內量測點與分段線性重建（弦）的最大偏差，
+    偏差超過容許值的區段在中點加入一層；層數達上限時只細分偏差最大的區段。
+    區段內沒有量測點時偏差為 0，不再細分。
+    edge_points 大於 0 時重建經過各段的中間點（曲線邊），彎曲處所需的層數較少。
+
+    Args:
+        curves: 壁面曲線（內、外壁）
+        z_min: 取樣範圍下限
+        z_max: 取樣範圍上限
+        tolerance: X、Y 方向的容許偏差（與資料同單位）
+        max_layers: 層數上限（至少為 2）
+        edge_points: 每段曲線邊的中間點數（0 為直線邊）
+
+    Returns:
+        NDArray: 遞增的各層 Z 座標（不含中間點）
+    """
+    if tolerance <= 0:
+        raise ValueError(f"容許偏差必須大於 0: {tolerance}")
+    if max_layers < 2:
+        raise ValueError(f"層數上限必須至少為 2: {max_layers}")
+
+    # 取樣範圍內的量測點
+    measured = []
+    for curve in curves:
+        lo = np.searchsorted(curve.points.z, z_min, side="left")
+        hi = np.searchsorted(curve.points.z, z_max, side="right")
+        columns = curve.points.columns[:, lo:hi].astype(np.float64, copy=False)
+        measured.append((curve, columns[2], columns[:2]))
+
+    breaks = np.array([z_min, z_max], dtype=np.float64)
+    while len(breaks) < max_layers:
+        errors = np.zeros(len(breaks) - 1)
+        for curve, z, xy in measured:
+            knots = refine_layers(breaks, edge_points)
+            nodes = curve.evaluate(knots)
+            chord = np.stack([np.interp(z, knots, nodes[axis]) for axis in range(2)])
+            deviation = np.abs(xy - chord).max(axis=0)
+            bounds = np.searchsorted(z, breaks)
+            bounds[-1] = len(z)
+            errors = np.maximum(errors, _segment_max(deviation, bounds))
+
+        split = np.flatnonzero(errors > tolerance)
+        if len(split) == 0:
+            break
+        budget = max_layers - len(breaks)
+        if len(split) > budget:
+            split = np.sort(split[np.argsort(errors[split])[::-1][:budget]])
+        midpoints = 0.5 * (breaks[split] + breaks[split + 1])
+        breaks = np.insert(breaks, split + 1, midpoints)
+    return breaks
+
+
+class LayerSampler:
+    """內外曲線層取樣器"""
+
+    def __init__(
+        self,
+        inner_points: PointCloud,
+        outer_points: PointCloud,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        初始化取樣器
+
+        Args:
+            inner_points: 依 Z 排序的內曲線點雲
+            outer_points: 依 Z 排序的外曲線點雲
+            cache_size: 快取的層數設定數量
+        """
+        self._inner = WallCurve(inner_points)
+        self._outer = WallCurve(outer_points)
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Hashable, Tuple[PointCloud, PointCloud]]
+        self._cache = OrderedDict()
+
+    @property
+    def z_range(self) -> Tuple[float, float]:
+        """內外曲線共同的 Z 範圍"""
+        return (
+            max(self._inner.z_min, self._outer.z_min),
+            min(self._inner.z_max, self._outer.z_max),
+        )
+
+    def evaluate(self, z_samples: NDArray) -> Tuple[PointCloud, PointCloud]:
+        """
+        在指定 Z 上取樣內外曲線
+
+        Args:
+            z_samples: 取樣 Z 座標
+
+        Returns:
+            Tuple[PointCloud, PointCloud]: (內曲線取樣, 外曲線取樣)
+        """
+        z_samples = np.asarray(z_samples, dtype=np.float64)
+        inner = np.empty((3, len(z_samples)))
+        outer = np.empty((3, len(z_samples)))
+        inner[:2] = self._inner.evaluate(z_samples)
+        outer[:2] = self._outer.evaluate(z_samples)
+        inner[2] = z_samples
+        outer[2] = z_samples
+        return PointCloud(inner), PointCloud(outer)
+
+    def sample(
+        self, num_layers: int, edge_points: int = 0
+    ) -> Tuple[PointCloud, PointCloud]:
+        """
+        在共同 Z 範圍內均勻取樣（結果為唯讀點雲，並依層數快取）
+
+        Args:
+            num_layers: 取樣層數
+            edge_points: 相鄰兩層之間的曲線邊中間點數（0 為只取樣各層）
+
+        Returns:
+            Tuple[PointCloud, PointCloud]: (內曲線取樣, 外曲線取樣)，
+            每隔 edge_points + 1 個點為一層
+        """
+        z_min, z_max = self.z_range
+        key = num_layers if edge_points == 0 else (num_layers, edge_points)
+        return self._cached(
+            key,
+            lambda: refine_layers(np.linspace(z_min, z_max, num_layers), edge_points),
+        )
+
+    def sample_adaptive(
+        self, tolerance: float, max_layers: int, edge_points: int = 0
+    ) -> Tuple[PointCloud, PointCloud]:
+        """
+        自適應取樣：層數為使內外壁重建偏差不超過 tolerance 所需的最少二分結果
+
+        Args:
+            tolerance: X、Y 方向的容許偏差（與資料同單位）
+            max_layers: 層數上限
+            edge_points: 相鄰兩層之間的曲線邊中間點數（重建經過中間點）
+
+        Returns:
+            Tuple[PointCloud, PointCloud]: (內曲線取樣, 外曲線取樣)，
+            每隔 edge_points + 1 個點為一層
+        """
+        z_min, z_max = self.z_range
+        curves = (self._inner, self._outer)
+
+        def make_z() -> NDArray:
+            breaks = adaptive_layers(
+                curves, z_min, z_max, tolerance, max_layers, edge_points
+            )
+            return refine_layers(breaks, edge_points)
+
+        return self._cached(("adaptive", tolerance, max_layers, edge_points), make_z)
+
+    def _cached(
+        self, key: Hashable, make_z: Callable[[], NDArray]
+    ) -> Tuple[PointCloud, PointCloud]:
+        """依鍵值快取取樣結果（唯讀點雲）"""
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        result = self.evaluate(make_z())
+        for cloud in result:
+            cloud.set_read_only()
+
+        self._cache[key] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return result
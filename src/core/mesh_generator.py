@@ -7,14 +7,207 @@
 
 import math
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..models.block_mesh import BlockMesh, Patch
 from ..models.mesh_params import MeshParameters, BoundaryLayerParams
+from ..models.point_cloud import PointCloud
+from ..models.poly_mesh import PolyMesh
+from .artifact_cache import artifact_key, geometry_fingerprint
+from .consolidation import Consolidation, consolidate_layers
+from .dict_writer import (
+    ARC_LINE,
+    FACE_LINE,
+    FOOTER,
+    HEX_FIELDS,
+    HEX_LINE,
+    block_fields,
+    float_fields,
+    format_values,
+    int_fields,
+    iter_compact_dict,
+    iter_curve_edges,
+    iter_dict_body,
+    iter_rows,
+    patch_text,
+)
+from .output_profile import PROFILE_ANNOTATED, PROFILE_COMPACT, check_profile
+from .output_writer import (
+    atomic_output,
+    check_compresslevel,
+    encode_output,
+    write_chunks,
+    write_if_changed,
+)
+from .foam_io import FORMAT_ASCII
+from .grading import MultiGrading, layer_grading
+from .polymesh import POLYMESH_LOCATION, annulus_polymesh, write_polymesh
+from .progress import ProgressReporter
+
+# 每層預先格式化的欄位：每個數值只格式化一次，各區段的模板再依索引重複引用
+F_LAYER = 0  # 層號（1 起算）
+F_VERTEX = 1  # 1~8：本層頂點 0~7 的編號（0~3 內圈 0°、90°、180°、270°，4~7 外圈）
+F_Z3 = 9  # z（小數 3 位，用於註解）
+F_Z6 = 10  # z（小數 6 位）
+F_RADIUS = 11  # 11~14：內圈 r、-r，外圈 r、-r
+F_DIAG = 15  # 15~18：內圈 d、-d，外圈 d、-d（d = r·√½，圓弧中點座標）
+F_ARC = 19  # 19~34：本層 8 段圓弧的兩端頂點編號
+N_FIELDS = 35
+
+# annotated 格式的檔案結尾橫線
+END_BANNER = (
+    "\n// ************************************************************************* //\n"
+)
+
+# 各 patch 面的頂點偏移（每列一個象限，8 以上為下一層）
+INLET_FACES = [(q, 4 + q, 4 + (q + 1) % 4, (q + 1) % 4) for q in range(4)]
+OUTLET_FACES = [(q, (q + 1) % 4, 4 + (q + 1) % 4, 4 + q) for q in range(4)]
+INNER_WALL_FACES = [(q, (q + 1) % 4, 8 + (q + 1) % 4, 8 + q) for q in range(4)]
+OUTER_WALL_FACES = [(4 + q, 12 + q, 12 + (q + 1) % 4, 4 + (q + 1) % 4) for q in range(4)]
+
+# 各象限 hex 塊的頂點偏移 (v0 v4 v5 v1 v0n v4n v5n v1n)：底面同入口面，頂面為下一層
+HEX_OFFSETS = [face + tuple(v + 8 for v in face) for face in INLET_FACES]
+
+# 各象限頂點的方向 (cos q·90°, sin q·90°)
+QUAD_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+# 軸對稱楔形的張角（度），以 xz 平面為中心對稱
+WEDGE_ANGLE = 5.0
+
+# 楔形每層 4 個頂點：內圈 -θ/2、+θ/2，外圈 -θ/2、+θ/2；4 以上為下一層
+WEDGE_HEX = (0, 2, 3, 1, 4, 6, 7, 5)
+WEDGE_FACES = {
+    "inlet": (0, 2, 3, 1),
+    "outlet": (0, 1, 3, 2),
+    "innerWall": (0, 1, 5, 4),
+    "outerWall": (2, 6, 7, 3),
+    "front": (1, 3, 7, 5),
+    "back": (0, 4, 6, 2),
+}
+
+# 各象限圓弧中點 (x, y) 的正負號
+ARC_SIGNS = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+
+# 單層頂點的格式模板（內圈 4 點、外圈 4 點）
+_VERTEX_LINES = (
+    "    (%s  0.000000  %s)  // 頂點 %s\n"
+    "    (0.000000  %s  %s)  // 頂點 %s\n"
+    "    (%s  0.000000  %s)  // 頂點 %s\n"
+    "    (0.000000  %s  %s)  // 頂點 %s\n"
+)
+VERTEX_LAYER_TEMPLATE = (
+    "    // 層 %s - 內圈頂點，z = %s\n"
+    + _VERTEX_LINES
+    + "    // 層 %s - 外圈頂點，z = %s\n"
+    + _VERTEX_LINES
+)
+
+# 單層圓弧的格式模板（內圈 4 段、外圈 4 段）
+_ARC_LINES = ARC_LINE * 4
+EDGE_LAYER_TEMPLATE = (
+    "    // 層 %s - 內圈弧，z = %s\n"
+    + _ARC_LINES
+    + "    // 層 %s - 外圈弧，z = %s\n"
+    + _ARC_LINES
+)
+
+# 相鄰兩層之間 4 個 hex 塊的格式模板
+BLOCK_PAIR_TEMPLATE = "    // 連接層 %s 和層 %s 的塊\n" + HEX_LINE * 4
+
+
+def _vertex_order() -> List[int]:
+    """VERTEX_LAYER_TEMPLATE 的欄位順序"""
+    order = []
+    for wall in range(2):
+        order += [F_LAYER, F_Z3]
+        for quad in range(4):
+            radius = F_RADIUS + 2 * wall + (0 if quad < 2 else 1)
+            order += [radius, F_Z6, F_VERTEX + 4 * wall + quad]
+    return order
+
+
+def _edge_order() -> List[int]:
+    """EDGE_LAYER_TEMPLATE 的欄位順序"""
+    order = []
+    for wall in range(2):
+        order += [F_LAYER, F_Z3]
+        for quad, (sx, sy) in enumerate(ARC_SIGNS):
+            diag = F_DIAG + 2 * wall
+            arc = F_ARC + 2 * (4 * wall + quad)
+            order += [
+                arc,
+                arc + 1,
+                diag if sx > 0 else diag + 1,
+                diag if sy > 0 else diag + 1,
+                F_Z6,
+            ]
+    return order
+
+
+def _layer_fields(
+    mesh: BlockMesh,
+    start: int,
+    stop: int,
+    radius: bool = False,
+    diag: bool = False,
+) -> NDArray:
+    """
+    將第 start ~ stop-1 層需要輸出的數值一次格式化
+
+    數值直接取自中間表示：每層 8 個頂點、8 段圓弧，依序排列。
+
+    Args:
+        mesh: 流道網格的中間表示
+        start: 起始層索引
+        stop: 結束層索引（不含）
+        radius: 是否格式化 z、±r 與頂點編號欄位（頂點）
+        diag: 是否格式化 z、±d 與圓弧端點欄位（圓弧）；兩者皆否時只有層號
+
+    Returns:
+        NDArray: 形狀為 (stop - start, N_FIELDS) 的字串物件陣列，欄位見 F_* 常數
+    """
+    n_rows = stop - start
+    fields = np.empty((n_rows, N_FIELDS), dtype=object)
+    fields[:, F_LAYER] = list(map(str, range(start + 1, stop + 1)))
+
+    if radius or diag:
+        vertices = mesh.vertices[start * 8 : stop * 8].reshape(n_rows, 8, 3)
+        z = vertices[:, 0, 2]
+
+        columns = [F_Z6]
+        values = [z]
+        if radius:
+            fields[:, F_VERTEX : F_VERTEX + 8] = np.array(
+                list(map(str, range(start * 8, stop * 8))), dtype=object
+            ).reshape(n_rows, 8)
+            # 頂點 0、2、4、6 的 x 依序為內圈 r、-r，外圈 r、-r
+            columns += range(F_RADIUS, F_RADIUS + 4)
+            values += [vertices[:, k, 0] for k in (0, 2, 4, 6)]
+        if diag:
+            # 圓弧 0、1、4、5 的中點 x 依序為內圈 d、-d，外圈 d、-d
+            points = mesh.arc_points[start * 8 : stop * 8].reshape(n_rows, 8, 3)
+            columns += range(F_DIAG, F_DIAG + 4)
+            values += [points[:, k, 0] for k in (0, 1, 4, 5)]
+            fields[:, F_ARC : F_ARC + 16] = int_fields(
+                mesh.arc_edges[start * 8 : stop * 8].reshape(n_rows, 16)
+            )
+
+        # 所需座標欄位以一次格式化完成
+        fields[:, F_Z3] = format_values("%.3f", z.tolist())
+        fields[:, columns] = float_fields(np.column_stack(values), compact=False)
+
+    return fields
 
 
 class MeshGenerator:
     """網格生成器"""
 
+    # 輸出格式版本，相同輸入的輸出內容改變時需遞增（使輸出快取失效）
+    VERSION = 2
+
     # OpenFOAM blockMeshDict 檔案頭模板
     HEADER_TEMPLATE = """/*--------------------------------*- C++ -*----------------------------------*\\
 | =========                 |                                                 |
@@ -43,6 +236,8 @@ scale {scale};
         self,
         mesh_params: MeshParameters,
         boundary_layer_params: Optional[BoundaryLayerParams] = None,
+        profile: str = PROFILE_ANNOTATED,
+        compresslevel: Optional[int] = None,
     ):
         """
         初始化網格生成器
@@ -50,287 +245,707 @@ scale {scale};
         Args:
             mesh_params: 網格參數
             boundary_layer_params: 邊界層參數（可選）
+            profile: 輸出格式（"annotated" 或 "compact"）
+            compresslevel: 寫入檔案時的 gzip 壓縮等級 0~9（None 為不壓縮）
         """
         self.mesh_params = mesh_params
         self.bl_params = boundary_layer_params or BoundaryLayerParams()
+        self.profile = check_profile(profile)
+        self.compresslevel = check_compresslevel(compresslevel)
+
+    @property
+    def compact(self) -> bool:
+        """是否為 compact 輸出格式"""
+        return self.profile == PROFILE_COMPACT
+
+    def artifact_key(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+    ) -> str:
+        """
+        計算輸出快取鍵值（取樣幾何、所有參數欄位與版本）
+
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
+
+        Returns:
+            str: 鍵值
+        """
+        data = geometry_fingerprint(
+            PointCloud.coerce(inner_samples), PointCloud.coerce(outer_samples)
+        )
+        return artifact_key(
+            type(self).__name__,
+            self.VERSION,
+            self.mesh_params,
+            self.bl_params,
+            data=data,
+            profile=self.profile,
+            compresslevel=self.compresslevel,
+        )
 
     def generate(
         self,
-        inner_samples: List[List[float]],
-        outer_samples: List[List[float]],
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
         output_file: str | Path,
+        progress: Optional[ProgressReporter] = None,
     ) -> None:
         """
         生成 blockMeshDict 檔案
 
+        先寫入暫存檔再取代目標檔案；失敗或取消時不會留下寫到一半的檔案。
+
         Args:
-            inner_samples: 內曲線採樣點 [[x, y, z], ...]
-            outer_samples: 外曲線採樣點 [[x, y, z], ...]
+            inner_samples: 內曲線採樣點（PointCloud 或 [[x, y, z], ...]）
+            outer_samples: 外曲線採樣點（PointCloud 或 [[x, y, z], ...]）
             output_file: 輸出檔案路徑
+            progress: 進度回報器（可選），逐段、逐批回報並檢查取消
         """
-        if self.bl_params.enabled:
-            inner_bl, outer_bl = self._calculate_boundary_layer_points(
-                inner_samples, outer_samples
-            )
-            self._generate_with_boundary_layer(
-                inner_samples, outer_samples, inner_bl, outer_bl, output_file
-            )
+        self.to_path(inner_samples, outer_samples, output_file, progress)
+
+    def iter_chunks(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+        progress: Optional[ProgressReporter] = None,
+    ) -> Iterator[bytes]:
+        """
+        逐段、逐批產生 UTF-8 編碼的 blockMeshDict 內容
+
+        先建立中間表示，再每次只格式化 EMIT_CHUNK_ROWS 列，
+        文字部分的記憶體用量與總層數無關，可直接寫入管線、socket 或壓縮串流。
+
+        Args:
+            inner_samples: 內曲線採樣點（PointCloud 或 [[x, y, z], ...]）
+            outer_samples: 外曲線採樣點（PointCloud 或 [[x, y, z], ...]）
+            progress: 進度回報器（可選）
+
+        Yields:
+            bytes: 編碼後的文字區塊
+        """
+        if progress is None:
+            progress = ProgressReporter()
+
+        mesh = self.build_mesh(inner_samples, outer_samples)
+        if self.compact:
+            sections = iter_compact_dict(mesh, progress)
+        elif self.mesh_params.axisymmetric:
+            sections = self._iter_annotated_wedge(mesh, progress)
         else:
-            self._generate_standard(inner_samples, outer_samples, output_file)
+            sections = self._iter_annotated(mesh, progress)
+
+        for text in sections:
+            yield text.encode("utf-8")
 
-    def _generate_standard(
+    def build_mesh(
         self,
-        inner_samples: List[List[float]],
-        outer_samples: List[List[float]],
-        output_file: str | Path,
-    ) -> None:
-        """生成標準 blockMeshDict（無邊界層）"""
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+    ) -> BlockMesh:
+        """
+        建立中間表示（每次生成只計算一次，所有輸出皆走訪此結果）
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            # 寫入檔案頭
-            f.write(self.HEADER_TEMPLATE.format(scale=self.mesh_params.scale_factor))
+        Args:
+            inner_samples: 內曲線採樣點（PointCloud 或 [[x, y, z], ...]）
+            outer_samples: 外曲線採樣點（PointCloud 或 [[x, y, z], ...]）
 
-            # 寫入頂點
-            self._write_vertices(f, inner_samples, outer_samples)
+        Returns:
+            BlockMesh: 每層 8 個頂點、8 段圓弧，相鄰兩層之間 4 個 hex 塊
+            （軸對稱模式為每層 4 個頂點、2 段圓弧，相鄰兩層之間 1 個楔形塊）；
+            啟用邊界層時徑向為多段漸變
+        """
+        inner_samples = PointCloud.coerce(inner_samples)
+        outer_samples = PointCloud.coerce(outer_samples)
 
-            # 寫入單元塊
-            self._write_blocks(f, len(inner_samples))
+        if self.mesh_params.axisymmetric:
+            mesh = self._build_wedge(inner_samples, outer_samples)
+        else:
+            mesh = self._build_standard(inner_samples, outer_samples)
+        return self._apply_boundary_layer(mesh)
 
-            # 寫入邊緣
-            self._write_edges(f, inner_samples, outer_samples)
+    def boundary_layer_grading(self) -> Optional[MultiGrading]:
+        """
+        邊界層的徑向多段漸變
 
-            # 寫入邊界
-            self._write_boundaries(f, len(inner_samples))
+        邊界層厚度為相對於徑向距離的比例，各層的內外壁間距不同，
+        但分割比例相同，所有塊共用同一組多段漸變。
+        徑向總網格數為 n_cells_radial（中段）加上內外壁邊界層層數。
 
-            # 結束檔案
-            f.write(");\n\nmergePatchPairs\n(\n);\n\n")
-            f.write(
-                "// ************************************************************************* //\n"
-            )
+        Returns:
+            Optional[MultiGrading]: 未啟用邊界層時為 None
+        """
+        bl = self.bl_params
+        if not bl.enabled:
+            return None
+        return layer_grading(
+            self.mesh_params.n_cells_radial,
+            bl.inner_thickness,
+            bl.inner_layers,
+            bl.outer_thickness,
+            bl.outer_layers,
+            bl.expansion_ratio,
+        )
 
-    def _write_vertices(
-        self, f, inner_samples: List[List[float]], outer_samples: List[List[float]]
-    ) -> None:
-        """寫入頂點定義"""
-        f.write("vertices\n(\n")
-
-        for i, (inner, outer) in enumerate(zip(inner_samples, outer_samples)):
-            z = inner[2]
-            inner_r = inner[0]
-            outer_r = outer[0]
-
-            # 內圈頂點（4個，90度間隔）
-            f.write(f"    // 層 {i + 1} - 內圈頂點，z = {z:.3f}\n")
-            f.write(f"    ({inner_r:.6f}  0.000000  {z:.6f})  // 頂點 {i * 8 + 0}\n")
-            f.write(f"    (0.000000  {inner_r:.6f}  {z:.6f})  // 頂點 {i * 8 + 1}\n")
-            f.write(f"    ({-inner_r:.6f}  0.000000  {z:.6f})  // 頂點 {i * 8 + 2}\n")
-            f.write(f"    (0.000000  {-inner_r:.6f}  {z:.6f})  // 頂點 {i * 8 + 3}\n")
-
-            # 外圈頂點（4個，90度間隔）
-            f.write(f"    // 層 {i + 1} - 外圈頂點，z = {z:.3f}\n")
-            f.write(f"    ({outer_r:.6f}  0.000000  {z:.6f})  // 頂點 {i * 8 + 4}\n")
-            f.write(f"    (0.000000  {outer_r:.6f}  {z:.6f})  // 頂點 {i * 8 + 5}\n")
-            f.write(f"    ({-outer_r:.6f}  0.000000  {z:.6f})  // 頂點 {i * 8 + 6}\n")
-            f.write(f"    (0.000000  {-outer_r:.6f}  {z:.6f})  // 頂點 {i * 8 + 7}\n")
-
-        f.write(");\n\n")
-
-    def _write_blocks(self, f, num_layers: int) -> None:
-        """寫入單元塊定義"""
-        f.write("blocks\n(\n")
-
-        n_radial = self.mesh_params.n_cells_radial
-        n_circum_quad = self.mesh_params.n_cells_circum // 4
-        n_axial = self.mesh_params.n_cells_axial
-
-        for i in range(num_layers - 1):
-            f.write(f"    // 連接層 {i + 1} 和層 {i + 2} 的塊\n")
-
-            # 四個象限的 hex 塊
-            for quad in range(4):
-                v0 = i * 8 + quad
-                v1 = i * 8 + (quad + 1) % 4
-                v4 = i * 8 + 4 + quad
-                v5 = i * 8 + 4 + (quad + 1) % 4
-                v0n = (i + 1) * 8 + quad
-                v1n = (i + 1) * 8 + (quad + 1) % 4
-                v4n = (i + 1) * 8 + 4 + quad
-                v5n = (i + 1) * 8 + 4 + (quad + 1) % 4
-
-                f.write(f"    hex ({v0} {v4} {v5} {v1} {v0n} {v4n} {v5n} {v1n}) ")
-                f.write(
-                    f"({n_radial} {n_circum_quad} {n_axial}) simpleGrading (1 1 1)\n"
-                )
+    def _apply_boundary_layer(self, mesh: BlockMesh) -> BlockMesh:
+        """
+        將邊界層套用為各塊徑向（第 1 方向，內壁至外壁）的多段漸變
 
-        f.write(");\n\n")
+        不增加頂點與塊，只改變徑向網格數與分佈。
+        """
+        grading = self.boundary_layer_grading()
+        if grading is not None:
+            mesh.cells[:, 0] = grading.n_cells
+            mesh.multi_grading[0] = grading.sections
+        return mesh
 
-    def _write_edges(
-        self, f, inner_samples: List[List[float]], outer_samples: List[List[float]]
-    ) -> None:
-        """寫入邊緣定義（圓弧）"""
-        f.write("edges\n(\n")
+    def write_to(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+        fileobj: BinaryIO,
+        progress: Optional[ProgressReporter] = None,
+    ) -> int:
+        """
+        將 blockMeshDict 串流寫入二進位檔案物件
 
-        sqrt_half = math.sqrt(0.5)
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
+            fileobj: 二進位寫入物件（檔案、管線、gzip 串流等）
+            progress: 進度回報器（可選）
 
-        for i, (inner, outer) in enumerate(zip(inner_samples, outer_samples)):
-            z = inner[2]
-            inner_r = inner[0]
-            outer_r = outer[0]
+        Returns:
+            int: 寫入的位元組數
+        """
+        return write_chunks(
+            self.iter_chunks(inner_samples, outer_samples, progress), fileobj
+        )
 
-            inner_diag = inner_r * sqrt_half
-            outer_diag = outer_r * sqrt_half
+    def to_bytes(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+    ) -> bytes:
+        """取得完整的 blockMeshDict 內容（UTF-8）"""
+        return b"".join(self.iter_chunks(inner_samples, outer_samples))
 
-            # 內圈弧
-            f.write(f"    // 層 {i + 1} - 內圈弧，z = {z:.3f}\n")
-            f.write(
-                f"    arc {i * 8 + 0} {i * 8 + 1} ({inner_diag:.6f} {inner_diag:.6f} {z:.6f})\n"
-            )
-            f.write(
-                f"    arc {i * 8 + 1} {i * 8 + 2} ({-inner_diag:.6f} {inner_diag:.6f} {z:.6f})\n"
-            )
-            f.write(
-                f"    arc {i * 8 + 2} {i * 8 + 3} ({-inner_diag:.6f} {-inner_diag:.6f} {z:.6f})\n"
-            )
-            f.write(
-                f"    arc {i * 8 + 3} {i * 8 + 0} ({inner_diag:.6f} {-inner_diag:.6f} {z:.6f})\n"
-            )
+    def to_path(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+        output_file: str | Path,
+        progress: Optional[ProgressReporter] = None,
+    ) -> Path:
+        """
+        將 blockMeshDict 串流寫入檔案（原子取代；設定 compresslevel 時以 gzip 壓縮）
 
-            # 外圈弧
-            f.write(f"    // 層 {i + 1} - 外圈弧，z = {z:.3f}\n")
-            f.write(
-                f"    arc {i * 8 + 4} {i * 8 + 5} ({outer_diag:.6f} {outer_diag:.6f} {z:.6f})\n"
-            )
-            f.write(
-                f"    arc {i * 8 + 5} {i * 8 + 6} ({-outer_diag:.6f} {outer_diag:.6f} {z:.6f})\n"
-            )
-            f.write(
-                f"    arc {i * 8 + 6} {i * 8 + 7} ({-outer_diag:.6f} {-outer_diag:.6f} {z:.6f})\n"
-            )
-            f.write(
-                f"    arc {i * 8 + 7} {i * 8 + 4} ({outer_diag:.6f} {-outer_diag:.6f} {z:.6f})\n"
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
+            output_file: 輸出檔案路徑
+            progress: 進度回報器（可選）
+
+        Returns:
+            Path: 輸出檔案路徑
+        """
+        output_path = Path(output_file)
+        with atomic_output(output_path, binary=True) as f:
+            write_chunks(self._file_chunks(inner_samples, outer_samples, progress), f)
+        return output_path
+
+    def update_path(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+        output_file: str | Path,
+        progress: Optional[ProgressReporter] = None,
+    ) -> bool:
+        """
+        僅在內容改變時寫入檔案（內容相同時保留原檔與其修改時間）
+
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
+            output_file: 輸出檔案路徑
+            progress: 進度回報器（可選）
+
+        Returns:
+            bool: 檔案是否改變
+        """
+        return write_if_changed(
+            self._file_chunks(inner_samples, outer_samples, progress), output_file
+        )
+
+    def _file_chunks(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+        progress: Optional[ProgressReporter],
+    ) -> Iterable[bytes]:
+        """寫入檔案的區塊（依 compresslevel 壓縮）"""
+        return encode_output(
+            self.iter_chunks(inner_samples, outer_samples, progress), self.compresslevel
+        )
+
+    def consolidate(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+    ) -> Consolidation:
+        """
+        依 merge_tolerance 合併內外壁半徑共線的連續層
+
+        axial_edge_points 大於 0 時，取樣點每隔 axial_edge_points + 1 個為一層，
+        其間為曲線邊的中間點。
+
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
+
+        Returns:
+            Consolidation: 保留的層與省下的塊數（merge_tolerance 為 0 時不合併）
+        """
+        inner_samples = PointCloud.coerce(inner_samples)
+        outer_samples = PointCloud.coerce(outer_samples)
+        stride = self.mesh_params.edge_stride
+        if (len(inner_samples) - 1) % stride:
+            raise ValueError(
+                f"取樣點數 {len(inner_samples)} 與曲線邊中間點數 "
+                f"{self.mesh_params.axial_edge_points} 不符"
             )
+        num_layers = (len(inner_samples) - 1) // stride + 1
+        tolerance = self.mesh_params.merge_tolerance
+        if tolerance <= 0:
+            return Consolidation(np.arange(num_layers), num_layers)
+        radii = np.stack([inner_samples.x, outer_samples.x])
+        return consolidate_layers(inner_samples.z, radii, tolerance, stride)
+
+    def build_polymesh(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+    ) -> PolyMesh:
+        """
+        由中間表示直接展開為 polyMesh（結果與 blockMesh 展開 blockMeshDict 相同）
 
-        f.write(");\n\n")
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
 
-    def _write_boundaries(self, f, num_layers: int) -> None:
-        """寫入邊界定義"""
-        f.write("boundary\n(\n")
+        Returns:
+            PolyMesh: 環形流道的 polyMesh
 
-        # 入口邊界
-        f.write("    inlet\n    {\n        type patch;\n        faces\n        (\n")
-        f.write("            // 底面（第一層）\n")
-        for quad in range(4):
-            v0 = quad
-            v1 = (quad + 1) % 4
-            v4 = 4 + quad
-            v5 = 4 + (quad + 1) % 4
-            f.write(f"            ({v0} {v4} {v5} {v1})\n")
-        f.write("        );\n    }\n")
-
-        # 出口邊界
-        last = num_layers - 1
-        f.write("    outlet\n    {\n        type patch;\n        faces\n        (\n")
-        f.write("            // 頂面（最後一層）\n")
-        for quad in range(4):
-            v0 = last * 8 + quad
-            v1 = last * 8 + (quad + 1) % 4
-            v4 = last * 8 + 4 + quad
-            v5 = last * 8 + 4 + (quad + 1) % 4
-            f.write(f"            ({v0} {v1} {v5} {v4})\n")
-        f.write("        );\n    }\n")
-
-        # 內壁邊界
-        f.write("    innerWall\n    {\n        type wall;\n        faces\n        (\n")
-        for i in range(num_layers - 1):
-            for quad in range(4):
-                v0 = i * 8 + quad
-                v1 = i * 8 + (quad + 1) % 4
-                v0n = (i + 1) * 8 + quad
-                v1n = (i + 1) * 8 + (quad + 1) % 4
-                f.write(f"            ({v0} {v1} {v1n} {v0n})\n")
-        f.write("        );\n    }\n")
-
-        # 外壁邊界
-        f.write("    outerWall\n    {\n        type wall;\n        faces\n        (\n")
-        for i in range(num_layers - 1):
-            for quad in range(4):
-                v4 = i * 8 + 4 + quad
-                v5 = i * 8 + 4 + (quad + 1) % 4
-                v4n = (i + 1) * 8 + 4 + quad
-                v5n = (i + 1) * 8 + 4 + (quad + 1) % 4
-                f.write(f"            ({v4} {v4n} {v5n} {v5})\n")
-        f.write("        );\n    }\n")
-
-    def _calculate_layer_ratios(
-        self, num_layers: int, expansion_ratio: float
-    ) -> List[float]:
-        """計算邊界層各層的累積比例"""
-        if num_layers == 1:
-            return [1.0]
-
-        layer_thicknesses = [1.0]
-        for i in range(1, num_layers):
-            layer_thicknesses.append(layer_thicknesses[-1] * expansion_ratio)
-
-        total = sum(layer_thicknesses)
-
-        cumulative = 0.0
-        ratios = []
-        for t in layer_thicknesses:
-            cumulative += t
-            ratios.append(cumulative / total)
-
-        return ratios
-
-    def _calculate_boundary_layer_points(
-        self, inner_samples: List[List[float]], outer_samples: List[List[float]]
-    ) -> Tuple[List[List[List[float]]], List[List[List[float]]]]:
-        """計算邊界層點位"""
-        inner_bl_samples = []
-        outer_bl_samples = []
-
-        inner_ratios = self._calculate_layer_ratios(
-            self.bl_params.inner_layers, self.bl_params.expansion_ratio
+        Raises:
+            ValueError: 軸對稱楔形模式，或各塊的網格數、漸變不一致（非單一結構網格）
+        """
+        if self.mesh_params.axisymmetric:
+            raise ValueError("polyMesh 直接輸出只支援完整 360° 環形")
+        mesh = self.build_mesh(inner_samples, outer_samples)
+        uniform = np.all(mesh.cells[:, :2] == mesh.cells[0, :2]) and np.all(
+            mesh.grading == mesh.grading[0]
         )
-        outer_ratios = self._calculate_layer_ratios(
-            self.bl_params.outer_layers, self.bl_params.expansion_ratio
+        if not uniform or set(mesh.multi_grading) - {0}:
+            raise ValueError("polyMesh 直接輸出需要各塊的徑向、圓周網格數與漸變一致")
+
+        # 每層頂點 0 為內圈 0°、頂點 4 為外圈 0°；軸向網格數可逐段不同（合併塊）
+        layers = mesh.vertices.reshape(-1, 8, 3)
+        profile = None
+        if len(mesh.curve_edges):
+            # 曲線邊：軸向站位的半徑改由經過中間點的取樣剖面內插
+            inner_samples = PointCloud.coerce(inner_samples)
+            outer_samples = PointCloud.coerce(outer_samples)
+            profile = (inner_samples.z, inner_samples.x, outer_samples.x)
+        n_radial, n_quarter = mesh.cells[0, :2].tolist()
+        radial_grading, _, axial_grading = mesh.grading[0].tolist()
+        return annulus_polymesh(
+            layers[:, 0, 0],
+            layers[:, 4, 0],
+            layers[:, 0, 2],
+            n_radial,
+            4 * n_quarter,
+            mesh.cells[::4, 2],
+            radial_grading=mesh.multi_grading.get(0, radial_grading),
+            axial_grading=axial_grading,
+            scale=mesh.scale,
+            profile=profile,
         )
 
-        for inner_pt, outer_pt in zip(inner_samples, outer_samples):
-            inner_x, _, z = inner_pt
-            outer_x = outer_pt[0]
+    def write_polymesh(
+        self,
+        inner_samples: PointCloud | ArrayLike,
+        outer_samples: PointCloud | ArrayLike,
+        case_dir: str | Path,
+        fmt: str = FORMAT_ASCII,
+        progress: Optional[ProgressReporter] = None,
+    ) -> Path:
+        """
+        直接寫出 <case_dir>/constant/polyMesh，不需再執行 blockMesh
 
-            radial_distance = outer_x - inner_x
-            inner_bl_thickness = radial_distance * self.bl_params.inner_thickness
-            outer_bl_thickness = radial_distance * self.bl_params.outer_thickness
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
+            case_dir: OpenFOAM 算例目錄
+            fmt: "ascii" 或 "binary"
+            progress: 進度回報器（可選）
+
+        Returns:
+            Path: polyMesh 目錄
+        """
+        polymesh = self.build_polymesh(inner_samples, outer_samples)
+        polymesh_dir = Path(case_dir) / POLYMESH_LOCATION
+        return write_polymesh(polymesh, polymesh_dir, fmt, progress)
+
+    def _build_standard(
+        self, inner_samples: PointCloud, outer_samples: PointCloud
+    ) -> BlockMesh:
+        """建立完整 360° 流道網格的中間表示（徑向均勻，邊界層另行套用）"""
+        consolidation, z, radii = self._layer_radii(inner_samples, outer_samples)
+        num_layers = len(z)
+
+        # 頂點：每層內圈 4 點、外圈 4 點，依 0°、90°、180°、270° 排列
+        vertices = np.zeros((num_layers, 8, 3))
+        vertices[:, :, 2] = z[:, None]
+        for wall, r in enumerate(radii):
+            base = 4 * wall
+            vertices[:, base, 0] = r
+            vertices[:, base + 1, 1] = r
+            vertices[:, base + 2, 0] = -r
+            vertices[:, base + 3, 1] = -r
+
+        # 圓弧：每層內圈 4 段、外圈 4 段，中點位於各象限 45° 方向
+        layer_base = 8 * np.arange(num_layers)
+        quads = np.arange(4)
+        signs = np.array(ARC_SIGNS, dtype=np.float64)
+        arc_edges = np.empty((num_layers, 8, 2), dtype=np.int64)
+        arc_points = np.empty((num_layers, 8, 3))
+        arc_points[:, :, 2] = z[:, None]
+        for wall, r in enumerate(radii):
+            arcs = slice(4 * wall, 4 * wall + 4)
+            arc_edges[:, arcs, 0] = layer_base[:, None] + 4 * wall + quads
+            arc_edges[:, arcs, 1] = layer_base[:, None] + 4 * wall + (quads + 1) % 4
+            d = r * math.sqrt(0.5)
+            arc_points[:, arcs, :2] = d[:, None, None] * signs
+
+        # 相鄰兩層之間的 hex 塊與側壁面
+        pair_base = layer_base[:-1, None, None]
+        blocks = pair_base + np.array(HEX_OFFSETS)
+        n_blocks = 4 * (num_layers - 1)
+
+        params = self.mesh_params
+        cells = np.tile(
+            [params.n_cells_radial, params.n_cells_circum // 4, params.n_cells_axial],
+            (n_blocks, 1),
+        )
+        cells[:, 2] *= np.repeat(consolidation.spans, 4)
+
+        last = 8 * (num_layers - 1)
+        inner_wall = pair_base + np.array(INNER_WALL_FACES)
+        outer_wall = pair_base + np.array(OUTER_WALL_FACES)
+        patches = [
+            Patch("inlet", "patch", np.array(INLET_FACES)),
+            Patch("outlet", "patch", last + np.array(OUTLET_FACES)),
+            Patch("innerWall", "wall", inner_wall.reshape(-1, 4)),
+            Patch("outerWall", "wall", outer_wall.reshape(-1, 4)),
+        ]
+
+        curve_edges, curve_points = self._build_curve_edges(
+            inner_samples,
+            outer_samples,
+            consolidation,
+            np.repeat([0, 1], 4),
+            np.tile(QUAD_DIRECTIONS, (2, 1)),
+        )
+
+        return BlockMesh(
+            vertices=vertices.reshape(-1, 3),
+            blocks=blocks.reshape(-1, 8),
+            cells=cells,
+            grading=np.ones((n_blocks, 3)),
+            arc_edges=arc_edges.reshape(-1, 2),
+            arc_points=arc_points.reshape(-1, 3),
+            curve_edges=curve_edges,
+            curve_points=curve_points,
+            curve_type=params.axial_edge_type,
+            patches=patches,
+            scale=params.scale_factor,
+        )
+
+    def _layer_radii(
+        self, inner_samples: PointCloud, outer_samples: PointCloud
+    ) -> Tuple[Consolidation, NDArray, Tuple[NDArray, NDArray]]:
+        """
+        合併半徑共線的連續層，取出保留層的 Z 與內外壁半徑
+
+        Returns:
+            Tuple: (合併結果, 各層 Z, (內壁半徑, 外壁半徑))
+        """
+        # 合併塊的軸向網格數為各段之和
+        consolidation = self.consolidate(inner_samples, outer_samples)
+        keep = consolidation.keep * self.mesh_params.edge_stride
+        z = inner_samples.z.astype(np.float64)[keep]
+        radii = (
+            inner_samples.x.astype(np.float64)[keep],
+            outer_samples.x.astype(np.float64)[keep],
+        )
+        return consolidation, z, radii
 
-            # 內壁邊界層點位
-            inner_layer_pts = [[inner_x, 0.0, z]]
-            for ratio in inner_ratios:
-                x = inner_x + ratio * inner_bl_thickness
-                inner_layer_pts.append([x, 0.0, z])
-            inner_bl_samples.append(inner_layer_pts)
+    def _build_wedge(
+        self, inner_samples: PointCloud, outer_samples: PointCloud
+    ) -> BlockMesh:
+        """
+        建立軸對稱楔形流道的中間表示
 
-            # 外壁邊界層點位
-            outer_layer_pts = [[outer_x, 0.0, z]]
-            for ratio in outer_ratios:
-                x = outer_x - ratio * outer_bl_thickness
-                outer_layer_pts.append([x, 0.0, z])
-            outer_bl_samples.append(outer_layer_pts)
+        流道只使用半徑，軸對稱計算只需圓周方向 1 格、張角 WEDGE_ANGLE 的扇形：
+        每層 4 個頂點，內外壁各一段圓弧，相鄰兩層之間 1 個 hex 塊，
+        兩側切面為 wedge 類型的 front、back patch。
+        """
+        consolidation, z, radii = self._layer_radii(inner_samples, outer_samples)
+        num_layers = len(z)
+        half = math.radians(WEDGE_ANGLE / 2)
+        directions = np.array(
+            [(math.cos(half), -math.sin(half)), (math.cos(half), math.sin(half))] * 2
+        )
 
-        return inner_bl_samples, outer_bl_samples
+        # 頂點與圓弧：圓弧中點位於 0°（xz 平面）
+        vertices = np.empty((num_layers, 4, 3))
+        vertices[:, :, 2] = z[:, None]
+        arc_points = np.zeros((num_layers, 2, 3))
+        arc_points[:, :, 2] = z[:, None]
+        for wall, r in enumerate(radii):
+            ring = slice(2 * wall, 2 * wall + 2)
+            vertices[:, ring, :2] = r[:, None, None] * directions[ring]
+            arc_points[:, wall, 0] = r
+        layer_base = 4 * np.arange(num_layers)
+        arc_edges = layer_base[:, None, None] + np.array([(0, 1), (2, 3)])
+
+        params = self.mesh_params
+        pair_base = layer_base[:-1, None]
+        n_blocks = num_layers - 1
+        cells = np.tile([params.n_cells_radial, 1, params.n_cells_axial], (n_blocks, 1))
+        cells[:, 2] *= consolidation.spans
+
+        last = 4 * (num_layers - 1)
+        patches = [
+            Patch("inlet", "patch", np.array([WEDGE_FACES["inlet"]])),
+            Patch("outlet", "patch", last + np.array([WEDGE_FACES["outlet"]])),
+        ]
+        patches += [
+            Patch(name, patch_type, pair_base + np.array(WEDGE_FACES[name]))
+            for name, patch_type in (
+                ("innerWall", "wall"),
+                ("outerWall", "wall"),
+                ("front", "wedge"),
+                ("back", "wedge"),
+            )
+        ]
+
+        curve_edges, curve_points = self._build_curve_edges(
+            inner_samples,
+            outer_samples,
+            consolidation,
+            np.repeat([0, 1], 2),
+            directions,
+        )
 
-    def _generate_with_boundary_layer(
+        return BlockMesh(
+            vertices=vertices.reshape(-1, 3),
+            blocks=pair_base + np.array(WEDGE_HEX),
+            cells=cells,
+            grading=np.ones((n_blocks, 3)),
+            arc_edges=arc_edges.reshape(-1, 2),
+            arc_points=arc_points.reshape(-1, 3),
+            curve_edges=curve_edges,
+            curve_points=curve_points,
+            curve_type=params.axial_edge_type,
+            patches=patches,
+            scale=params.scale_factor,
+        )
+
+    def _build_curve_edges(
         self,
-        inner_samples: List[List[float]],
-        outer_samples: List[List[float]],
-        inner_bl_samples: List[List[List[float]]],
-        outer_bl_samples: List[List[List[float]]],
-        output_file: str | Path,
-    ) -> None:
-        """生成包含邊界層的 blockMeshDict"""
-        # 暫時使用標準生成（完整邊界層實作較複雜）
-        # TODO: 完整實作邊界層網格生成
-        self._generate_standard(inner_samples, outer_samples, output_file)
+        inner_samples: PointCloud,
+        outer_samples: PointCloud,
+        consolidation: Consolidation,
+        walls: NDArray,
+        directions: ArrayLike,
+    ) -> Tuple[NDArray, NDArray]:
+        """
+        建立相鄰兩層之間沿 Z 的曲線邊
+
+        每對未合併的相鄰層中，每個頂點各有一條曲線邊，
+        中間點取自兩層之間的取樣點，依頂點的方向旋轉；
+        合併塊的段內取樣點與首尾共線，保持直線邊。
+
+        Args:
+            inner_samples: 內曲線採樣點
+            outer_samples: 外曲線採樣點
+            consolidation: 塊合併結果
+            walls: 每層各頂點所在壁面（0 內壁、1 外壁），形狀 (V,)
+            directions: 每層各頂點的方向 (cos, sin)，形狀 (V, 2)
+
+        Returns:
+            Tuple[NDArray, NDArray]: 形狀 (C, 2) 的端點索引與 (C, K, 3) 的中間點
+        """
+        n_points = self.mesh_params.axial_edge_points
+        pairs = np.flatnonzero(consolidation.spans == 1)
+        if n_points == 0 or len(pairs) == 0:
+            return np.empty((0, 2), np.int64), np.empty((0, n_points, 3))
+
+        # 第 p 對的中間點為取樣點 p·stride + 1 ~ p·stride + K（p 為保留層的序號）
+        stride = n_points + 1
+        samples = consolidation.keep[pairs, None] * stride + np.arange(1, stride)
+        z = inner_samples.z.astype(np.float64)[samples]
+        radii = (
+            inner_samples.x.astype(np.float64)[samples],
+            outer_samples.x.astype(np.float64)[samples],
+        )
+
+        # 各頂點的半徑取自所在壁面，再乘上方向
+        n_ring = len(walls)
+        directions = np.asarray(directions, dtype=np.float64)
+        r = np.stack(radii)[walls].transpose(1, 0, 2)
+        points = np.empty((len(pairs), n_ring, n_points, 3))
+        points[..., :2] = r[..., None] * directions[:, None, :]
+        points[..., 2] = z[:, None, :]
+
+        ends = n_ring * pairs[:, None] + np.arange(n_ring)
+        edges = np.stack([ends, ends + n_ring], axis=-1)
+        return edges.reshape(-1, 2), points.reshape(-1, n_points, 3)
+
+    def _iter_annotated(
+        self, mesh: BlockMesh, progress: ProgressReporter
+    ) -> Iterator[str]:
+        """走訪中間表示，產生含逐層註解的 blockMeshDict"""
+        num_layers = mesh.n_vertices // 8
+
+        # 檔案頭
+        yield self.HEADER_TEMPLATE.format(scale=mesh.scale)
+
+        # 頂點
+        yield from self._iter_vertices(mesh, num_layers, progress)
+
+        # 單元塊
+        yield from self._iter_blocks(mesh, num_layers - 1, progress)
+
+        # 邊緣
+        yield from self._iter_edges(mesh, num_layers, progress)
+
+        # 邊界
+        yield from self._iter_boundaries(mesh, num_layers - 1, progress)
+
+        # 結束檔案
+        yield FOOTER
+        yield END_BANNER
+
+    def _iter_annotated_wedge(
+        self, mesh: BlockMesh, progress: ProgressReporter
+    ) -> Iterator[str]:
+        """走訪楔形中間表示，產生固定小數位數的 blockMeshDict"""
+        yield self.HEADER_TEMPLATE.format(scale=mesh.scale)
+        yield (
+            f"// 軸對稱楔形：張角 {WEDGE_ANGLE:g}°，每層 4 個頂點，"
+            "front、back 為 wedge patch\n\n"
+        )
+        yield from iter_dict_body(mesh, progress, compact=False)
+        yield END_BANNER
+
+    def _iter_vertices(
+        self, mesh: BlockMesh, num_layers: int, progress: ProgressReporter
+    ) -> Iterator[str]:
+        """產生頂點定義"""
+        yield "vertices\n(\n"
+        yield from iter_rows(
+            VERTEX_LAYER_TEMPLATE,
+            _vertex_order(),
+            lambda lo, hi: _layer_fields(mesh, lo, hi, radius=True),
+            num_layers,
+            progress,
+            0,
+            30,
+            "stage_vertices",
+        )
+        yield ");\n\n"
+
+    def _iter_blocks(
+        self, mesh: BlockMesh, num_pairs: int, progress: ProgressReporter
+    ) -> Iterator[str]:
+        """產生單元塊定義（每列為相鄰兩層之間的 4 個塊）"""
+
+        def pair_fields(lo: int, hi: int) -> NDArray:
+            layers = list(map(str, range(lo + 1, hi + 2)))
+            labels = np.array([layers[:-1], layers[1:]], dtype=object).T
+            blocks = block_fields(mesh, 4 * lo, 4 * hi).reshape(hi - lo, 4 * HEX_FIELDS)
+            return np.hstack([labels, blocks])
+
+        yield "blocks\n(\n"
+        yield from iter_rows(
+            BLOCK_PAIR_TEMPLATE,
+            range(2 + 4 * HEX_FIELDS),
+            pair_fields,
+            num_pairs,
+            progress,
+            30,
+            45,
+            "stage_blocks",
+        )
+        yield ");\n\n"
+
+    def _iter_edges(
+        self, mesh: BlockMesh, num_layers: int, progress: ProgressReporter
+    ) -> Iterator[str]:
+        """產生邊緣定義（圓弧，以及各塊沿 Z 的曲線邊）"""
+        arcs_end = 70 if len(mesh.curve_edges) else 85
+        yield "edges\n(\n"
+        yield from iter_rows(
+            EDGE_LAYER_TEMPLATE,
+            _edge_order(),
+            lambda lo, hi: _layer_fields(mesh, lo, hi, diag=True),
+            num_layers,
+            progress,
+            45,
+            arcs_end,
+            "stage_edges",
+        )
+        if len(mesh.curve_edges):
+            yield f"    // 軸向 {mesh.curve_type} 邊（中間點取自量測曲線）\n"
+            yield from iter_curve_edges(mesh, progress, arcs_end, 85, compact=False)
+        yield ");\n\n"
+
+    def _iter_boundaries(
+        self, mesh: BlockMesh, num_pairs: int, progress: ProgressReporter
+    ) -> Iterator[str]:
+        """產生邊界定義（側壁每列為相鄰兩層之間的 4 個面）"""
+        progress.report(85, "stage_boundary")
+        yield "boundary\n(\n"
+
+        face_lines = FACE_LINE * 4
+        comments = {
+            "inlet": "            // 底面（第一層）\n",
+            "outlet": "            // 頂面（最後一層）\n",
+        }
+        ranges = {"innerWall": (85, 92), "outerWall": (92, 100)}
+
+        for patch in mesh.patches:
+            head, tail = patch_text(patch.name, patch.type)
+            yield head
+            if patch.name in comments:
+                yield comments[patch.name]
+                yield face_lines % tuple(map(str, patch.faces.ravel().tolist()))
+            else:
+                start, end = ranges[patch.name]
+                yield from iter_rows(
+                    face_lines,
+                    range(16),
+                    lambda lo, hi, faces=patch.faces: int_fields(
+                        faces[4 * lo : 4 * hi].reshape(hi - lo, 16)
+                    ),
+                    num_pairs,
+                    progress,
+                    start,
+                    end,
+                    "stage_boundary",
+                )
+            yield tail
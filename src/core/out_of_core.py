@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+超出記憶體的點位資料分塊處理模組
+
+流程：
+1. 第一遍分塊讀取，線上累積統計（最小/最大值、平均 X、點數）
+2. 第二遍依平均 X 將每塊分為內外曲線，各自依 Z 排序後寫成排序段 (.npy)
+3. 外部合併排序，將排序段合併寫入記憶體映射的 (3, N) 欄位檔案，
+   內曲線在前、外曲線在後
+
+記憶體用量只與分塊大小成正比，與資料總量無關。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from ..models.point_cloud import PointCloud
+from .data_reader import DataStatistics
+
+# 預設每塊列數
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+# 合併時每個排序段每次讀取的最少列數
+MIN_MERGE_BLOCK = 4096
+
+
+class OnlineStatistics:
+    """線上累積的點位統計"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.minimum = np.full(3, np.inf)
+        self.maximum = np.full(3, -np.inf)
+
+    def update(self, chunk: NDArray) -> None:
+        """加入一塊點位"""
+        n = len(chunk)
+        if n == 0:
+            return
+
+        # 以區塊平均值更新整體平均，避免大量累加的精度損失
+        self.count += n
+        self.mean_x += (float(chunk[:, 0].mean()) - self.mean_x) * n / self.count
+        np.minimum(self.minimum, chunk.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, chunk.max(axis=0), out=self.maximum)
+
+    def to_statistics(self, inner_points: int, outer_points: int) -> DataStatistics:
+        """轉換為 DataStatistics"""
+        if self.count == 0:
+            raise ValueError("沒有任何點位資料")
+
+        return DataStatistics(
+            total_points=self.count,
+            inner_points=inner_points,
+            outer_points=outer_points,
+            x_range=(float(self.minimum[0]), float(self.maximum[0])),
+            y_range=(float(self.minimum[1]), float(self.maximum[1])),
+            z_range=(float(self.minimum[2]), float(self.maximum[2])),
+            avg_x=float(self.mean_x),
+        )
+
+
+def merge_sorted_runs(
+    runs: List[Path], output: NDArray, block_rows: int = DEFAULT_CHUNK_ROWS
+) -> None:
+    """
+    外部合併依 Z 排序的排序段
+
+    每輪自各排序段讀取一個區塊，以「仍有後續資料的排序段中，
+    區塊最後一個 Z 值的最小者」為界，輸出所有不超過該值的點位。
+    每輪至少有一個排序段前進一整個區塊。
+
+    Args:
+        runs: 排序段 .npy 檔案（各自為依 Z 排序的 (n, 3) 陣列）
+        output: 寫入目標，形狀為 (3, 各排序段總點數) 的欄位陣列
+        block_rows: 所有排序段每輪合計讀取的列數
+    """
+    sources = [np.load(run, mmap_mode="r") for run in runs]
+    total = sum(len(source) for source in sources)
+    if output.shape != (3, total):
+        raise ValueError(f"輸出形狀應為 (3, {total})，目前為 {output.shape}")
+
+    block = max(MIN_MERGE_BLOCK, block_rows // max(len(sources), 1))
+    cursors = [0] * len(sources)
+    written = 0
+
+    while written < total:
+        windows = [
+            source[cursor : cursor + block] for source, cursor in zip(sources, cursors)
+        ]
+
+        # 決定本輪可安全輸出的 Z 上限
+        limit = np.inf
+        for source, cursor, window in zip(sources, cursors, windows):
+            if cursor + len(window) < len(source):
+                limit = min(limit, float(window[-1, 2]))
+
+        taken = []
+        for i, window in enumerate(windows):
+            if len(window) == 0:
+                continue
+            n = int(np.searchsorted(window[:, 2], limit, side="right"))
+            if n:
+                taken.append(window[:n])
+                cursors[i] += n
+
+        merged = np.concatenate(taken)
+        merged = merged[np.argsort(merged[:, 2], kind="stable")]
+        output[:, written : written + len(merged)] = merged.T
+        written += len(merged)
+
+
+@dataclass
+class ChunkedResult:
+    """分塊處理結果（記憶體映射）"""
+
+    # 內曲線在前、外曲線在後，各段依 Z 排序
+    points: PointCloud
+
+    # 內曲線點數（分段位置）
+    n_inner: int
+
+    statistics: DataStatistics
+
+
+def chunked_ingest(
+    chunks: Callable[[], Iterable[NDArray]],
+    work_dir: str | Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    dtype: DTypeLike = np.float64,
+) -> ChunkedResult:
+    """
+    分塊處理點位資料
+
+    Args:
+        chunks: 每次呼叫都重新產生點位區塊的函數（需讀取兩遍）
+        work_dir: 排序段與輸出 points.npy 的目錄
+        chunk_rows: 合併時每輪讀取的列數
+        dtype: 排序段與輸出的儲存型別（np.float64 或 np.float32）；
+            統計與內外曲線分離仍以 float64 計算
+
+    Returns:
+        ChunkedResult: 記憶體映射的排序結果與統計資訊
+    """
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    # 第一遍：線上統計
+    stats = OnlineStatistics()
+    for chunk in chunks():
+        stats.update(chunk)
+    if stats.count == 0:
+        raise ValueError("沒有任何點位資料")
+
+    # 第二遍：分離內外曲線並寫入排序段
+    inner_runs: List[Path] = []
+    outer_runs: List[Path] = []
+    inner_count = 0
+    outer_count = 0
+
+    for i, chunk in enumerate(chunks()):
+        chunk = chunk[np.argsort(chunk[:, 2], kind="stable")]
+        is_inner = chunk[:, 0] < stats.mean_x
+
+        for runs, part, name in (
+            (inner_runs, chunk[is_inner], "inner"),
+            (outer_runs, chunk[~is_inner], "outer"),
+        ):
+            if len(part) == 0:
+                continue
+            run_path = work_dir / f"run-{name}-{i:06d}.npy"
+            np.save(run_path, part.astype(dtype, copy=False))
+            runs.append(run_path)
+
+        inner_count += int(is_inner.sum())
+        outer_count += len(chunk) - int(is_inner.sum())
+
+    # 外部合併排序，內外曲線分別寫入同一欄位檔案的前後兩段
+    columns = np.lib.format.open_memmap(
+        work_dir / "points.npy",
+        mode="w+",
+        dtype=dtype,
+        shape=(3, inner_count + outer_count),
+    )
+    merge_sorted_runs(inner_runs, columns[:, :inner_count], chunk_rows)
+    merge_sorted_runs(outer_runs, columns[:, inner_count:], chunk_rows)
+    columns.flush()
+
+    for run in inner_runs + outer_runs:
+        run.unlink()
+
+    return ChunkedResult(
+        points=PointCloud(columns),
+        n_inner=inner_count,
+        statistics=stats.to_statistics(inner_count, outer_count),
+    )
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+輸出格式設定模組
+
+annotated：保留各頂點、各層的註解，浮點數固定小數 6 位（原有格式）
+compact：不輸出註解，浮點數使用可完整還原的最短表示並去除多餘的零，
+檔案較小，blockMesh 解析也較快
+"""
+
+from typing import Iterable, List
+
+PROFILE_ANNOTATED = "annotated"
+PROFILE_COMPACT = "compact"
+OUTPUT_PROFILES = (PROFILE_ANNOTATED, PROFILE_COMPACT)
+
+
+def check_profile(profile: str) -> str:
+    """
+    檢查輸出格式名稱
+
+    Args:
+        profile: 輸出格式名稱
+
+    Returns:
+        str: 原輸出格式名稱
+
+    Raises:
+        ValueError: 不支援的輸出格式
+    """
+    if profile not in OUTPUT_PROFILES:
+        raise ValueError(f"不支援的輸出格式: {profile}（可用: {', '.join(OUTPUT_PROFILES)}）")
+    return profile
+
+
+def compact_float(value: float) -> str:
+    """
+    以最短可還原表示格式化浮點數，並去除多餘的零
+
+    例如 1.0 → "1"、-0.0 → "0"、0.25 → "0.25"、1e-07 → "1e-07"
+
+    Args:
+        value: 浮點數
+
+    Returns:
+        str: 格式化字串
+    """
+    text = repr(float(value))
+    if text.endswith(".0"):
+        text = text[:-2]
+    return "0" if text == "-0" else text
+
+
+def compact_floats(values: Iterable[float]) -> List[str]:
+    """
+    批次格式化浮點數（同 compact_float）
+
+    Args:
+        values: 浮點數序列
+
+    Returns:
+        List[str]: 格式化字串
+    """
+    return [compact_float(v) for v in values]
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+輸出檔案寫入模組
+
+先寫入同目錄下的暫存檔，完成後以 os.replace 原子性地取代目標檔案；
+寫入途中失敗或被取消時刪除暫存檔，目標檔案維持原狀，不會留下寫到一半的檔案。
+write_if_changed() 另外比對內容雜湊，內容相同時保留原檔（與其修改時間）。
+gzip_chunks() 以 zlib 串流壓縮，OpenFOAM 可直接讀取 blockMeshDict.gz。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import uuid
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, BinaryIO, Iterable, Iterator, Optional
+
+# 讀取檔案計算雜湊的區塊大小
+_HASH_BLOCK = 1024 * 1024
+
+# 預設 gzip 壓縮等級（同 gzip 指令）
+DEFAULT_COMPRESSLEVEL = 6
+
+# zlib 以 gzip 格式輸出（檔頭時間戳固定為 0，相同內容壓縮結果一致）
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def _new_digest():
+    """建立內容雜湊物件"""
+    return hashlib.blake2b(digest_size=20)
+
+
+def file_digest(path: str | Path) -> str:
+    """
+    計算檔案內容雜湊
+
+    Args:
+        path: 檔案路徑
+
+    Returns:
+        str: 十六進位雜湊字串
+    """
+    digest = _new_digest()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_matches(path: str | Path, size: int, digest: str) -> bool:
+    """
+    檢查檔案是否存在且大小與內容雜湊皆相符（大小不同時不讀取內容）
+
+    Args:
+        path: 檔案路徑
+        size: 預期大小（位元組）
+        digest: 預期的 file_digest() 結果
+
+    Returns:
+        bool: 是否相符
+    """
+    try:
+        return os.stat(path).st_size == size and file_digest(path) == digest
+    except OSError:
+        return False
+
+
+def _temp_path(output_path: Path) -> Path:
+    """目標檔案的暫存路徑（與目標同目錄，確保 os.replace 不跨檔案系統）"""
+    return output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+
+
+@contextmanager
+def atomic_output(
+    output_file: str | Path, encoding: str = "utf-8", binary: bool = False
+) -> Iterator[IO]:
+    """
+    以原子方式寫入檔案
+
+    Args:
+        output_file: 輸出檔案路徑（上層目錄不存在時自動建立）
+        encoding: 文字編碼（binary 為 True 時不使用）
+        binary: 是否以二進位模式開啟
+
+    Yields:
+        IO: 暫存檔的寫入物件
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = _temp_path(output_path)
+    try:
+        if binary:
+            f = open(temp_path, "xb")
+        else:
+            f = open(temp_path, "x", encoding=encoding)
+        with f:
+            yield f
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_chunks(chunks: Iterable[bytes], fileobj: BinaryIO) -> int:
+    """
+    將位元組區塊依序寫入二進位檔案物件
+
+    Args:
+        chunks: 位元組區塊
+        fileobj: 二進位寫入物件
+
+    Returns:
+        int: 寫入的位元組數
+    """
+    total = 0
+    for chunk in chunks:
+        fileobj.write(chunk)
+        total += len(chunk)
+    return total
+
+
+def write_if_changed(chunks: Iterable[bytes], output_file: str | Path) -> bool:
+    """
+    串流寫入暫存檔並同時計算雜湊，僅在內容與現有檔案不同時原子取代
+
+    內容相同時刪除暫存檔，目標檔案（與其修改時間）維持原狀，
+    依修改時間判斷是否重跑的建置工具（make、snakemake 等）不會被觸發。
+
+    Args:
+        chunks: 位元組區塊
+        output_file: 輸出檔案路徑（上層目錄不存在時自動建立）
+
+    Returns:
+        bool: 檔案是否改變（新建或取代）
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = _temp_path(output_path)
+    digest = _new_digest()
+    try:
+        with open(temp_path, "xb") as f:
+            size = 0
+            for chunk in chunks:
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+
+        if file_matches(output_path, size, digest.hexdigest()):
+            temp_path.unlink()
+            return False
+
+        os.replace(temp_path, output_path)
+        return True
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def check_compresslevel(compresslevel: Optional[int]) -> Optional[int]:
+    """
+    檢查 gzip 壓縮等級
+
+    Args:
+        compresslevel: 壓縮等級 0~9，None 表示不壓縮
+
+    Returns:
+        Optional[int]: 原壓縮等級
+
+    Raises:
+        ValueError: 壓縮等級超出範圍
+    """
+    if compresslevel is not None and not 0 <= compresslevel <= 9:
+        raise ValueError(f"壓縮等級必須介於 0 與 9 之間: {compresslevel}")
+    return compresslevel
+
+
+def gzip_chunks(
+    chunks: Iterable[bytes], compresslevel: int = DEFAULT_COMPRESSLEVEL
+) -> Iterator[bytes]:
+    """
+    將位元組區塊串流壓縮為 gzip 格式
+
+    Args:
+        chunks: 未壓縮的位元組區塊
+        compresslevel: 壓縮等級 0~9
+
+    Yields:
+        bytes: 壓縮後的區塊
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, _GZIP_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def encode_output(
+    chunks: Iterable[bytes], compresslevel: Optional[int] = None
+) -> Iterable[bytes]:
+    """
+    依壓縮設定轉換輸出區塊
+
+    Args:
+        chunks: 未壓縮的位元組區塊
+        compresslevel: gzip 壓縮等級，None 表示不壓縮
+
+    Returns:
+        Iterable[bytes]: 寫入檔案的區塊
+    """
+    if compresslevel is None:
+        return chunks
+    return gzip_chunks(chunks, compresslevel)
+
+
+def place_file(source: str | Path, output_file: str | Path, link: bool = True) -> bool:
+    """
+    以硬連結（不支援時改為複製）將檔案原子性地放到目標位置
+
+    Args:
+        source: 來源檔案
+        output_file: 目標檔案路徑（上層目錄不存在時自動建立）
+        link: 是否優先使用硬連結
+
+    Returns:
+        bool: 是否使用硬連結
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _temp_path(output_path)
+
+    linked = False
+    try:
+        if link:
+            try:
+                os.link(source, temp_path)
+                linked = True
+            except OSError:
+                # 跨檔案系統或不支援硬連結
+                pass
+        if not linked:
+            shutil.copyfile(source, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return linked
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+點位解析快取模組
+
+將解析並依 Z 排序、內外曲線分段後的點位存為 .npy 檔案，
+以檔案指紋（大小 + 修改時間 + 內容雜湊）為鍵值；
+再次開啟同一檔案時以記憶體映射載入，不需重新解析。
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from ..models.point_cloud import PointCloud
+from .data_reader import DataStatistics
+from .disk_cache import DEFAULT_MAX_BYTES, DiskCache, default_cache_dir
+
+# 快取格式版本，變更儲存內容時需遞增
+CACHE_VERSION = 2
+
+# 內容雜湊取樣區塊大小（檔頭、中段、檔尾各一塊）
+HASH_BLOCK = 1024 * 1024
+
+
+def file_fingerprint(file_path: str | Path) -> str:
+    """
+    計算檔案指紋
+
+    由檔案大小、修改時間與內容雜湊組成。內容雜湊只取檔頭、中段、
+    檔尾各 1 MiB，使大型檔案也能在毫秒內完成。
+
+    Args:
+        file_path: 檔案路徑
+
+    Returns:
+        str: 十六進位指紋字串
+    """
+    path = Path(file_path)
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"v{CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    with open(path, "rb") as f:
+        if stat.st_size <= 3 * HASH_BLOCK:
+            digest.update(f.read())
+        else:
+            for offset in (0, (stat.st_size - HASH_BLOCK) // 2, stat.st_size - HASH_BLOCK):
+                f.seek(offset)
+                digest.update(f.read(HASH_BLOCK))
+
+    return digest.hexdigest()
+
+
+@dataclass
+class CachedPoints:
+    """快取中的點位資料（記憶體映射，唯讀）"""
+
+    # 內曲線在前、外曲線在後，各段依 Z 排序
+    points: PointCloud
+
+    # 內曲線點數（分段位置）
+    n_inner: int
+
+    statistics: DataStatistics
+
+
+class PointCache(DiskCache):
+    """點位解析結果快取"""
+
+    POINTS_FILE = "points.npy"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        初始化點位快取
+
+        Args:
+            cache_dir: 快取目錄（預設為使用者快取目錄下的 points/）
+            max_bytes: 快取總大小上限（位元組）
+        """
+        if cache_dir is None:
+            cache_dir = default_cache_dir() / "points"
+        super().__init__(cache_dir, max_bytes)
+
+    def key_for(self, file_path: str | Path, dtype: DTypeLike = np.float64) -> str:
+        """取得檔案對應的快取鍵值（含儲存型別）"""
+        return f"{file_fingerprint(file_path)}-{np.dtype(dtype).name}"
+
+    def load(self, key: str) -> Optional[CachedPoints]:
+        """
+        載入快取項目
+
+        Args:
+            key: key_for() 取得的鍵值
+
+        Returns:
+            Optional[CachedPoints]: 命中時回傳記憶體映射的陣列，否則為 None
+        """
+        meta = self.read_meta(key)
+        if meta is None:
+            return None
+
+        # 舊版或損壞的項目直接刪除，之後的 store() 才能寫入新項目
+        if meta.get("version") != CACHE_VERSION:
+            self.remove(key)
+            return None
+        try:
+            columns = np.load(self.entry_dir(key) / self.POINTS_FILE, mmap_mode="r")
+        except (OSError, ValueError):
+            self.remove(key)
+            return None
+
+        return CachedPoints(
+            points=PointCloud(columns),
+            n_inner=int(meta["n_inner"]),
+            statistics=DataStatistics.from_dict(meta["statistics"]),
+        )
+
+    def store(
+        self,
+        key: str,
+        points: PointCloud,
+        n_inner: int,
+        statistics: DataStatistics,
+    ) -> Path:
+        """
+        寫入快取項目
+
+        Args:
+            key: key_for() 取得的鍵值
+            points: 內曲線在前、外曲線在後的點雲
+            n_inner: 內曲線點數
+            statistics: 資料統計資訊
+
+        Returns:
+            Path: 項目目錄
+        """
+        staging = self.new_staging_dir()
+        np.save(staging / self.POINTS_FILE, points.columns)
+
+        meta = {
+            "version": CACHE_VERSION,
+            "n_inner": n_inner,
+            "statistics": statistics.to_dict(),
+        }
+        return self.commit(key, staging, meta)
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+polyMesh 直接輸出模組
+
+流道環形網格的拓撲是固定的結構網格（徑向 × 圓周 × 軸向），
+不需要經過 blockMesh 展開 blockMeshDict，直接以 NumPy 廣播計算點座標與面連接，
+寫出 constant/polyMesh 的 points、faces、owner、neighbour、boundary。
+
+幾何與 blockMesh 展開相同的 blockMeshDict 一致：圓周方向沿圓弧等角度分割，
+徑向與軸向為直線，依 simpleGrading 擴展比（徑向可為多段漸變）分割。
+軸向為曲線邊時，站位半徑改由經過中間點的取樣剖面線性內插（近似 spline 曲線）。
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..models.poly_mesh import PolyMesh, PolyPatch
+from .grading import graded_fractions, section_fractions
+from .foam_io import (
+    FORMAT_ASCII,
+    LABEL_DTYPE,
+    check_format,
+    foam_header,
+    write_foam_list,
+)
+from .output_writer import atomic_output
+from .progress import ProgressReporter
+
+# polyMesh 檔案相對於算例目錄的位置
+POLYMESH_LOCATION = "constant/polyMesh"
+
+
+def annulus_polymesh(
+    inner_radii: ArrayLike,
+    outer_radii: ArrayLike,
+    z: ArrayLike,
+    n_radial: int,
+    n_circum: int,
+    n_axial: int | ArrayLike,
+    radial_grading: float | ArrayLike = 1.0,
+    axial_grading: float = 1.0,
+    scale: float = 1.0,
+    profile: Optional[Tuple[ArrayLike, ArrayLike, ArrayLike]] = None,
+) -> PolyMesh:
+    """
+    建立環形流道的 polyMesh
+
+    網格 (k, i, j) 依軸向 k、徑向 i、圓周 j 排列，編號 (k·nr + i)·nc + j；
+    點 (k, i, j) 的編號為 (k·(nr+1) + i)·nc + j（圓周方向首尾相接）。
+    各網格的內部面依序為：圓周 j+1、圓周首尾接縫（僅 j=0）、徑向 i+1、軸向 k+1，
+    相鄰網格編號依此順序遞增，依網格順序展開即為 upper-triangular 順序，不需排序。
+
+    Args:
+        inner_radii: 各層內壁半徑，形狀 (L,)
+        outer_radii: 各層外壁半徑，形狀 (L,)
+        z: 各層 Z 座標，形狀 (L,)
+        n_radial: 徑向網格數
+        n_circum: 圓周方向總網格數
+        n_axial: 相鄰兩層之間的軸向網格數（整數或各段的網格數，形狀 (L - 1,)）
+        radial_grading: 徑向擴展比，或多段漸變的 (長度比例, 網格數比例, 擴展比)
+        axial_grading: 軸向擴展比（每段各自套用）
+        scale: 座標尺度（同 blockMeshDict 的 scale）
+        profile: 含曲線邊中間點的壁面剖面 (Z, 內壁半徑, 外壁半徑)（可選），
+            給定時各站位的半徑依 Z 由此內插，而非相鄰兩層的直線
+
+    Returns:
+        PolyMesh: 邊界依序為 inlet、outlet、innerWall、outerWall
+    """
+    inner_radii = np.asarray(inner_radii, dtype=np.float64)
+    outer_radii = np.asarray(outer_radii, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+    num_layers = len(z)
+    if num_layers < 2:
+        raise ValueError("層數必須至少為 2")
+    axial_cells = np.broadcast_to(np.asarray(n_axial, dtype=np.int64), num_layers - 1)
+    if n_radial < 1 or n_circum < 3 or np.any(axial_cells < 1):
+        raise ValueError("徑向、軸向網格數至少為 1，圓周方向網格數至少為 3")
+
+    nr, nc = n_radial, n_circum
+    nz = int(axial_cells.sum())
+    n_points = (nz + 1) * (nr + 1) * nc
+    if n_points > np.iinfo(LABEL_DTYPE).max:
+        raise ValueError(f"點數 {n_points} 超出 32 位元 label 範圍")
+
+    # 點座標：各軸向站位在相鄰兩層之間線性內插半徑與 Z
+    fractions = {n: graded_fractions(n, axial_grading)[:-1] for n in set(axial_cells.tolist())}
+    stations = np.concatenate(
+        [pair + fractions[n] for pair, n in enumerate(axial_cells.tolist())]
+        + [[num_layers - 1]]
+    )
+    layers = np.arange(num_layers)
+    station_z = np.interp(stations, layers, z)
+    if profile is None:
+        r_in = np.interp(stations, layers, inner_radii)
+        r_out = np.interp(stations, layers, outer_radii)
+    else:
+        profile_z, profile_in, profile_out = (
+            np.asarray(values, dtype=np.float64) for values in profile
+        )
+        r_in = np.interp(station_z, profile_z, profile_in)
+        r_out = np.interp(station_z, profile_z, profile_out)
+    if np.ndim(radial_grading) == 0:
+        radial = graded_fractions(nr, float(radial_grading))
+    else:
+        radial = section_fractions(nr, radial_grading)
+    r = r_in[:, None] + (r_out - r_in)[:, None] * radial[None, :]
+    theta = 2.0 * np.pi * np.arange(nc) / nc
+
+    points = np.empty((nz + 1, nr + 1, nc, 3))
+    points[..., 0] = r[:, :, None] * np.cos(theta)
+    points[..., 1] = r[:, :, None] * np.sin(theta)
+    points[..., 2] = station_z[:, None, None]
+    points *= scale
+
+    def pid(k, i, j):
+        return (k * (nr + 1) + i) * nc + j % nc
+
+    # 三種方向的面（點的順序使法向量分別指向 +θ、+r、+z，反序即反向）
+    def circum_face(k, i, j):
+        return pid(k, i, j), pid(k + 1, i, j), pid(k + 1, i + 1, j), pid(k, i + 1, j)
+
+    def radial_face(k, i, j):
+        return pid(k, i, j), pid(k, i, j + 1), pid(k + 1, i, j + 1), pid(k + 1, i, j)
+
+    def axial_face(k, i, j):
+        return pid(k, i, j), pid(k, i + 1, j), pid(k, i + 1, j + 1), pid(k, i, j + 1)
+
+    # 內部面：每個網格 4 個候選面（法向量皆由 owner 指向 neighbour）
+    k = np.arange(nz)[:, None, None]
+    i = np.arange(nr)[None, :, None]
+    j = np.arange(nc)[None, None, :]
+    shape = (nz, nr, nc)
+    cell = (k * nr + i) * nc + j
+
+    candidates = [
+        (j < nc - 1, cell + 1, circum_face(k, i, j + 1)),
+        (j == 0, cell + nc - 1, circum_face(k, i, j)[::-1]),
+        (i < nr - 1, cell + nc, radial_face(k, i + 1, j)),
+        (k < nz - 1, cell + nr * nc, axial_face(k + 1, i, j)),
+    ]
+    valid = np.empty(shape + (4,), dtype=bool)
+    neighbours = np.empty(shape + (4,), dtype=LABEL_DTYPE)
+    vertices = np.empty(shape + (4, 4), dtype=LABEL_DTYPE)
+    for slot, (mask, neighbour, face) in enumerate(candidates):
+        valid[..., slot] = np.broadcast_to(mask, shape)
+        neighbours[..., slot] = neighbour
+        for corner, index in enumerate(face):
+            vertices[..., slot, corner] = index
+
+    internal_faces = vertices[valid]
+    neighbour = neighbours[valid]
+    owner = np.broadcast_to(cell.astype(LABEL_DTYPE)[..., None], valid.shape)[valid]
+    del valid, neighbours, vertices
+
+    # 邊界面：各 patch 依 owner 遞增，法向量指向域外
+    kk = np.arange(nz)[:, None]
+    ii = np.arange(nr)[:, None]
+    jj = np.arange(nc)[None, :]
+    boundaries = [
+        ("inlet", "patch", ii * nc + jj, axial_face(0, ii, jj)[::-1]),
+        ("outlet", "patch", ((nz - 1) * nr + ii) * nc + jj, axial_face(nz, ii, jj)),
+        ("innerWall", "wall", kk * nr * nc + jj, radial_face(kk, 0, jj)[::-1]),
+        ("outerWall", "wall", (kk * nr + nr - 1) * nc + jj, radial_face(kk, nr, jj)),
+    ]
+
+    faces = [internal_faces]
+    owners = [owner]
+    patches = []
+    start = len(internal_faces)
+    for name, patch_type, patch_owner, face in boundaries:
+        n_faces = patch_owner.size
+        faces.append(
+            np.stack(np.broadcast_arrays(*face), axis=-1)
+            .reshape(n_faces, 4)
+            .astype(LABEL_DTYPE)
+        )
+        owners.append(patch_owner.ravel().astype(LABEL_DTYPE))
+        patches.append(PolyPatch(name, patch_type, start, n_faces))
+        start += n_faces
+
+    return PolyMesh(
+        points=points.reshape(-1, 3),
+        faces=np.concatenate(faces),
+        owner=np.concatenate(owners),
+        neighbour=neighbour,
+        patches=patches,
+    )
+
+
+def _boundary_text(mesh: PolyMesh, fmt: str) -> str:
+    """boundary 檔案內容（固定為 ascii 字典）"""
+    lines = [
+        foam_header(fmt, "polyBoundaryMesh", "boundary", POLYMESH_LOCATION),
+        f"{len(mesh.patches)}\n(\n",
+    ]
+    for patch in mesh.patches:
+        lines.append(f"    {patch.name}\n    {{\n")
+        lines.append(f"        type            {patch.type};\n")
+        if patch.type == "wall":
+            lines.append("        inGroups        1(wall);\n")
+        lines.append(f"        nFaces          {patch.n_faces};\n")
+        lines.append(f"        startFace       {patch.start};\n    }}\n")
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def write_polymesh(
+    mesh: PolyMesh,
+    polymesh_dir: str | Path,
+    fmt: str = FORMAT_ASCII,
+    progress: Optional[ProgressReporter] = None,
+) -> Path:
+    """
+    寫出 polyMesh 的五個檔案
+
+    各檔案皆以原子方式取代；binary 格式直接輸出陣列的原始位元組，
+    不做逐元素的文字格式化。
+
+    Args:
+        mesh: polyMesh 網格
+        polymesh_dir: 輸出目錄（通常為 <算例>/constant/polyMesh，不存在時自動建立）
+        fmt: "ascii" 或 "binary"
+        progress: 進度回報器（可選）
+
+    Returns:
+        Path: 輸出目錄
+    """
+    check_format(fmt)
+    if progress is None:
+        progress = ProgressReporter()
+    output_dir = Path(polymesh_dir)
+
+    # 各檔案的內容、進度範圍與階段說明
+    files = [
+        ("points", mesh.points, None, (0, 25), "stage_points"),
+        ("faces", mesh.faces, None, (25, 70), "stage_faces"),
+        ("owner", mesh.owner, mesh.note(), (70, 85), "stage_addressing"),
+        ("neighbour", mesh.neighbour, mesh.note(), (85, 98), "stage_addressing"),
+    ]
+    for name, values, note, span, stage in files:
+        progress.report(span[0], stage)
+        write_foam_list(
+            output_dir / name,
+            values,
+            fmt,
+            POLYMESH_LOCATION,
+            note,
+            progress,
+            span,
+            stage,
+        )
+
+    progress.report(98, "stage_boundary")
+    with atomic_output(output_dir / "boundary") as f:
+        f.write(_boundary_text(mesh, fmt))
+    return output_dir
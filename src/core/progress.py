@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+進度回報與取消模組
+
+長時間作業（讀取資料、生成網格）以回呼回報進度，並在各階段之間
+檢查取消權杖；取消時拋出 OperationCancelled，由呼叫端決定如何處理。
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Optional
+
+# 進度回呼：(百分比 0~100, 階段說明)
+ProgressCallback = Callable[[int, str], None]
+
+
+class OperationCancelled(Exception):
+    """作業已被取消"""
+
+
+class CancelToken:
+    """執行緒安全的取消權杖"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """要求取消作業"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已要求取消"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """已要求取消時拋出 OperationCancelled"""
+        if self._event.is_set():
+            raise OperationCancelled()
+
+
+class ProgressReporter:
+    """
+    將進度回呼與取消權杖包成單一物件
+
+    兩者皆為可選；report() 會先檢查取消，再回報進度。
+    百分比與階段皆未改變時不重複呼叫回呼，逐層回報也不會塞滿事件佇列。
+    """
+
+    def __init__(
+        self,
+        callback: Optional[ProgressCallback] = None,
+        token: Optional[CancelToken] = None,
+    ):
+        """
+        初始化進度回報器
+
+        Args:
+            callback: 進度回呼（可選）
+            token: 取消權杖（可選）
+        """
+        self._callback = callback
+        self._token = token
+        self._last: Optional[tuple[int, str]] = None
+
+    def check(self) -> None:
+        """檢查是否已取消"""
+        if self._token is not None:
+            self._token.raise_if_cancelled()
+
+    def report(self, percent: int, stage: str = "") -> None:
+        """
+        回報進度
+
+        Args:
+            percent: 進度百分比 (0~100)
+            stage: 階段說明
+        """
+        self.check()
+        current = (int(percent), stage)
+        if self._callback is not None and current != self._last:
+            self._last = current
+            self._callback(*current)
+
+    def report_step(
+        self, start: int, end: int, done: int, total: int, stage: str = ""
+    ) -> None:
+        """
+        回報某階段內的細部進度
+
+        Args:
+            start: 階段起始百分比
+            end: 階段結束百分比
+            done: 已完成數量（如已寫入層數）
+            total: 總數量
+            stage: 階段說明
+        """
+        fraction = done / total if total > 0 else 1.0
+        self.report(start + (end - start) * fraction, stage)
+
+    def sub(self, start: int, end: int) -> ProgressReporter:
+        """
+        建立將 0~100 對應到本回報器 start~end 的子回報器
+
+        一次作業包含多個各自回報 0~100 的步驟（如先讀取資料再生成網格）時，
+        各步驟使用不同的子範圍，整體進度才不會倒退。
+
+        Args:
+            start: 子範圍起始百分比
+            end: 子範圍結束百分比
+
+        Returns:
+            ProgressReporter: 共用取消權杖的子回報器
+        """
+
+        def forward(percent: int, stage: str) -> None:
+            self.report(start + (end - start) * percent / 100, stage)
+
+        return ProgressReporter(forward, self._token)
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+y+ 邊界層計算模組
+
+由流體性質、平均流速與目標 y+ 估算壁面第一格高度：
+環形流道的水力直徑為 2 × 徑向間距，依管流摩擦係數關係式求壁面剪應力
+與摩擦速度，第一格中心位於目標 y+ 處，第一格高度為該距離的兩倍。
+
+流道間距沿 Z 變化，各取樣層以一次向量化計算求出第一格高度，
+再依邊界層厚度求出最少層數與對應的擴展比；
+所有塊共用同一組徑向漸變，邊界層參數取最需要加密的一層。
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..models.mesh_params import BoundaryLayerParams, YPlusParams
+from ..models.point_cloud import PointCloud
+
+# 層流與紊流摩擦係數關係式的分界雷諾數
+LAMINAR_REYNOLDS = 2300.0
+
+# 二分法求擴展比的迭代次數
+EXPANSION_ITERATIONS = 60
+
+# 填入邊界層參數的最小擴展比（BoundaryLayerParams 要求大於 1）
+MIN_EXPANSION = 1.01
+
+
+@dataclass
+class YPlusLayers:
+    """各取樣層的 y+ 計算結果"""
+
+    # 各層 Z 座標，形狀 (L,)
+    z: NDArray
+
+    # 各層以水力直徑計算的雷諾數，形狀 (L,)
+    reynolds: NDArray
+
+    # 各層第一格高度（m），形狀 (L,)
+    first_cell: NDArray
+
+    # 各層第一格高度相對於徑向間距的比例，形狀 (L,)
+    first_fraction: NDArray
+
+    # 內、外壁各層的最少邊界層層數，形狀 (2, L)
+    layers: NDArray
+
+    # 內、外壁各層在最少層數下的擴展比，形狀 (2, L)
+    expansion: NDArray
+
+    @property
+    def critical_layer(self) -> int:
+        """第一格高度相對於間距最小（最需要加密）的取樣層索引"""
+        return int(np.argmin(self.first_fraction))
+
+    def boundary_layer_params(self, params: BoundaryLayerParams) -> BoundaryLayerParams:
+        """
+        以最需要加密的一層決定邊界層層數與擴展比
+
+        內外壁共用擴展比，取兩者較大值（至少 MIN_EXPANSION）：
+        層數不變時擴展比越大第一格越薄，兩側的第一格皆不超過目標高度。
+
+        Args:
+            params: 原邊界層參數（沿用厚度）
+
+        Returns:
+            BoundaryLayerParams: 啟用且填入層數與擴展比的邊界層參數
+        """
+        k = self.critical_layer
+        inner_layers, outer_layers = self.layers[:, k].tolist()
+        return replace(
+            params,
+            enabled=True,
+            inner_layers=int(inner_layers),
+            outer_layers=int(outer_layers),
+            expansion_ratio=max(float(self.expansion[:, k].max()), MIN_EXPANSION),
+        )
+
+
+def first_cell_height(
+    target_yplus: float,
+    density: float,
+    viscosity: float,
+    velocity: ArrayLike,
+    hydraulic_diameter: ArrayLike,
+) -> tuple[NDArray, NDArray]:
+    """
+    由目標 y+ 計算第一格高度
+
+    紊流使用 Petukhov 平滑管摩擦係數 f = (0.790 ln Re − 1.64)^−2，
+    層流使用 f = 64 / Re；τw = f/8 · ρU²，u_τ = √(τw/ρ)，
+    第一格中心距壁面 y+ · μ / (ρ u_τ)。
+
+    Args:
+        target_yplus: 目標 y+
+        density: 流體密度（kg/m³）
+        viscosity: 動力黏度（Pa·s）
+        velocity: 平均流速（m/s），可為各層的陣列
+        hydraulic_diameter: 水力直徑（m），可為各層的陣列
+
+    Returns:
+        tuple[NDArray, NDArray]: (第一格高度, 雷諾數)
+    """
+    velocity = np.asarray(velocity, dtype=np.float64)
+    diameter = np.asarray(hydraulic_diameter, dtype=np.float64)
+    reynolds = density * velocity * diameter / viscosity
+    if np.any(reynolds <= 0):
+        raise ValueError("流速與水力直徑必須大於 0")
+
+    turbulent = (0.790 * np.log(np.maximum(reynolds, LAMINAR_REYNOLDS)) - 1.64) ** -2
+    friction = np.where(reynolds < LAMINAR_REYNOLDS, 64.0 / reynolds, turbulent)
+    u_tau = velocity * np.sqrt(friction / 8.0)
+    return 2.0 * target_yplus * viscosity / (density * u_tau), reynolds
+
+
+def _series(growth: NDArray, layers: NDArray) -> NDArray:
+    """等比級數和 1 + g + … + g^(n−1)（g = 1 時為 n）"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = (growth**layers - 1.0) / (growth - 1.0)
+    return np.where(growth == 1.0, layers, total)
+
+
+def minimal_layers(
+    first_fraction: ArrayLike, thickness: ArrayLike, max_expansion: float
+) -> tuple[NDArray, NDArray]:
+    """
+    計算覆蓋邊界層厚度的最少層數，以及該層數下第一格恰為目標高度的擴展比
+
+    層數 n 為 first · (g^n − 1)/(g − 1) ≥ thickness 的最小整數（g 為上限），
+    再以二分法求擴展比（向量化，不超過上限）。
+    第一格已不小於邊界層厚度時為 1 層（擴展比取上限，無作用）。
+
+    Args:
+        first_fraction: 第一格高度（相對於間距的比例）
+        thickness: 邊界層厚度（相對於間距的比例），可與 first_fraction 廣播
+        max_expansion: 擴展比上限（大於 1）
+
+    Returns:
+        tuple[NDArray, NDArray]: (層數, 擴展比)
+    """
+    if max_expansion <= 1:
+        raise ValueError(f"擴展比上限必須大於 1: {max_expansion}")
+    first, thickness = np.broadcast_arrays(
+        np.asarray(first_fraction, dtype=np.float64),
+        np.asarray(thickness, dtype=np.float64),
+    )
+    target = thickness / first
+    span = np.log1p(np.maximum(target, 1.0) * (max_expansion - 1.0))
+    layers = np.maximum(np.ceil(span / math.log(max_expansion) - 1e-9), 1.0)
+
+    # 級數和隨擴展比遞增：二分 [1, 上限] 使級數和等於 thickness / first
+    low = np.ones_like(target)
+    high = np.full_like(target, max_expansion)
+    for _ in range(EXPANSION_ITERATIONS):
+        middle = 0.5 * (low + high)
+        short = _series(middle, layers) < target
+        low = np.where(short, middle, low)
+        high = np.where(short, high, middle)
+    expansion = np.where(layers > 1, high, max_expansion)
+    return layers.astype(np.int64), expansion
+
+
+def yplus_layers(
+    inner_samples: PointCloud | ArrayLike,
+    outer_samples: PointCloud | ArrayLike,
+    params: YPlusParams,
+    bl_params: BoundaryLayerParams,
+    scale: float = 1.0,
+) -> YPlusLayers:
+    """
+    對 DataReader.sample_layers 的取樣層一次計算第一格高度、最少層數與擴展比
+
+    Args:
+        inner_samples: 內曲線採樣點
+        outer_samples: 外曲線採樣點
+        params: 流體參數與目標 y+
+        bl_params: 邊界層參數（取內外壁厚度比例）
+        scale: 座標換算為公尺的尺度（同 blockMeshDict 的 scale）
+
+    Returns:
+        YPlusLayers: 各取樣層的計算結果
+    """
+    inner_samples = PointCloud.coerce(inner_samples)
+    outer_samples = PointCloud.coerce(outer_samples)
+    gap = (outer_samples.x.astype(np.float64) - inner_samples.x) * scale
+    if np.any(gap <= 0):
+        raise ValueError("外壁半徑必須大於內壁半徑")
+
+    first_cell, reynolds = first_cell_height(
+        params.target_yplus, params.density, params.viscosity, params.velocity, 2 * gap
+    )
+    fraction = first_cell / gap
+    thickness = np.array([[bl_params.inner_thickness], [bl_params.outer_thickness]])
+    layers, expansion = minimal_layers(fraction, thickness, params.max_expansion)
+    return YPlusLayers(
+        z=inner_samples.z.astype(np.float64),
+        reynolds=reynolds,
+        first_cell=first_cell,
+        first_fraction=fraction,
+        layers=layers,
+        expansion=expansion,
+    )
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+blockMesh 中間表示資料模型
+
+生成器先把幾何計算為一組陣列（頂點、hex 連接、網格數與漸變、邊、patch），
+之後的輸出（blockMeshDict、快取、驗證、其他格式）都只是走訪同一組陣列，
+不需重新計算幾何。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+# blockMeshDict 支援的曲線邊類型
+CURVE_TYPES = ("spline", "polyLine")
+
+
+def _as_array(values: ArrayLike, dtype, columns: int) -> NDArray:
+    """轉為 C 連續的 (N, columns) 陣列"""
+    array = np.ascontiguousarray(values, dtype=dtype)
+    if array.size == 0:
+        array = array.reshape(0, columns)
+    if array.ndim != 2 or array.shape[1] != columns:
+        raise ValueError(f"陣列形狀必須為 (N, {columns})，目前為 {array.shape}")
+    return array
+
+
+@dataclass
+class Patch:
+    """邊界 patch"""
+
+    # patch 名稱
+    name: str
+
+    # patch 類型（patch、wall、symmetry 等）
+    type: str
+
+    # 面的頂點索引，形狀 (F, 4)
+    faces: NDArray
+
+    def __post_init__(self):
+        self.faces = _as_array(self.faces, np.int64, 4)
+
+
+@dataclass
+class BlockMesh:
+    """
+    blockMesh 中間表示
+
+    所有陣列以列為單位對應：blocks、cells、grading、zones 的第 i 列皆屬於第 i 個塊；
+    arc_edges 與 arc_points 的第 i 列皆屬於第 i 條圓弧；
+    curve_edges 與 curve_points 的第 i 列皆屬於第 i 條曲線邊（spline 或 polyLine）。
+    """
+
+    # 頂點座標，形狀 (N, 3)
+    vertices: NDArray
+
+    # hex 塊的 8 個頂點索引，形狀 (B, 8)
+    blocks: NDArray
+
+    # 各塊三個方向的網格數，形狀 (B, 3)
+    cells: NDArray
+
+    # 各塊三個方向的 simpleGrading 擴展比，形狀 (B, 3)
+    grading: NDArray
+
+    # 圓弧兩端的頂點索引，形狀 (E, 2)
+    arc_edges: NDArray = field(default_factory=lambda: np.empty((0, 2), np.int64))
+
+    # 圓弧中點座標，形狀 (E, 3)
+    arc_points: NDArray = field(default_factory=lambda: np.empty((0, 3)))
+
+    # 曲線邊兩端的頂點索引，形狀 (C, 2)
+    curve_edges: NDArray = field(default_factory=lambda: np.empty((0, 2), np.int64))
+
+    # 曲線邊的中間點座標（不含兩端頂點），形狀 (C, K, 3)
+    curve_points: NDArray = field(default_factory=lambda: np.empty((0, 0, 3)))
+
+    # 曲線邊類型（"spline" 或 "polyLine"）
+    curve_type: str = "spline"
+
+    # 邊界 patch
+    patches: List[Patch] = field(default_factory=list)
+
+    # 多段漸變：方向 0~2 → 形狀 (S, 3) 的 (長度比例, 網格數比例, 擴展比)，
+    # 套用於所有塊並取代 grading 的該方向
+    multi_grading: Dict[int, NDArray] = field(default_factory=dict)
+
+    # 各塊的 cellZone 索引（對應 zone_names，-1 表示無），形狀 (B,)
+    zones: Optional[NDArray] = None
+
+    # cellZone 名稱
+    zone_names: List[str] = field(default_factory=list)
+
+    # 座標尺度
+    scale: float = 1.0
+
+    def __post_init__(self):
+        self.vertices = _as_array(self.vertices, np.float64, 3)
+        self.blocks = _as_array(self.blocks, np.int64, 8)
+        self.cells = _as_array(self.cells, np.int64, 3)
+        self.grading = _as_array(self.grading, np.float64, 3)
+        self.arc_edges = _as_array(self.arc_edges, np.int64, 2)
+        self.arc_points = _as_array(self.arc_points, np.float64, 3)
+        self.curve_edges = _as_array(self.curve_edges, np.int64, 2)
+        self.curve_points = np.ascontiguousarray(self.curve_points, dtype=np.float64)
+        if self.curve_points.size == 0:
+            self.curve_points = self.curve_points.reshape(len(self.curve_edges), 0, 3)
+        if self.curve_points.ndim != 3 or self.curve_points.shape[2] != 3:
+            shape = self.curve_points.shape
+            raise ValueError(f"曲線邊中間點形狀必須為 (C, K, 3)，目前為 {shape}")
+        self.multi_grading = {
+            axis: _as_array(sections, np.float64, 3)
+            for axis, sections in self.multi_grading.items()
+        }
+        if self.zones is None:
+            self.zones = np.full(len(self.blocks), -1, dtype=np.int64)
+        else:
+            self.zones = np.ascontiguousarray(self.zones, dtype=np.int64)
+
+    @property
+    def n_vertices(self) -> int:
+        """頂點數"""
+        return len(self.vertices)
+
+    @property
+    def n_blocks(self) -> int:
+        """塊數"""
+        return len(self.blocks)
+
+    @property
+    def n_cells(self) -> int:
+        """總網格數"""
+        return int(np.prod(self.cells, axis=1).sum())
+
+    def patch(self, name: str) -> Patch:
+        """
+        依名稱取得 patch
+
+        Args:
+            name: patch 名稱
+
+        Returns:
+            Patch: 對應的 patch
+
+        Raises:
+            KeyError: 找不到該名稱
+        """
+        for patch in self.patches:
+            if patch.name == name:
+                return patch
+        raise KeyError(name)
+
+    def validate(self) -> tuple[bool, str]:
+        """驗證陣列形狀與索引範圍"""
+        n_blocks = len(self.blocks)
+        if len(self.cells) != n_blocks or len(self.grading) != n_blocks:
+            return False, "塊的網格數與漸變數量必須與塊數相同"
+        if self.zones.shape != (n_blocks,):
+            return False, "塊的 cellZone 數量必須與塊數相同"
+        if len(self.arc_points) != len(self.arc_edges):
+            return False, "圓弧中點數量必須與圓弧數相同"
+        if len(self.curve_points) != len(self.curve_edges):
+            return False, "曲線邊中間點數量必須與曲線邊數相同"
+        if self.curve_type not in CURVE_TYPES:
+            return False, f"不支援的曲線邊類型: {self.curve_type}"
+        if np.any(self.cells < 1):
+            return False, "各塊網格數必須至少為 1"
+        if np.any(self.grading <= 0):
+            return False, "漸變擴展比必須大於 0"
+        for axis, sections in self.multi_grading.items():
+            if axis not in (0, 1, 2):
+                return False, f"多段漸變的方向必須為 0~2: {axis}"
+            if len(sections) == 0 or np.any(sections <= 0):
+                return False, "多段漸變的各段比例與擴展比必須大於 0"
+        if np.any((self.zones < -1) | (self.zones >= len(self.zone_names))):
+            return False, "cellZone 索引超出範圍"
+
+        n_vertices = len(self.vertices)
+        indices = [self.blocks, self.arc_edges, self.curve_edges]
+        indices += [p.faces for p in self.patches]
+        for array in indices:
+            if array.size and (array.min() < 0 or array.max() >= n_vertices):
+                return False, "頂點索引超出範圍"
+
+        names = [p.name for p in self.patches]
+        if len(set(names)) != len(names):
+            return False, "patch 名稱不可重複"
+        return True, ""
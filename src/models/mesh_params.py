@@ -6,6 +6,12 @@
 """
 
 from dataclasses import dataclass
+from typing import Tuple
+
+from .block_mesh import CURVE_TYPES
+
+# 圓柱網格的對稱模式：完整、半域（z ≥ 0）、四分之一域（y ≥ 0、z ≥ 0）
+SYMMETRY_MODES = ("full", "half", "quarter")
 
 
 @dataclass
@@ -27,6 +33,26 @@ class MeshParameters:
     # 軸向網格數（每段Z方向）
     n_cells_axial: int = 2
 
+    # 自適應層取樣的容許偏差（與資料同單位；0 為均勻取樣，層數即為上限）
+    layer_tolerance: float = 0.0
+
+    # 合併半徑共線連續層的容許偏差（與資料同單位；0 為不合併）
+    merge_tolerance: float = 0.0
+
+    # 沿 Z 方向的塊邊類型（"spline" 或 "polyLine"）
+    axial_edge_type: str = "spline"
+
+    # 曲線邊的中間點數（每段取自量測曲線；0 為直線邊）
+    axial_edge_points: int = 0
+
+    # 軸對稱楔形模式（圓周方向 1 格的扇形，取代完整 360° 環形）
+    axisymmetric: bool = False
+
+    @property
+    def edge_stride(self) -> int:
+        """取樣點中相鄰兩層的間隔（含中間點）"""
+        return self.axial_edge_points + 1
+
     def validate(self) -> tuple[bool, str]:
         """驗證參數有效性"""
         if self.scale_factor <= 0:
@@ -39,6 +65,14 @@ class MeshParameters:
             return False, "圓周方向網格數必須是 4 的倍數且至少為 4"
         if self.n_cells_axial < 1:
             return False, "軸向網格數必須至少為 1"
+        if self.layer_tolerance < 0:
+            return False, "層取樣容許偏差不可為負"
+        if self.merge_tolerance < 0:
+            return False, "塊合併容許偏差不可為負"
+        if self.axial_edge_type not in CURVE_TYPES:
+            return False, f"軸向邊類型必須為 {' 或 '.join(CURVE_TYPES)}"
+        if self.axial_edge_points < 0:
+            return False, "曲線邊中間點數不可為負"
         return True, ""
 
 
@@ -85,6 +119,45 @@ class BoundaryLayerParams:
         return True, ""
 
 
+@dataclass
+class YPlusParams:
+    """由目標 y+ 自動計算邊界層層數與擴展比的流體參數（SI 單位）"""
+
+    # 是否依 y+ 自動計算（取代手動設定的層數與擴展比）
+    enabled: bool = False
+
+    # 流體密度（kg/m³）
+    density: float = 1.225
+
+    # 動力黏度（Pa·s）
+    viscosity: float = 1.81e-5
+
+    # 平均流速（m/s）
+    velocity: float = 10.0
+
+    # 目標 y+（第一格中心的無因次壁面距離）
+    target_yplus: float = 1.0
+
+    # 相鄰兩層厚度比的上限
+    max_expansion: float = 1.2
+
+    def validate(self) -> tuple[bool, str]:
+        """驗證參數有效性"""
+        if not self.enabled:
+            return True, ""
+
+        if self.density <= 0 or self.viscosity <= 0:
+            return False, "流體密度與黏度必須大於 0"
+        if self.velocity <= 0:
+            return False, "流速必須大於 0"
+        if self.target_yplus <= 0:
+            return False, "目標 y+ 必須大於 0"
+        if self.max_expansion <= 1:
+            return False, "擴展比上限必須大於 1"
+
+        return True, ""
+
+
 @dataclass
 class CylinderMeshParams:
     """圓柱網格參數（取代 M4 模板）"""
@@ -113,6 +186,22 @@ class CylinderMeshParams:
     # 高度方向網格數
     n_cells_height: int = 120
 
+    # 對稱模式（"full"、"half" 或 "quarter"），切面為 symmetryPlane
+    symmetry: str = "full"
+
+    # 高度方向擴展比（最後一格與第一格的長度比；1 為均勻）
+    axial_grading: float = 1.0
+
+    # 高度方向多段漸變 ((長度比例, 網格數比例, 擴展比), ...)，非空時取代 axial_grading
+    axial_sections: Tuple[Tuple[float, float, float], ...] = ()
+
+    # 入口、出口的第一格高度（0 為不使用）；大於 0 時依最大網格高度
+    # 自動計算高度方向網格數與多段漸變，取代 n_cells_height 與上述漸變
+    first_cell_height: float = 0.0
+
+    # 自動漸變的最大網格高度
+    max_cell_height: float = 0.0
+
     def validate(self) -> tuple[bool, str]:
         """驗證參數有效性"""
         if self.inner_square_side <= 0:
@@ -129,6 +218,21 @@ class CylinderMeshParams:
             return False, "內方形到圓形網格數必須至少為 1"
         if self.n_cells_height < 1:
             return False, "高度方向網格數必須至少為 1"
+        if self.symmetry not in SYMMETRY_MODES:
+            return False, f"對稱模式必須為 {'、'.join(SYMMETRY_MODES)} 之一"
+        if self.symmetry != "full" and self.n_cells_square % 2:
+            return False, "對稱模式的內方形網格數必須為偶數"
+        if self.axial_grading <= 0:
+            return False, "高度方向擴展比必須大於 0"
+        if any(len(s) != 3 or min(s) <= 0 for s in self.axial_sections):
+            return False, "多段漸變每段需為 3 個大於 0 的值（長度比例、網格數比例、擴展比）"
+        if self.first_cell_height < 0:
+            return False, "第一格高度不可為負"
+        if self.first_cell_height > 0:
+            if self.max_cell_height < self.first_cell_height:
+                return False, "最大網格高度不可小於第一格高度"
+            if 2 * self.first_cell_height > self.height:
+                return False, "第一格高度過大（兩端合計超過圓柱高度）"
 
         return True, ""
 
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+點雲資料模型
+
+以結構陣列 (SoA) 儲存點位：x、y、z 各為一段連續記憶體，
+資料讀取、統計、取樣與網格生成共用同一份資料，不需轉換為串列。
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+
+class PointCloud:
+    """
+    結構陣列點雲
+
+    內部為形狀 (3, N) 的 C 連續陣列，每一列即為一個座標欄位，
+    因此 x、y、z 皆為連續記憶體；slice() 回傳共用記憶體的視圖。
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns: NDArray):
+        """
+        初始化點雲
+
+        Args:
+            columns: 形狀為 (3, N) 的座標欄位陣列（可為記憶體映射）
+        """
+        if columns.ndim != 2 or columns.shape[0] != 3:
+            raise ValueError(f"座標欄位形狀必須為 (3, N)，目前為 {columns.shape}")
+        self._columns = columns
+
+    @classmethod
+    def from_array(cls, points: ArrayLike, dtype: DTypeLike = np.float64) -> "PointCloud":
+        """
+        由 (N, 3) 陣列建立
+
+        Args:
+            points: 形狀為 (N, 3) 的座標陣列或巢狀串列
+            dtype: 儲存型別（np.float64 或 np.float32）
+        """
+        points = np.asarray(points, dtype=dtype)
+        if points.ndim != 2 or points.shape[1] < 3:
+            raise ValueError(f"座標陣列形狀必須為 (N, 3)，目前為 {points.shape}")
+        return cls(np.ascontiguousarray(points[:, :3].T))
+
+    @classmethod
+    def from_columns(
+        cls, x: ArrayLike, y: ArrayLike, z: ArrayLike, dtype: DTypeLike = np.float64
+    ) -> "PointCloud":
+        """由 x、y、z 欄位建立"""
+        columns = np.empty((3, len(z)), dtype=dtype)
+        columns[0] = x
+        columns[1] = y
+        columns[2] = z
+        return cls(columns)
+
+    @classmethod
+    def coerce(cls, points: "PointCloud | ArrayLike") -> "PointCloud":
+        """將 PointCloud、(N, 3) 陣列或巢狀串列統一轉為 PointCloud"""
+        if isinstance(points, PointCloud):
+            return points
+        return cls.from_array(points)
+
+    @property
+    def columns(self) -> NDArray:
+        """形狀為 (3, N) 的座標欄位"""
+        return self._columns
+
+    @property
+    def x(self) -> NDArray:
+        """X 座標"""
+        return self._columns[0]
+
+    @property
+    def y(self) -> NDArray:
+        """Y 座標"""
+        return self._columns[1]
+
+    @property
+    def z(self) -> NDArray:
+        """Z 座標"""
+        return self._columns[2]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """儲存型別"""
+        return self._columns.dtype
+
+    def __len__(self) -> int:
+        return self._columns.shape[1]
+
+    def __array__(self, dtype=None, copy=None) -> NDArray:
+        """轉換為 (N, 3) 陣列（複製）"""
+        return self.to_array(dtype)
+
+    def __repr__(self) -> str:
+        return f"PointCloud(n={len(self)}, dtype={self.dtype})"
+
+    def to_array(self, dtype: DTypeLike = None) -> NDArray:
+        """轉換為 (N, 3) 陣列（複製）"""
+        return np.array(self._columns.T, dtype=dtype, order="C")
+
+    def is_sorted_z(self) -> bool:
+        """檢查是否已依 Z 遞增排列"""
+        z = self.z
+        return bool(np.all(z[1:] >= z[:-1]))
+
+    def slice(self, start: int, stop: int) -> "PointCloud":
+        """取連續區段（共用記憶體的視圖）"""
+        return PointCloud(self._columns[:, start:stop])
+
+    def take(self, indices: NDArray) -> "PointCloud":
+        """依索引取點（複製，結果為連續記憶體）"""
+        return PointCloud(np.ascontiguousarray(self._columns[:, indices]))
+
+    def bounds(self) -> Tuple[NDArray, NDArray]:
+        """各軸的 (最小值, 最大值)"""
+        return self._columns.min(axis=1), self._columns.max(axis=1)
+
+    def set_read_only(self) -> "PointCloud":
+        """設為唯讀並回傳自身"""
+        self._columns.flags.writeable = False
+        return self
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+polyMesh 資料模型
+
+對應 OpenFOAM constant/polyMesh 的五個檔案：points、faces、owner、neighbour、boundary。
+面的排列需符合 OpenFOAM 的規定：先內部面、後邊界面；內部面依 owner 遞增、
+同一 owner 再依 neighbour 遞增（upper-triangular order）；邊界面依 patch 連續排列。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+@dataclass
+class PolyPatch:
+    """polyMesh 邊界 patch（對應 boundary 檔案的一個項目）"""
+
+    # patch 名稱
+    name: str
+
+    # patch 類型（patch、wall、symmetry 等）
+    type: str
+
+    # 第一個面的索引
+    start: int
+
+    # 面數
+    n_faces: int
+
+
+@dataclass
+class PolyMesh:
+    """
+    polyMesh 網格
+
+    所有面皆為四邊形；faces 的前 n_internal_faces 列為內部面，
+    與 neighbour 一一對應，其後為各 patch 的邊界面。
+    """
+
+    # 點座標，形狀 (P, 3)
+    points: NDArray
+
+    # 面的點索引，形狀 (F, 4)，點的順序使法向量由 owner 指向 neighbour（或指向域外）
+    faces: NDArray
+
+    # 各面所屬網格，形狀 (F,)
+    owner: NDArray
+
+    # 各內部面的相鄰網格，形狀 (I,)
+    neighbour: NDArray
+
+    # 邊界 patch
+    patches: List[PolyPatch] = field(default_factory=list)
+
+    @property
+    def n_points(self) -> int:
+        """點數"""
+        return len(self.points)
+
+    @property
+    def n_faces(self) -> int:
+        """面數"""
+        return len(self.faces)
+
+    @property
+    def n_internal_faces(self) -> int:
+        """內部面數"""
+        return len(self.neighbour)
+
+    @property
+    def n_cells(self) -> int:
+        """網格數"""
+        return int(self.owner.max()) + 1 if len(self.owner) else 0
+
+    def note(self) -> str:
+        """owner、neighbour 檔案頭的 note 欄位"""
+        return (
+            f"nPoints:{self.n_points}  nCells:{self.n_cells}  "
+            f"nFaces:{self.n_faces}  nInternalFaces:{self.n_internal_faces}"
+        )
+
+    def validate(self) -> tuple[bool, str]:
+        """驗證陣列形狀、索引範圍與面的排列順序"""
+        n_faces = len(self.faces)
+        n_internal = len(self.neighbour)
+        if self.points.ndim != 2 or self.points.shape[1] != 3:
+            return False, "點座標形狀必須為 (P, 3)"
+        if self.faces.ndim != 2 or self.faces.shape[1] != 4:
+            return False, "面形狀必須為 (F, 4)"
+        if len(self.owner) != n_faces:
+            return False, "owner 數量必須與面數相同"
+        if n_internal > n_faces:
+            return False, "內部面數不可超過面數"
+        if self.faces.size and (
+            self.faces.min() < 0 or self.faces.max() >= len(self.points)
+        ):
+            return False, "點索引超出範圍"
+
+        owner = self.owner[:n_internal].astype(np.int64)
+        neighbour = self.neighbour.astype(np.int64)
+        if np.any(neighbour <= owner):
+            return False, "內部面的 neighbour 必須大於 owner"
+        if np.any(neighbour >= self.n_cells):
+            return False, "neighbour 超出網格範圍"
+        # upper-triangular：(owner, neighbour) 須嚴格遞增
+        key = owner * self.n_cells + neighbour
+        if np.any(np.diff(key) <= 0):
+            return False, "內部面未依 upper-triangular 順序排列"
+
+        start = n_internal
+        for patch in self.patches:
+            if patch.start != start or patch.n_faces < 0:
+                return False, f"patch {patch.name} 的面未連續排列"
+            start += patch.n_faces
+        if start != n_faces:
+            return False, "patch 面數總和與邊界面數不符"
+
+        names = [p.name for p in self.patches]
+        if len(set(names)) != len(names):
+            return False, "patch 名稱不可重複"
+        return True, ""
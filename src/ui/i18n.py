@@ -22,6 +22,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "output_settings": "輸出設定",
         "select_data": "選擇流道數據檔案 (Excel/CSV/TXT)...",
         "output_path": "輸出 blockMeshDict 路徑...",
+        "compact_output": "精簡輸出（不含註解，數值使用最短表示）",
         "browse": "瀏覽...",
         # Mesh params
         "mesh_params": "網格參數設定",
@@ -35,6 +36,21 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "circum_hint": "需為 4 的倍數",
         "axial_cells": "軸向網格數：",
         "axial_hint": "每段 Z 方向的網格密度",
+        "layer_tolerance": "自適應層容許偏差：",
+        "tolerance_hint": "大於 0 時依曲率配置層，層數為上限",
+        "adaptive_off": "關閉（均勻取樣）",
+        "achieved_layers": "實際層數：",
+        "merge_tolerance": "共線層合併容許偏差：",
+        "merge_hint": "半徑沿 Z 線性變化的連續層合併為單一塊",
+        "merge_off": "關閉（不合併）",
+        "blocks_saved": "合併省下的塊數：",
+        "mesh_mode": "網格模式：",
+        "mode_full_3d": "完整 3D（360°）",
+        "mode_wedge": "軸對稱楔形（5°）",
+        "mesh_mode_hint": "楔形模式圓周方向只有 1 格",
+        "axial_edges": "軸向曲線邊中間點：",
+        "axial_edges_hint": "塊邊沿量測曲線彎曲，所需層數較少",
+        "edges_straight": "關閉（直線邊）",
         # Boundary layer
         "boundary_layer": "邊界層控制",
         "enable_bl": "啟用邊界層控制",
@@ -45,6 +61,15 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "outer_layers": "外壁邊界層層數：",
         "expansion_ratio": "邊界層擴展比：",
         "expansion_hint": "每層相對於上一層的厚度比例",
+        "yplus_auto": "依目標 y+ 自動計算層數與擴展比",
+        "density": "流體密度 (kg/m³)：",
+        "viscosity": "動力黏度 (Pa·s)：",
+        "velocity": "平均流速 (m/s)：",
+        "target_yplus": "目標 y+：",
+        "max_expansion": "擴展比上限：",
+        "yplus_hint": "生成時依各取樣層的流道間距計算並填入上方參數",
+        "yplus_result": "第一格高度：",
+        "yplus_reynolds": "，Re：",
         # Cylinder params
         "geometry_params": "幾何參數",
         "square_side": "內方形邊長：",
@@ -57,6 +82,18 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "square_cells": "內方形網格數：",
         "inner_cells": "內圓環網格數：",
         "height_cells": "高度方向網格數：",
+        "axial_ratio": "高度方向擴展比：",
+        "first_cell": "入出口第一格高度：",
+        "first_cell_off": "關閉（使用網格數與擴展比）",
+        "max_cell": "最大網格高度：",
+        "first_cell_hint": "兩端等比加密、中段均勻，自動決定高度方向網格數",
+        "symmetry_mode": "對稱模式：",
+        "symmetry_full": "完整圓柱",
+        "symmetry_half": "半域（z ≥ 0）",
+        "symmetry_quarter": "四分之一域（y、z ≥ 0）",
+        "symmetry_hint": "切面為 symmetryPlane，內方形網格數需為偶數",
+        "cell_count": "網格數：",
+        "of_full": "，完整圓柱的 1/",
         # Data info panel
         "data_info": "資料說明",
         "coord_system": "座標系統",
@@ -108,6 +145,10 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "tip_radial": "從內壁到外壁的網格數量",
         "tip_circum": "圓周方向的網格數量，必須是 4 的倍數",
         "tip_axial": "每個 Z 方向段落內的網格數量",
+        "tip_tolerance": "分段線性重建的壁面與量測曲線的最大偏差（與資料同單位）",
+        "tip_merge": "中間層半徑與首尾兩層連線的最大偏差（與資料同單位）",
+        "tip_axial_edges": "相鄰兩層之間取自量測曲線的中間點數，及曲線邊類型",
+        "tip_mesh_mode": "流道為軸對稱時可改用 5° 楔形，front、back 為 wedge patch",
         "tip_bl_thickness": "邊界層厚度，以徑向距離比例表示 (0~1)",
         "tip_bl_layers": "邊界層內的網格層數",
         "tip_expansion": "相鄰邊界層間的厚度比例，通常設定 1.1~1.5",
@@ -115,6 +156,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generate": "生成",
         "close": "關閉",
         "load_data": "載入資料",
+        "cancel": "取消",
         # Status
         "ready": "就緒",
         "reading_data": "正在讀取資料檔案...",
@@ -122,6 +164,21 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generating": "正在生成 blockMeshDict...",
         "generated": "已生成：",
         "failed": "生成失敗",
+        "stage_cache_lookup": "檢查快取",
+        "stage_parsing": "解析資料",
+        "stage_processing": "排序並分離內外曲線",
+        "stage_caching": "寫入快取",
+        "stage_done": "完成",
+        "stage_sampling": "取樣各層座標",
+        "stage_vertices": "寫入頂點",
+        "stage_blocks": "寫入單元塊",
+        "stage_edges": "寫入圓弧",
+        "stage_boundary": "寫入邊界",
+        "stage_writing": "寫入檔案",
+        "stage_points": "寫入點座標",
+        "stage_faces": "寫入面",
+        "stage_addressing": "寫入 owner/neighbour",
+        "generation_cancelled": "已取消生成",
         # Messages
         "success": "成功",
         "warning": "警告",
@@ -150,6 +207,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "output_settings": "Output Settings",
         "select_data": "Select flow channel data file (Excel/CSV/TXT)...",
         "output_path": "Output blockMeshDict path...",
+        "compact_output": "Compact output (no comments, shortest number format)",
         "browse": "Browse...",
         # Mesh params
         "mesh_params": "Mesh Parameters",
@@ -163,6 +221,21 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "circum_hint": "Must be multiple of 4",
         "axial_cells": "Axial Cells:",
         "axial_hint": "Mesh density per Z segment",
+        "layer_tolerance": "Adaptive Layer Tolerance:",
+        "tolerance_hint": "Above 0, layers follow curvature; layer count is the cap",
+        "adaptive_off": "Off (uniform)",
+        "achieved_layers": "Achieved layers: ",
+        "merge_tolerance": "Collinear Merge Tolerance:",
+        "merge_hint": "Merge layers whose radii vary linearly in Z into one block",
+        "merge_off": "Off (no merging)",
+        "blocks_saved": "Blocks saved by merging: ",
+        "mesh_mode": "Mesh Mode:",
+        "mode_full_3d": "Full 3D (360°)",
+        "mode_wedge": "Axisymmetric wedge (5°)",
+        "mesh_mode_hint": "Wedge mode has a single circumferential cell",
+        "axial_edges": "Axial Edge Points:",
+        "axial_edges_hint": "Edges follow the measured curve; fewer layers needed",
+        "edges_straight": "Off (straight edges)",
         # Boundary layer
         "boundary_layer": "Boundary Layer Control",
         "enable_bl": "Enable Boundary Layer Control",
@@ -173,6 +246,15 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "outer_layers": "Outer Wall BL Layers:",
         "expansion_ratio": "BL Expansion Ratio:",
         "expansion_hint": "Thickness ratio between layers",
+        "yplus_auto": "Compute layers and expansion from target y+",
+        "density": "Fluid Density (kg/m³):",
+        "viscosity": "Dynamic Viscosity (Pa·s):",
+        "velocity": "Mean Velocity (m/s):",
+        "target_yplus": "Target y+:",
+        "max_expansion": "Max Expansion Ratio:",
+        "yplus_hint": "Computed from each sampled layer's gap on generate",
+        "yplus_result": "First cell: ",
+        "yplus_reynolds": ", Re: ",
         # Cylinder params
         "geometry_params": "Geometry Parameters",
         "square_side": "Inner Square Side:",
@@ -185,6 +267,18 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "square_cells": "Inner Square Cells:",
         "inner_cells": "Inner Ring Cells:",
         "height_cells": "Height Cells:",
+        "axial_ratio": "Height Expansion Ratio:",
+        "first_cell": "Inlet/Outlet First Cell:",
+        "first_cell_off": "Off (use cell count and ratio)",
+        "max_cell": "Max Cell Height:",
+        "first_cell_hint": "Both ends refined, uniform core; height cells are computed",
+        "symmetry_mode": "Symmetry:",
+        "symmetry_full": "Full cylinder",
+        "symmetry_half": "Half (z ≥ 0)",
+        "symmetry_quarter": "Quarter (y, z ≥ 0)",
+        "symmetry_hint": "Cut faces are symmetryPlane; square cells must be even",
+        "cell_count": "Cells: ",
+        "of_full": ", 1/",
         # Data info panel
         "data_info": "Data Info",
         "coord_system": "Coordinate System",
@@ -236,6 +330,21 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "tip_radial": "Number of cells from inner to outer wall",
         "tip_circum": "Circumferential cells, must be multiple of 4",
         "tip_axial": "Cells per Z-direction segment",
+        "tip_tolerance": (
+            "Max deviation of the piecewise-linear wall from the measured curve "
+            "(data units)"
+        ),
+        "tip_merge": (
+            "Max deviation of merged inner layers from the line between the run's "
+            "end layers (data units)"
+        ),
+        "tip_mesh_mode": (
+            "For axisymmetric flow use a 5° wedge with wedge-type front/back patches"
+        ),
+        "tip_axial_edges": (
+            "Points taken from the measured curve between adjacent layers, "
+            "and the curved edge type"
+        ),
         "tip_bl_thickness": "Boundary layer thickness ratio (0~1)",
         "tip_bl_layers": "Number of layers in boundary layer",
         "tip_expansion": "Thickness ratio between adjacent BL layers (1.1~1.5)",
@@ -243,6 +352,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generate": "Generate",
         "close": "Close",
         "load_data": "Load Data",
+        "cancel": "Cancel",
         # Status
         "ready": "Ready",
         "reading_data": "Reading data file...",
@@ -250,6 +360,21 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "generating": "Generating blockMeshDict...",
         "generated": "Generated: ",
         "failed": "Generation failed",
+        "stage_cache_lookup": "checking cache",
+        "stage_parsing": "parsing data",
+        "stage_processing": "sorting and splitting curves",
+        "stage_caching": "writing cache",
+        "stage_done": "done",
+        "stage_sampling": "sampling layers",
+        "stage_vertices": "writing vertices",
+        "stage_blocks": "writing blocks",
+        "stage_edges": "writing arcs",
+        "stage_boundary": "writing boundaries",
+        "stage_writing": "writing file",
+        "stage_points": "writing points",
+        "stage_faces": "writing faces",
+        "stage_addressing": "writing owner/neighbour",
+        "generation_cancelled": "Generation cancelled",
         # Messages
         "success": "Success",
         "warning": "Warning",
@@ -7,6 +7,7 @@ BlockMesh Studio 主應用程式視窗
 """
 
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -22,8 +23,10 @@ from PySide6.QtWidgets import (
     QStatusBar,
     QFrame,
     QComboBox,
+    QProgressBar,
+    QCheckBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer
 
 from .widgets.file_selector import FileSelector
 from .widgets.mesh_params_panel import MeshParamsPanel
@@ -32,11 +35,31 @@ from .widgets.cylinder_params_panel import CylinderParamsPanel
 from .widgets.data_info_panel import DataInfoPanel
 from .resources import get_stylesheet
 from .i18n import tr, set_language, get_language
+from .workers import TaskWorker
 
 from ..core.data_reader import DataReader
+from ..core.point_cache import PointCache
+from ..core.artifact_cache import ArtifactCache
 from ..core.mesh_generator import MeshGenerator
 from ..core.cylinder_mesh import CylinderMeshGenerator
-from ..models.mesh_params import MeshParameters, BoundaryLayerParams, CylinderMeshParams
+from ..core.output_profile import PROFILE_ANNOTATED, PROFILE_COMPACT
+from ..core.output_writer import DEFAULT_COMPRESSLEVEL
+from ..core.yplus import yplus_layers
+from ..models.mesh_params import (
+    MeshParameters,
+    BoundaryLayerParams,
+    CylinderMeshParams,
+    YPlusParams,
+)
+
+# 資料路徑停止輸入多久後才開始載入（毫秒）
+LOAD_DEBOUNCE_MS = 300
+
+# 生成前需要先讀取資料時，讀取所佔的進度百分比
+READ_PROGRESS_SPAN = 30
+
+# 輸出檔案過濾器（.gz 以 gzip 壓縮，OpenFOAM 可直接讀取）
+OUTPUT_FILE_FILTER = "All Files (*);;Dict Files (*.dict);;Gzip Compressed (*.gz)"
 
 
 class MainWindow(QMainWindow):
@@ -47,8 +70,24 @@ class MainWindow(QMainWindow):
 
         self._mesh_params = MeshParameters()
         self._bl_params = BoundaryLayerParams()
+        self._yplus_params = YPlusParams()
         self._cylinder_params = CylinderMeshParams()
         self._data_reader = None
+        self._point_cache = PointCache()
+        self._artifact_cache = ArtifactCache()
+
+        # 背景工作
+        self._thread_pool = QThreadPool(self)
+        self._active_workers: set[TaskWorker] = set()
+        self._load_worker: Optional[TaskWorker] = None
+        self._generate_worker: Optional[TaskWorker] = None
+        self._load_generation = 0
+        self._pending_data_path = ""
+
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(LOAD_DEBOUNCE_MS)
+        self._load_timer.timeout.connect(self._start_data_load)
 
         self._setup_window()
         self._setup_ui()
@@ -124,6 +163,17 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage(tr("ready"))
 
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setRange(0, 100)
+        self._progress_bar.setMaximumWidth(200)
+        self._progress_bar.setVisible(False)
+        self._status_bar.addPermanentWidget(self._progress_bar)
+
+        self._cancel_btn = QPushButton(tr("cancel"))
+        self._cancel_btn.setVisible(False)
+        self._cancel_btn.clicked.connect(self._on_cancel_generation)
+        self._status_bar.addPermanentWidget(self._cancel_btn)
+
     def _setup_flow_channel_tab(self) -> None:
         """設定流道轉換分頁"""
         self._flow_tab = QWidget()
@@ -160,12 +210,15 @@ class MainWindow(QMainWindow):
         file_layout.addWidget(self._output_label)
         self._output_selector = FileSelector(
             mode="save",
-            file_filter="All Files (*);;Dict Files (*.dict)",
+            file_filter=OUTPUT_FILE_FILTER,
             default_name="blockMeshDict",
             placeholder=tr("output_path"),
         )
         file_layout.addWidget(self._output_selector)
 
+        self._flow_compact_check = QCheckBox(tr("compact_output"))
+        file_layout.addWidget(self._flow_compact_check)
+
         scroll_layout.addWidget(self._file_group)
 
         # 資料說明面板
@@ -180,6 +233,7 @@ class MainWindow(QMainWindow):
         # 邊界層參數
         self._bl_panel = BoundaryLayerPanel()
         self._bl_panel.paramsChanged.connect(self._on_bl_params_changed)
+        self._bl_panel.yplusParamsChanged.connect(self._on_yplus_params_changed)
         scroll_layout.addWidget(self._bl_panel)
 
         # 說明
@@ -234,11 +288,14 @@ class MainWindow(QMainWindow):
         file_layout.addWidget(self._cyl_output_label)
         self._cylinder_output = FileSelector(
             mode="save",
-            file_filter="All Files (*);;Dict Files (*.dict)",
+            file_filter=OUTPUT_FILE_FILTER,
             default_name="blockMeshDict",
             placeholder=tr("output_path"),
         )
         file_layout.addWidget(self._cylinder_output)
+
+        self._cyl_compact_check = QCheckBox(tr("compact_output"))
+        file_layout.addWidget(self._cyl_compact_check)
         scroll_layout.addWidget(self._cyl_file_group)
 
         # 圓柱參數
@@ -310,6 +367,7 @@ class MainWindow(QMainWindow):
         self._output_label.setText(tr("output_file"))
         self._data_selector.setPlaceholder(tr("select_data"))
         self._output_selector.setPlaceholder(tr("output_path"))
+        self._flow_compact_check.setText(tr("compact_output"))
         self._flow_info_group.setTitle(tr("info"))
         self._flow_info_text.setText(tr("excel_info"))
         self._flow_close_btn.setText(tr("close"))
@@ -319,10 +377,12 @@ class MainWindow(QMainWindow):
         self._cyl_file_group.setTitle(tr("output_settings"))
         self._cyl_output_label.setText(tr("output_file"))
         self._cylinder_output.setPlaceholder(tr("output_path"))
+        self._cyl_compact_check.setText(tr("compact_output"))
         self._cyl_info_group.setTitle(tr("info"))
         self._cyl_info_text.setText(tr("cylinder_info"))
         self._cyl_close_btn.setText(tr("close"))
         self._cyl_generate_btn.setText(tr("generate"))
+        self._cancel_btn.setText(tr("cancel"))
 
         # 子面板
         self._data_selector.retranslateUi()
@@ -336,10 +396,63 @@ class MainWindow(QMainWindow):
         # 狀態列
         self._status_bar.showMessage(tr("ready"))
 
+    def closeEvent(self, event) -> None:
+        """關閉視窗前取消並等待背景工作"""
+        self._load_timer.stop()
+        for worker in self._active_workers:
+            worker.cancel()
+        self._thread_pool.waitForDone()
+        super().closeEvent(event)
+
+    def _start_worker(self, worker: TaskWorker) -> None:
+        """啟動背景工作，完成前保留參照"""
+        self._active_workers.add(worker)
+
+        def release(*_):
+            # 延後釋放，確保同一信號的其他槽已執行完畢
+            QTimer.singleShot(0, lambda: self._active_workers.discard(worker))
+
+        worker.signals.finished.connect(release)
+        worker.signals.failed.connect(release)
+        worker.signals.cancelled.connect(release)
+        self._thread_pool.start(worker)
+
     def _on_data_file_changed(self, path: str) -> None:
-        """處理資料檔案路徑變更"""
+        """處理資料檔案路徑變更（停止輸入後才於背景載入）"""
+        self._cancel_data_load()
+        self._data_reader = None
+        self._pending_data_path = path
+
         if not path:
+            self._load_timer.stop()
             self._data_info_panel.clearStatistics()
+            self._status_bar.showMessage(tr("ready"))
+            return
+
+        self._load_timer.start()
+
+    def _cancel_data_load(self) -> None:
+        """取消進行中的資料載入，其結果將被忽略"""
+        self._load_generation += 1
+        if self._load_worker is not None:
+            self._load_worker.cancel()
+            self._load_worker = None
+        self._show_load_progress(False)
+
+    def _show_load_progress(self, visible: bool) -> None:
+        """顯示或隱藏載入進度（生成進行中時進度條由生成使用）"""
+        if self._generate_worker is None:
+            self._progress_bar.setValue(0)
+            self._progress_bar.setVisible(visible)
+
+    def _start_data_load(self) -> None:
+        """在背景載入目前的資料檔案"""
+        path = self._pending_data_path
+
+        # 輸入中的路徑可能尚不存在，不視為錯誤
+        if not Path(path).is_file():
+            self._data_info_panel.clearStatistics()
+            self._status_bar.showMessage(tr("file_not_found") + path)
             return
 
         # 檢查檔案格式
@@ -347,31 +460,69 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, tr("warning"), tr("unsupported_format"))
             return
 
-        # 嘗試載入資料
-        try:
-            self._status_bar.showMessage(tr("reading_data"))
-            self._data_reader = DataReader(path)
-            self._data_reader.read()
-
-            # 更新統計資訊
-            self._data_info_panel.setStatistics(self._data_reader.statistics)
-
-            # 自動設定輸出路徑
-            p = Path(path)
-            case_dir = p.parent / p.stem
-            system_dir = case_dir / "system"
-            self._output_selector.setPath(str(system_dir / "blockMeshDict"))
-
-            self._status_bar.showMessage(
-                tr("data_loaded")
-                + f"{self._data_reader.statistics.total_points} "
-                + tr("total_points").rstrip("：:")
+        generation = self._load_generation
+        reader = DataReader(path, cache=self._point_cache)
+        worker = TaskWorker(reader.read)
+        worker.signals.progress.connect(
+            lambda percent, stage: self._on_data_load_progress(
+                generation, percent, stage
             )
+        )
+        worker.signals.finished.connect(
+            lambda _: self._on_data_loaded(generation, reader)
+        )
+        worker.signals.failed.connect(
+            lambda error: self._on_data_load_failed(generation, error)
+        )
 
-        except Exception as e:
-            QMessageBox.warning(self, tr("error"), tr("process_error") + f"\n{e}")
-            self._data_info_panel.clearStatistics()
-            self._status_bar.showMessage(tr("ready"))
+        self._load_worker = worker
+        self._show_load_progress(True)
+        if self._generate_worker is None:
+            self._status_bar.showMessage(tr("reading_data"))
+        self._start_worker(worker)
+
+    def _on_data_load_progress(self, generation: int, percent: int, stage: str) -> None:
+        """更新資料載入進度"""
+        if generation != self._load_generation or self._generate_worker is not None:
+            return
+
+        self._progress_bar.setValue(percent)
+        self._status_bar.showMessage(f"{tr('reading_data')} {tr(stage)}")
+
+    def _on_data_loaded(self, generation: int, reader: DataReader) -> None:
+        """資料載入完成"""
+        if generation != self._load_generation:
+            return
+
+        self._load_worker = None
+        self._show_load_progress(False)
+        self._data_reader = reader
+
+        # 更新統計資訊
+        self._data_info_panel.setStatistics(reader.statistics)
+
+        # 自動設定輸出路徑
+        p = reader.file_path
+        case_dir = p.parent / p.stem
+        system_dir = case_dir / "system"
+        self._output_selector.setPath(str(system_dir / "blockMeshDict"))
+
+        self._status_bar.showMessage(
+            tr("data_loaded")
+            + f"{reader.statistics.total_points} "
+            + tr("total_points").rstrip("：:")
+        )
+
+    def _on_data_load_failed(self, generation: int, error: Exception) -> None:
+        """資料載入失敗"""
+        if generation != self._load_generation:
+            return
+
+        self._load_worker = None
+        self._show_load_progress(False)
+        QMessageBox.warning(self, tr("error"), tr("process_error") + f"\n{error}")
+        self._data_info_panel.clearStatistics()
+        self._status_bar.showMessage(tr("ready"))
 
     def _on_mesh_params_changed(self, params: MeshParameters) -> None:
         """處理網格參數變更"""
@@ -381,12 +532,16 @@ class MainWindow(QMainWindow):
         """處理邊界層參數變更"""
         self._bl_params = params
 
+    def _on_yplus_params_changed(self, params: YPlusParams) -> None:
+        """處理 y+ 參數變更"""
+        self._yplus_params = params
+
     def _on_cylinder_params_changed(self, params: CylinderMeshParams) -> None:
         """處理圓柱參數變更"""
         self._cylinder_params = params
 
     def _on_generate_flow(self) -> None:
-        """生成流道轉換的 blockMeshDict"""
+        """生成流道轉換的 blockMeshDict（於背景執行）"""
         data_path = self._data_selector.path()
         output_path = self._output_selector.path()
 
@@ -409,38 +564,88 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, tr("param_error"), msg)
             return
 
-        try:
-            self._status_bar.showMessage(tr("reading_data"))
-
-            # 讀取資料（如果還沒讀取）
-            if self._data_reader is None:
-                self._data_reader = DataReader(data_path)
-                self._data_reader.read()
+        valid, msg = self._yplus_params.validate()
+        if not valid:
+            QMessageBox.warning(self, tr("param_error"), msg)
+            return
 
-            inner_samples, outer_samples = self._data_reader.sample_layers(
-                self._mesh_params.num_layers
+        # 讀取資料（如果還沒讀取或背景載入尚未完成）
+        reader = self._data_reader
+        needs_read = reader is None or reader.file_path != Path(data_path)
+        if needs_read:
+            reader = DataReader(data_path, cache=self._point_cache)
+
+        mesh_params = self._mesh_params
+        bl_params = self._bl_params
+        yplus_params = self._yplus_params
+        profile = self._output_profile(self._flow_compact_check)
+        compresslevel = self._compresslevel(output_path)
+        artifact_cache = self._artifact_cache
+
+        achieved = {}
+
+        def task(progress):
+            if needs_read:
+                # 讀取與生成各佔一段進度，進度條不倒退
+                reader.read(progress.sub(0, READ_PROGRESS_SPAN))
+                progress = progress.sub(READ_PROGRESS_SPAN, 100)
+
+            progress.report(0, "stage_sampling")
+            inner_samples, outer_samples = reader.sample_layers(
+                mesh_params.num_layers,
+                mesh_params.layer_tolerance,
+                mesh_params.axial_edge_points,
             )
-
-            self._status_bar.showMessage(tr("generating"))
-
-            # 生成網格
-            generator = MeshGenerator(self._mesh_params, self._bl_params)
-            generator.generate(inner_samples, outer_samples, output_path)
-
-            self._status_bar.showMessage(tr("generated") + output_path)
-            QMessageBox.information(
-                self, tr("success"), tr("success_msg") + f"\n{output_path}"
+            stride = mesh_params.edge_stride
+            achieved["layers"] = (len(inner_samples) - 1) // stride + 1
+
+            layer_bl = bl_params
+            if yplus_params.enabled and bl_params.enabled:
+                # 依各取樣層的間距計算第一格高度，填入層數與擴展比
+                result = yplus_layers(
+                    inner_samples,
+                    outer_samples,
+                    yplus_params,
+                    bl_params,
+                    mesh_params.scale_factor,
+                )
+                layer_bl = result.boundary_layer_params(bl_params)
+                k = result.critical_layer
+                achieved["yplus"] = (
+                    layer_bl,
+                    (float(result.first_cell[k]), float(result.reynolds[k])),
+                )
+
+            generator = MeshGenerator(mesh_params, layer_bl, profile, compresslevel)
+            if mesh_params.merge_tolerance > 0:
+                consolidation = generator.consolidate(inner_samples, outer_samples)
+                achieved["blocks_saved"] = consolidation.blocks_saved
+            artifact_cache.get_or_create(
+                generator.artifact_key(inner_samples, outer_samples),
+                output_path,
+                lambda path: generator.update_path(
+                    inner_samples, outer_samples, path, progress
+                ),
             )
-
-        except FileNotFoundError as e:
-            QMessageBox.critical(self, tr("error"), tr("file_not_found") + str(e))
-            self._status_bar.showMessage(tr("failed"))
-        except Exception as e:
-            QMessageBox.critical(self, tr("error"), tr("process_error") + f"\n{e}")
-            self._status_bar.showMessage(tr("failed"))
+            return output_path
+
+        def show_layer_summary(_):
+            # 生成時才讀取的資料同樣保留，之後生成不需重新讀取
+            if needs_read and self._data_selector.path() == data_path:
+                self._data_reader = reader
+                self._data_info_panel.setStatistics(reader.statistics)
+            if mesh_params.layer_tolerance > 0:
+                self._mesh_panel.setAchievedLayers(achieved.get("layers"))
+            self._mesh_panel.setBlocksSaved(achieved.get("blocks_saved"))
+            if "yplus" in achieved:
+                layer_bl, summary = achieved["yplus"]
+                self._bl_panel.setParams(layer_bl)
+                self._bl_panel.setYPlusResult(summary)
+
+        self._start_generation(task, show_layer_summary)
 
     def _on_generate_cylinder(self) -> None:
-        """生成圓柱網格的 blockMeshDict"""
+        """生成圓柱網格的 blockMeshDict（於背景執行）"""
         output_path = self._cylinder_output.path()
 
         if not output_path:
@@ -453,17 +658,101 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, tr("param_error"), msg)
             return
 
-        try:
-            self._status_bar.showMessage(tr("generating"))
-
-            generator = CylinderMeshGenerator(self._cylinder_params)
-            generator.generate(output_path)
-
-            self._status_bar.showMessage(tr("generated") + output_path)
-            QMessageBox.information(
-                self, tr("success"), tr("success_msg") + f"\n{output_path}"
+        generator = CylinderMeshGenerator(
+            self._cylinder_params,
+            self._output_profile(self._cyl_compact_check),
+            self._compresslevel(output_path),
+        )
+        artifact_cache = self._artifact_cache
+        counts = {}
+
+        def task(progress):
+            counts["cells"] = generator.cell_counts()
+            artifact_cache.get_or_create(
+                generator.artifact_key(),
+                output_path,
+                lambda path: generator.update_path(path, progress),
             )
+            return output_path
+
+        def show_cell_counts(_):
+            self._cylinder_panel.setCellCounts(counts.get("cells"))
+
+        self._start_generation(task, show_cell_counts)
+
+    @staticmethod
+    def _output_profile(compact_check: QCheckBox) -> str:
+        """依勾選狀態取得輸出格式"""
+        return PROFILE_COMPACT if compact_check.isChecked() else PROFILE_ANNOTATED
+
+    @staticmethod
+    def _compresslevel(output_path: str) -> Optional[int]:
+        """輸出路徑為 .gz 時以 gzip 壓縮"""
+        return DEFAULT_COMPRESSLEVEL if output_path.endswith(".gz") else None
+
+    def _start_generation(self, task, on_finished=None) -> None:
+        """
+        啟動背景生成，期間停用生成按鈕並顯示進度與取消按鈕
+
+        Args:
+            task: 背景任務
+            on_finished: 成功完成時額外呼叫的函數（可選，參數為任務結果）
+        """
+        worker = TaskWorker(task)
+        worker.signals.progress.connect(self._on_generation_progress)
+        if on_finished is not None:
+            worker.signals.finished.connect(on_finished)
+        worker.signals.finished.connect(self._on_generation_finished)
+        worker.signals.failed.connect(self._on_generation_failed)
+        worker.signals.cancelled.connect(self._on_generation_cancelled)
+        self._generate_worker = worker
+
+        self._flow_generate_btn.setEnabled(False)
+        self._cyl_generate_btn.setEnabled(False)
+        self._cancel_btn.setEnabled(True)
+        self._cancel_btn.setVisible(True)
+        self._progress_bar.setValue(0)
+        self._progress_bar.setVisible(True)
+        self._status_bar.showMessage(tr("generating"))
+        self._start_worker(worker)
+
+    def _finish_generation(self) -> None:
+        """生成結束（成功、失敗或取消），恢復按鈕狀態"""
+        self._generate_worker = None
+        self._flow_generate_btn.setEnabled(True)
+        self._cyl_generate_btn.setEnabled(True)
+        self._cancel_btn.setVisible(False)
+        self._progress_bar.setVisible(False)
+
+    def _on_cancel_generation(self) -> None:
+        """要求取消生成（寫入於下一個檢查點停止，不留下寫到一半的檔案）"""
+        if self._generate_worker is not None:
+            self._generate_worker.cancel()
+            self._cancel_btn.setEnabled(False)
+
+    def _on_generation_progress(self, percent: int, stage: str) -> None:
+        """更新生成進度"""
+        self._progress_bar.setValue(percent)
+        self._status_bar.showMessage(f"{tr('generating')} {tr(stage)}")
+
+    def _on_generation_finished(self, output_path: str) -> None:
+        """生成完成"""
+        self._finish_generation()
+        self._status_bar.showMessage(tr("generated") + output_path)
+        QMessageBox.information(
+            self, tr("success"), tr("success_msg") + f"\n{output_path}"
+        )
 
-        except Exception as e:
-            QMessageBox.critical(self, tr("error"), tr("process_error") + f"\n{e}")
-            self._status_bar.showMessage(tr("failed"))
+    def _on_generation_failed(self, error: Exception) -> None:
+        """生成失敗"""
+        self._finish_generation()
+        if isinstance(error, FileNotFoundError):
+            QMessageBox.critical(self, tr("error"), tr("file_not_found") + str(error))
+        else:
+            QMessageBox.critical(self, tr("error"), tr("process_error") + f"\n{error}")
+        self._status_bar.showMessage(tr("failed"))
+
+    def _on_generation_cancelled(self) -> None:
+        """生成已取消"""
+        self._finish_generation()
+        self._status_bar.showMessage(tr("generation_cancelled"))
@@ -3,6 +3,8 @@
 邊界層參數面板元件
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,7 +17,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Signal
 
-from ...models.mesh_params import BoundaryLayerParams
+from ...models.mesh_params import BoundaryLayerParams, YPlusParams
 from ..i18n import tr
 
 
@@ -25,6 +27,9 @@ class BoundaryLayerPanel(QWidget):
     # 參數變更信號
     paramsChanged = Signal(BoundaryLayerParams)
 
+    # y+ 參數變更信號
+    yplusParamsChanged = Signal(YPlusParams)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
@@ -84,7 +89,7 @@ class BoundaryLayerPanel(QWidget):
         self._inner_layers_label = QLabel(tr("inner_layers"))
         params_layout.addWidget(self._inner_layers_label, row, 0)
         self._inner_layers_spin = QSpinBox()
-        self._inner_layers_spin.setRange(1, 20)
+        self._inner_layers_spin.setRange(1, 100)
         self._inner_layers_spin.setValue(5)
         params_layout.addWidget(self._inner_layers_spin, row, 1)
         row += 1
@@ -93,7 +98,7 @@ class BoundaryLayerPanel(QWidget):
         self._outer_layers_label = QLabel(tr("outer_layers"))
         params_layout.addWidget(self._outer_layers_label, row, 0)
         self._outer_layers_spin = QSpinBox()
-        self._outer_layers_spin.setRange(1, 20)
+        self._outer_layers_spin.setRange(1, 100)
         self._outer_layers_spin.setValue(5)
         params_layout.addWidget(self._outer_layers_spin, row, 1)
         row += 1
@@ -103,13 +108,47 @@ class BoundaryLayerPanel(QWidget):
         params_layout.addWidget(self._expansion_label, row, 0)
         self._expansion_spin = QDoubleSpinBox()
         self._expansion_spin.setRange(1.01, 2.0)
-        self._expansion_spin.setDecimals(2)
+        self._expansion_spin.setDecimals(4)
         self._expansion_spin.setValue(1.2)
         self._expansion_spin.setSingleStep(0.05)
         params_layout.addWidget(self._expansion_spin, row, 1)
         self._expansion_hint = QLabel(tr("expansion_hint"))
         self._expansion_hint.setObjectName("subtitleLabel")
         params_layout.addWidget(self._expansion_hint, row, 2)
+        row += 1
+
+        # 依目標 y+ 自動計算
+        self._yplus_check = QCheckBox(tr("yplus_auto"))
+        params_layout.addWidget(self._yplus_check, row, 0, 1, 3)
+        row += 1
+
+        defaults = YPlusParams()
+        self._yplus_labels = {}
+        self._yplus_spins = {}
+        fields = (
+            ("density", 0.01, 20000.0, 3, defaults.density),
+            ("viscosity", 1e-7, 10.0, 8, defaults.viscosity),
+            ("velocity", 0.001, 1000.0, 3, defaults.velocity),
+            ("target_yplus", 0.1, 300.0, 2, defaults.target_yplus),
+            ("max_expansion", 1.01, 2.0, 2, defaults.max_expansion),
+        )
+        for key, low, high, decimals, value in fields:
+            label = QLabel(tr(key))
+            params_layout.addWidget(label, row, 0)
+            spin = QDoubleSpinBox()
+            spin.setRange(low, high)
+            spin.setDecimals(decimals)
+            spin.setValue(value)
+            params_layout.addWidget(spin, row, 1)
+            self._yplus_labels[key] = label
+            self._yplus_spins[key] = spin
+            row += 1
+
+        self._yplus_result = None
+        self._yplus_hint = QLabel(tr("yplus_hint"))
+        self._yplus_hint.setObjectName("subtitleLabel")
+        self._yplus_hint.setWordWrap(True)
+        params_layout.addWidget(self._yplus_hint, row, 0, 1, 3)
 
         group_layout.addWidget(self._params_widget)
         layout.addWidget(self._group)
@@ -118,21 +157,38 @@ class BoundaryLayerPanel(QWidget):
         """連接信號"""
         self._enabled_check.toggled.connect(self._update_enabled_state)
         self._enabled_check.toggled.connect(self._emit_params)
+        self._enabled_check.toggled.connect(self._emit_yplus_params)
         self._inner_thickness_spin.valueChanged.connect(self._emit_params)
         self._outer_thickness_spin.valueChanged.connect(self._emit_params)
         self._inner_layers_spin.valueChanged.connect(self._emit_params)
         self._outer_layers_spin.valueChanged.connect(self._emit_params)
         self._expansion_spin.valueChanged.connect(self._emit_params)
+        self._yplus_check.toggled.connect(self._update_enabled_state)
+        self._yplus_check.toggled.connect(self._emit_yplus_params)
+        for spin in self._yplus_spins.values():
+            spin.valueChanged.connect(self._emit_yplus_params)
 
     def _update_enabled_state(self) -> None:
         """更新啟用狀態"""
         enabled = self._enabled_check.isChecked()
         self._params_widget.setEnabled(enabled)
 
+        # 依 y+ 計算時層數與擴展比由計算結果填入
+        auto = self._yplus_check.isChecked()
+        self._inner_layers_spin.setEnabled(not auto)
+        self._outer_layers_spin.setEnabled(not auto)
+        self._expansion_spin.setEnabled(not auto)
+        for spin in self._yplus_spins.values():
+            spin.setEnabled(auto)
+
     def _emit_params(self) -> None:
         """發射參數變更信號"""
         self.paramsChanged.emit(self.getParams())
 
+    def _emit_yplus_params(self) -> None:
+        """發射 y+ 參數變更信號"""
+        self.yplusParamsChanged.emit(self.getYPlusParams())
+
     def retranslateUi(self) -> None:
         """重新翻譯 UI"""
         self._group.setTitle(tr("boundary_layer"))
@@ -145,6 +201,10 @@ class BoundaryLayerPanel(QWidget):
         self._outer_layers_label.setText(tr("outer_layers"))
         self._expansion_label.setText(tr("expansion_ratio"))
         self._expansion_hint.setText(tr("expansion_hint"))
+        self._yplus_check.setText(tr("yplus_auto"))
+        for key, label in self._yplus_labels.items():
+            label.setText(tr(key))
+        self._update_yplus_hint()
 
     def getParams(self) -> BoundaryLayerParams:
         """取得目前參數"""
@@ -165,3 +225,45 @@ class BoundaryLayerPanel(QWidget):
         self._inner_layers_spin.setValue(params.inner_layers)
         self._outer_layers_spin.setValue(params.outer_layers)
         self._expansion_spin.setValue(params.expansion_ratio)
+
+    def getYPlusParams(self) -> YPlusParams:
+        """取得目前 y+ 參數（只在啟用邊界層時生效）"""
+        spins = self._yplus_spins
+        return YPlusParams(
+            enabled=self._enabled_check.isChecked() and self._yplus_check.isChecked(),
+            density=spins["density"].value(),
+            viscosity=spins["viscosity"].value(),
+            velocity=spins["velocity"].value(),
+            target_yplus=spins["target_yplus"].value(),
+            max_expansion=spins["max_expansion"].value(),
+        )
+
+    def setYPlusParams(self, params: YPlusParams) -> None:
+        """設定 y+ 參數"""
+        self._yplus_check.setChecked(params.enabled)
+        self._yplus_spins["density"].setValue(params.density)
+        self._yplus_spins["viscosity"].setValue(params.viscosity)
+        self._yplus_spins["velocity"].setValue(params.velocity)
+        self._yplus_spins["target_yplus"].setValue(params.target_yplus)
+        self._yplus_spins["max_expansion"].setValue(params.max_expansion)
+
+    def setYPlusResult(self, result: Optional[tuple[float, float]]) -> None:
+        """
+        顯示 y+ 計算結果
+
+        Args:
+            result: 最需要加密一層的 (第一格高度 m, 雷諾數)（None 時恢復提示文字）
+        """
+        self._yplus_result = result
+        self._update_yplus_hint()
+
+    def _update_yplus_hint(self) -> None:
+        """更新 y+ 提示文字"""
+        if self._yplus_result is None:
+            self._yplus_hint.setText(tr("yplus_hint"))
+            return
+        first_cell, reynolds = self._yplus_result
+        self._yplus_hint.setText(
+            f"{tr('yplus_result')}{first_cell:.3g} m"
+            f"{tr('yplus_reynolds')}{reynolds:,.0f}"
+        )
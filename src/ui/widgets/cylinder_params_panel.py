@@ -3,6 +3,8 @@
 圓柱網格參數面板元件
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -11,10 +13,11 @@ from PySide6.QtWidgets import (
     QLabel,
     QSpinBox,
     QDoubleSpinBox,
+    QComboBox,
 )
 from PySide6.QtCore import Signal
 
-from ...models.mesh_params import CylinderMeshParams
+from ...models.mesh_params import SYMMETRY_MODES, CylinderMeshParams
 from ..i18n import tr
 
 
@@ -132,6 +135,61 @@ class CylinderParamsPanel(QWidget):
         self._nh_spin.setRange(1, 1000)
         self._nh_spin.setValue(120)
         mesh_layout.addWidget(self._nh_spin, row, 1)
+        row += 1
+
+        # 高度方向擴展比
+        self._ratio_label = QLabel(tr("axial_ratio"))
+        mesh_layout.addWidget(self._ratio_label, row, 0)
+        self._ratio_spin = QDoubleSpinBox()
+        self._ratio_spin.setRange(0.01, 100)
+        self._ratio_spin.setDecimals(3)
+        self._ratio_spin.setValue(1.0)
+        self._ratio_spin.setSingleStep(0.1)
+        mesh_layout.addWidget(self._ratio_spin, row, 1)
+        row += 1
+
+        # 入出口第一格高度與最大網格高度（自動多段漸變）
+        self._first_cell_label = QLabel(tr("first_cell"))
+        mesh_layout.addWidget(self._first_cell_label, row, 0)
+        self._first_cell_spin = QDoubleSpinBox()
+        self._first_cell_spin.setRange(0.0, 100)
+        self._first_cell_spin.setDecimals(5)
+        self._first_cell_spin.setValue(0.0)
+        self._first_cell_spin.setSingleStep(0.001)
+        self._first_cell_spin.setSpecialValueText(tr("first_cell_off"))
+        mesh_layout.addWidget(self._first_cell_spin, row, 1)
+        row += 1
+
+        self._max_cell_label = QLabel(tr("max_cell"))
+        mesh_layout.addWidget(self._max_cell_label, row, 0)
+        self._max_cell_spin = QDoubleSpinBox()
+        self._max_cell_spin.setRange(0.0001, 100)
+        self._max_cell_spin.setDecimals(4)
+        self._max_cell_spin.setValue(0.05)
+        self._max_cell_spin.setSingleStep(0.01)
+        self._max_cell_spin.setEnabled(False)
+        mesh_layout.addWidget(self._max_cell_spin, row, 1)
+        row += 1
+        self._first_cell_hint = QLabel(tr("first_cell_hint"))
+        self._first_cell_hint.setObjectName("subtitleLabel")
+        self._first_cell_hint.setWordWrap(True)
+        mesh_layout.addWidget(self._first_cell_hint, row, 0, 1, 2)
+        row += 1
+
+        # 對稱模式（完整、半域、四分之一域）
+        self._symmetry_label = QLabel(tr("symmetry_mode"))
+        mesh_layout.addWidget(self._symmetry_label, row, 0)
+        self._symmetry_combo = QComboBox()
+        self._symmetry_combo.addItems([tr(f"symmetry_{m}") for m in SYMMETRY_MODES])
+        mesh_layout.addWidget(self._symmetry_combo, row, 1)
+        row += 1
+        self._symmetry_hint = QLabel(tr("symmetry_hint"))
+        self._symmetry_hint.setObjectName("subtitleLabel")
+        self._symmetry_hint.setWordWrap(True)
+        mesh_layout.addWidget(self._symmetry_hint, row, 0, 1, 2)
+
+        # 最近一次生成的網格數與完整圓柱網格數（None 為尚未生成）
+        self._cell_counts = None
 
         layout.addWidget(self._mesh_group)
         layout.addStretch()
@@ -147,13 +205,44 @@ class CylinderParamsPanel(QWidget):
             self._ns_spin,
             self._ni_spin,
             self._nh_spin,
+            self._ratio_spin,
+            self._first_cell_spin,
+            self._max_cell_spin,
         ]:
             spin.valueChanged.connect(self._emit_params)
+        self._symmetry_combo.currentIndexChanged.connect(self._emit_params)
 
     def _emit_params(self) -> None:
         """發射參數變更信號"""
+        # 設定第一格高度時網格數與擴展比改為自動計算
+        auto = self._first_cell_spin.value() > 0
+        self._nh_spin.setEnabled(not auto)
+        self._ratio_spin.setEnabled(not auto)
+        self._max_cell_spin.setEnabled(auto)
+        self.setCellCounts(None)
         self.paramsChanged.emit(self.getParams())
 
+    def setCellCounts(self, counts: Optional[tuple[int, int]]) -> None:
+        """
+        顯示對稱模式的網格數與減少比例
+
+        Args:
+            counts: (網格數, 完整圓柱網格數)（None 時恢復提示文字）
+        """
+        self._cell_counts = counts
+        self._update_symmetry_hint()
+
+    def _update_symmetry_hint(self) -> None:
+        """更新對稱模式的提示文字"""
+        if self._cell_counts is None:
+            self._symmetry_hint.setText(tr("symmetry_hint"))
+            return
+        cells, full = self._cell_counts
+        text = f"{tr('cell_count')}{cells:,}"
+        if cells < full:
+            text += f"{tr('of_full')}{full // cells}"
+        self._symmetry_hint.setText(text)
+
     def retranslateUi(self) -> None:
         """重新翻譯 UI"""
         self._geom_group.setTitle(tr("geometry_params"))
@@ -167,6 +256,15 @@ class CylinderParamsPanel(QWidget):
         self._ns_label.setText(tr("square_cells"))
         self._ni_label.setText(tr("inner_cells"))
         self._nh_label.setText(tr("height_cells"))
+        self._ratio_label.setText(tr("axial_ratio"))
+        self._first_cell_label.setText(tr("first_cell"))
+        self._first_cell_spin.setSpecialValueText(tr("first_cell_off"))
+        self._max_cell_label.setText(tr("max_cell"))
+        self._first_cell_hint.setText(tr("first_cell_hint"))
+        self._symmetry_label.setText(tr("symmetry_mode"))
+        for index, mode in enumerate(SYMMETRY_MODES):
+            self._symmetry_combo.setItemText(index, tr(f"symmetry_{mode}"))
+        self._update_symmetry_hint()
 
     def getParams(self) -> CylinderMeshParams:
         """取得目前參數"""
@@ -179,6 +277,10 @@ class CylinderParamsPanel(QWidget):
             n_cells_square=self._ns_spin.value(),
             n_cells_inner=self._ni_spin.value(),
             n_cells_height=self._nh_spin.value(),
+            symmetry=SYMMETRY_MODES[self._symmetry_combo.currentIndex()],
+            axial_grading=self._ratio_spin.value(),
+            first_cell_height=self._first_cell_spin.value(),
+            max_cell_height=self._max_cell_spin.value(),
         )
 
     def setParams(self, params: CylinderMeshParams) -> None:
@@ -191,3 +293,8 @@ class CylinderParamsPanel(QWidget):
         self._ns_spin.setValue(params.n_cells_square)
         self._ni_spin.setValue(params.n_cells_inner)
         self._nh_spin.setValue(params.n_cells_height)
+        self._symmetry_combo.setCurrentIndex(SYMMETRY_MODES.index(params.symmetry))
+        self._ratio_spin.setValue(params.axial_grading)
+        if params.max_cell_height > 0:
+            self._max_cell_spin.setValue(params.max_cell_height)
+        self._first_cell_spin.setValue(params.first_cell_height)
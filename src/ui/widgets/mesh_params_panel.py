@@ -3,17 +3,22 @@
 網格參數面板元件
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
+    QHBoxLayout,
     QGridLayout,
     QGroupBox,
     QLabel,
     QSpinBox,
     QDoubleSpinBox,
+    QComboBox,
 )
 from PySide6.QtCore import Signal
 
+from ...models.block_mesh import CURVE_TYPES
 from ...models.mesh_params import MeshParameters
 from ..i18n import tr
 
@@ -82,6 +87,18 @@ class MeshParamsPanel(QWidget):
         group_layout.addWidget(self._radial_hint, row, 2)
         row += 1
 
+        # 網格模式：完整 3D 或軸對稱楔形
+        self._mode_label = QLabel(tr("mesh_mode"))
+        group_layout.addWidget(self._mode_label, row, 0)
+        self._mode_combo = QComboBox()
+        self._mode_combo.addItems([tr("mode_full_3d"), tr("mode_wedge")])
+        self._mode_combo.setToolTip(tr("tip_mesh_mode"))
+        group_layout.addWidget(self._mode_combo, row, 1)
+        self._mode_hint = QLabel(tr("mesh_mode_hint"))
+        self._mode_hint.setObjectName("subtitleLabel")
+        group_layout.addWidget(self._mode_hint, row, 2)
+        row += 1
+
         # 圓周方向網格數
         self._circum_label = QLabel(tr("circum_cells"))
         group_layout.addWidget(self._circum_label, row, 0)
@@ -107,6 +124,63 @@ class MeshParamsPanel(QWidget):
         self._axial_hint = QLabel(tr("axial_hint"))
         self._axial_hint.setObjectName("subtitleLabel")
         group_layout.addWidget(self._axial_hint, row, 2)
+        row += 1
+
+        # 自適應層容許偏差
+        self._tolerance_label = QLabel(tr("layer_tolerance"))
+        group_layout.addWidget(self._tolerance_label, row, 0)
+        self._tolerance_spin = QDoubleSpinBox()
+        self._tolerance_spin.setRange(0.0, 100.0)
+        self._tolerance_spin.setDecimals(4)
+        self._tolerance_spin.setValue(0.0)
+        self._tolerance_spin.setSingleStep(0.01)
+        self._tolerance_spin.setSpecialValueText(tr("adaptive_off"))
+        self._tolerance_spin.setToolTip(tr("tip_tolerance"))
+        group_layout.addWidget(self._tolerance_spin, row, 1)
+        self._tolerance_hint = QLabel(tr("tolerance_hint"))
+        self._tolerance_hint.setObjectName("subtitleLabel")
+        group_layout.addWidget(self._tolerance_hint, row, 2)
+        row += 1
+
+        # 共線層合併容許偏差
+        self._merge_label = QLabel(tr("merge_tolerance"))
+        group_layout.addWidget(self._merge_label, row, 0)
+        self._merge_spin = QDoubleSpinBox()
+        self._merge_spin.setRange(0.0, 100.0)
+        self._merge_spin.setDecimals(4)
+        self._merge_spin.setValue(0.0)
+        self._merge_spin.setSingleStep(0.01)
+        self._merge_spin.setSpecialValueText(tr("merge_off"))
+        self._merge_spin.setToolTip(tr("tip_merge"))
+        group_layout.addWidget(self._merge_spin, row, 1)
+        self._merge_hint = QLabel(tr("merge_hint"))
+        self._merge_hint.setObjectName("subtitleLabel")
+        group_layout.addWidget(self._merge_hint, row, 2)
+        row += 1
+
+        # 軸向曲線邊：中間點數與類型
+        self._edges_label = QLabel(tr("axial_edges"))
+        group_layout.addWidget(self._edges_label, row, 0)
+        self._edge_points_spin = QSpinBox()
+        self._edge_points_spin.setRange(0, 20)
+        self._edge_points_spin.setValue(0)
+        self._edge_points_spin.setSpecialValueText(tr("edges_straight"))
+        self._edge_type_combo = QComboBox()
+        self._edge_type_combo.addItems(CURVE_TYPES)
+        self._edge_type_combo.setEnabled(False)
+        edges_layout = QHBoxLayout()
+        edges_layout.addWidget(self._edge_points_spin, 1)
+        edges_layout.addWidget(self._edge_type_combo)
+        for widget in (self._edge_points_spin, self._edge_type_combo):
+            widget.setToolTip(tr("tip_axial_edges"))
+        group_layout.addLayout(edges_layout, row, 1)
+        self._edges_hint = QLabel(tr("axial_edges_hint"))
+        self._edges_hint.setObjectName("subtitleLabel")
+        group_layout.addWidget(self._edges_hint, row, 2)
+
+        # 最近一次生成的實際層數與合併省下的塊數（None 為尚未生成）
+        self._achieved_layers = None
+        self._blocks_saved = None
 
         layout.addWidget(self._group)
 
@@ -117,11 +191,64 @@ class MeshParamsPanel(QWidget):
         self._radial_spin.valueChanged.connect(self._emit_params)
         self._circum_spin.valueChanged.connect(self._emit_params)
         self._axial_spin.valueChanged.connect(self._emit_params)
+        self._tolerance_spin.valueChanged.connect(self._emit_params)
+        self._merge_spin.valueChanged.connect(self._emit_params)
+        self._edge_points_spin.valueChanged.connect(self._on_edge_points_changed)
+        self._edge_type_combo.currentIndexChanged.connect(self._emit_params)
+        self._mode_combo.currentIndexChanged.connect(self._on_mode_changed)
+
+    def _on_mode_changed(self, index: int) -> None:
+        """楔形模式圓周方向固定 1 格，停用圓周網格數"""
+        self._circum_spin.setEnabled(index == 0)
+        self._emit_params()
+
+    def _on_edge_points_changed(self, edge_points: int) -> None:
+        """中間點數為 0（直線邊）時停用曲線邊類型"""
+        self._edge_type_combo.setEnabled(edge_points > 0)
+        self._emit_params()
 
     def _emit_params(self) -> None:
         """發射參數變更信號"""
+        self.setAchievedLayers(None)
+        self.setBlocksSaved(None)
         self.paramsChanged.emit(self.getParams())
 
+    def setAchievedLayers(self, num_layers: Optional[int]) -> None:
+        """
+        顯示自適應取樣的實際層數
+
+        Args:
+            num_layers: 實際層數（None 時恢復提示文字）
+        """
+        self._achieved_layers = num_layers
+        self._update_tolerance_hint()
+
+    def setBlocksSaved(self, blocks_saved: Optional[int]) -> None:
+        """
+        顯示共線層合併省下的塊數
+
+        Args:
+            blocks_saved: 省下的塊數（None 時恢復提示文字）
+        """
+        self._blocks_saved = blocks_saved
+        self._update_merge_hint()
+
+    def _update_merge_hint(self) -> None:
+        """更新合併容許偏差的提示文字"""
+        if self._blocks_saved is None:
+            self._merge_hint.setText(tr("merge_hint"))
+        else:
+            self._merge_hint.setText(f"{tr('blocks_saved')}{self._blocks_saved}")
+
+    def _update_tolerance_hint(self) -> None:
+        """更新容許偏差的提示文字"""
+        if self._achieved_layers is None:
+            self._tolerance_hint.setText(tr("tolerance_hint"))
+        else:
+            self._tolerance_hint.setText(
+                f"{tr('achieved_layers')}{self._achieved_layers}"
+            )
+
     def retranslateUi(self) -> None:
         """重新翻譯 UI"""
         self._group.setTitle(tr("mesh_params"))
@@ -131,10 +258,23 @@ class MeshParamsPanel(QWidget):
         self._layers_hint.setText(tr("layers_hint"))
         self._radial_label.setText(tr("radial_cells"))
         self._radial_hint.setText(tr("radial_hint"))
+        self._mode_label.setText(tr("mesh_mode"))
+        self._mode_combo.setItemText(0, tr("mode_full_3d"))
+        self._mode_combo.setItemText(1, tr("mode_wedge"))
+        self._mode_hint.setText(tr("mesh_mode_hint"))
         self._circum_label.setText(tr("circum_cells"))
         self._circum_hint.setText(tr("circum_hint"))
         self._axial_label.setText(tr("axial_cells"))
         self._axial_hint.setText(tr("axial_hint"))
+        self._tolerance_label.setText(tr("layer_tolerance"))
+        self._tolerance_spin.setSpecialValueText(tr("adaptive_off"))
+        self._update_tolerance_hint()
+        self._merge_label.setText(tr("merge_tolerance"))
+        self._merge_spin.setSpecialValueText(tr("merge_off"))
+        self._update_merge_hint()
+        self._edges_label.setText(tr("axial_edges"))
+        self._edges_hint.setText(tr("axial_edges_hint"))
+        self._edge_points_spin.setSpecialValueText(tr("edges_straight"))
 
     def getParams(self) -> MeshParameters:
         """取得目前參數"""
@@ -144,6 +284,11 @@ class MeshParamsPanel(QWidget):
             n_cells_radial=self._radial_spin.value(),
             n_cells_circum=self._circum_spin.value(),
             n_cells_axial=self._axial_spin.value(),
+            layer_tolerance=self._tolerance_spin.value(),
+            merge_tolerance=self._merge_spin.value(),
+            axial_edge_type=self._edge_type_combo.currentText(),
+            axial_edge_points=self._edge_points_spin.value(),
+            axisymmetric=self._mode_combo.currentIndex() == 1,
         )
 
     def setParams(self, params: MeshParameters) -> None:
@@ -153,3 +298,8 @@ class MeshParamsPanel(QWidget):
         self._radial_spin.setValue(params.n_cells_radial)
         self._circum_spin.setValue(params.n_cells_circum)
         self._axial_spin.setValue(params.n_cells_axial)
+        self._tolerance_spin.setValue(params.layer_tolerance)
+        self._merge_spin.setValue(params.merge_tolerance)
+        self._edge_type_combo.setCurrentText(params.axial_edge_type)
+        self._edge_points_spin.setValue(params.axial_edge_points)
+        self._mode_combo.setCurrentIndex(1 if params.axisymmetric else 0)
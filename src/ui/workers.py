@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+背景工作模組
+
+以 QThreadPool 執行長時間作業，透過信號將進度與結果傳回 GUI 執行緒。
+每個工作持有一個取消權杖，被新作業取代時可要求其在下一個檢查點停止。
+"""
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from ..core.progress import CancelToken, OperationCancelled, ProgressReporter
+
+
+class WorkerSignals(QObject):
+    """背景工作的信號（於 GUI 執行緒建立，跨執行緒以佇列方式傳遞）"""
+
+    # 進度：(百分比, 階段翻譯鍵值)
+    progress = Signal(int, str)
+
+    # 完成：作業回傳值
+    finished = Signal(object)
+
+    # 失敗：例外物件
+    failed = Signal(object)
+
+    # 已取消
+    cancelled = Signal()
+
+
+class TaskWorker(QRunnable):
+    """
+    通用背景工作
+
+    task 以 ProgressReporter 為唯一參數，需在適當位置呼叫
+    report() 或 check()，以便回報進度並回應取消。
+    """
+
+    def __init__(self, task: Callable[[ProgressReporter], Any]):
+        """
+        初始化背景工作
+
+        Args:
+            task: 要在背景執行的函數
+        """
+        super().__init__()
+        self._task = task
+        self._token = CancelToken()
+        self.signals = WorkerSignals()
+
+        # 由呼叫端保留參照直到完成，避免執行中被釋放
+        self.setAutoDelete(False)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """是否已要求取消"""
+        return self._token.cancelled
+
+    def cancel(self) -> None:
+        """要求取消（作業於下一個檢查點停止）"""
+        self._token.cancel()
+
+    def run(self) -> None:
+        """執行作業（於執行緒池中呼叫）"""
+        reporter = ProgressReporter(self.signals.progress.emit, self._token)
+        try:
+            reporter.check()
+            result = self._task(reporter)
+        except OperationCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            if self._token.cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
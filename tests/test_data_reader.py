@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+資料讀取測試
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.data_reader import DataReader, DataStatistics
+from src.core.ingest import read_excel_points, read_text_points, sniff_text_format
+from src.core.point_cache import PointCache, file_fingerprint
+from src.core.progress import CancelToken, OperationCancelled, ProgressReporter
+from src.models.point_cloud import PointCloud
+
+EXAMPLE_CSV = Path(__file__).resolve().parent.parent / "examples" / "example_flow_channel.csv"
+
+
+class TestTextIngest:
+    """測試 CSV/TXT 快速匯入"""
+
+    def test_example_csv_with_comments(self):
+        """測試範例檔的 # 註解行與逗號分隔"""
+        fmt = sniff_text_format(EXAMPLE_CSV)
+        assert fmt.delimiter == ","
+        assert not fmt.has_header
+
+        points = read_text_points(EXAMPLE_CSV)
+        assert points.shape == (22, 3)
+        assert points.dtype == np.float64
+        assert points.flags["C_CONTIGUOUS"]
+        np.testing.assert_allclose(points[0], [0.10, 0.0, 0.0])
+        np.testing.assert_allclose(points[-1], [0.40, 0.0, 1.0])
+
+    def test_header_row_detected(self, tmp_path):
+        """測試標題行自動偵測"""
+        path = tmp_path / "points.csv"
+        path.write_text("X;Y;Z;note\n1;2;3;a\n4;5;6;b\n", encoding="utf-8")
+
+        fmt = sniff_text_format(path)
+        assert fmt.delimiter == ";"
+        assert fmt.has_header
+        np.testing.assert_array_equal(read_text_points(path), [[1, 2, 3], [4, 5, 6]])
+
+    def test_txt_whitespace(self, tmp_path):
+        """測試 TXT 空白與 Tab 混合分隔"""
+        path = tmp_path / "points.txt"
+        path.write_text("# 註解\n1.0\t2.0   3.0\n  4.0 5.0\t6.0\n\n", encoding="utf-8")
+
+        points = read_text_points(path, whitespace_only=True)
+        np.testing.assert_array_equal(points, [[1, 2, 3], [4, 5, 6]])
+
+    def test_too_few_columns(self, tmp_path):
+        """測試欄數不足時的錯誤訊息"""
+        path = tmp_path / "points.csv"
+        path.write_text("1,2\n3,4\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="至少 3 欄"):
+            read_text_points(path)
+
+
+class TestExcelIngest:
+    """測試 Excel 串流匯入"""
+
+    def test_streaming_read(self, tmp_path):
+        """測試標題行、空白列與多餘欄位的處理"""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["X", "Y", "Z", "備註"])
+        sheet.append([1.0, 2.0, 3.0, "a"])
+        sheet.append([])
+        sheet.append([4, 5, 6, "b"])
+        path = tmp_path / "points.xlsx"
+        workbook.save(path)
+
+        points = read_excel_points(path)
+        assert points.dtype == np.float64
+        np.testing.assert_array_equal(points, [[1, 2, 3], [4, 5, 6]])
+
+    def test_too_few_columns(self, tmp_path):
+        """測試欄數不足時的錯誤訊息"""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        workbook.active.append([1.0, 2.0])
+        path = tmp_path / "points.xlsx"
+        workbook.save(path)
+
+        with pytest.raises(ValueError, match="至少 3 欄"):
+            read_excel_points(path)
+
+    def test_too_few_columns_after_header(self, tmp_path):
+        """測試標題行之後的資料列欄數不足"""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["x", "y"])
+        sheet.append([1.0, 2.0])
+        sheet.append([3.0, 4.0])
+        path = tmp_path / "points.xlsx"
+        workbook.save(path)
+
+        with pytest.raises(ValueError, match="至少 3 欄"):
+            read_excel_points(path)
+
+    def test_blank_value(self, tmp_path):
+        """測試資料列的 X、Y、Z 有空白值時報錯，而非填入 NaN"""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["X", "Y", "Z"])
+        sheet.append([1.0, 2.0, 3.0])
+        sheet.append([4.0, None, 6.0])
+        path = tmp_path / "points.xlsx"
+        workbook.save(path)
+
+        with pytest.raises(ValueError, match="第 3 列"):
+            read_excel_points(path)
+
+
+class TestDataReader:
+    """測試 DataReader 流程"""
+
+    def test_read_example(self):
+        """測試讀取範例檔並分離內外曲線"""
+        reader = DataReader(str(EXAMPLE_CSV))
+        reader.read()
+
+        stats = reader.statistics
+        assert stats.total_points == 22
+        assert stats.inner_points == 11
+        assert stats.outer_points == 11
+        assert stats.z_range == (0.0, 1.0)
+
+        inner, outer = reader.sample_layers(5)
+        np.testing.assert_allclose(inner.x, [0.10, 0.125, 0.15, 0.175, 0.20])
+        np.testing.assert_allclose(outer.x, [0.30, 0.325, 0.35, 0.375, 0.40])
+
+    def test_inner_outer_are_views(self):
+        """測試內外曲線為同一點雲的視圖且各自依 Z 排序"""
+        reader = DataReader(str(EXAMPLE_CSV))
+        points = reader.read()
+
+        assert np.shares_memory(reader.inner_points.z, points.columns)
+        assert np.shares_memory(reader.outer_points.z, points.columns)
+        assert reader.inner_points.is_sorted_z()
+        assert reader.outer_points.is_sorted_z()
+        assert reader.inner_points.x.max() < reader.outer_points.x.min()
+
+    def test_float32_storage(self):
+        """測試 float32 儲存模式"""
+        reader = DataReader(str(EXAMPLE_CSV), dtype=np.float32)
+        reader.read()
+
+        assert reader.points.dtype == np.float32
+        inner, _ = reader.sample_layers(3)
+        np.testing.assert_allclose(inner.x, [0.10, 0.15, 0.20], rtol=1e-6)
+
+
+    def test_progress_reported(self):
+        """測試讀取時依序回報進度"""
+        events = []
+        DataReader(str(EXAMPLE_CSV)).read(
+            ProgressReporter(lambda percent, stage: events.append((percent, stage)))
+        )
+
+        percents = [percent for percent, _ in events]
+        assert percents == sorted(percents)
+        assert events[-1] == (100, "stage_done")
+
+    def test_progress_sub_range(self):
+        """測試讀取使用子範圍時，接續的步驟進度不倒退且共用取消權杖"""
+        events = []
+        token = CancelToken()
+        progress = ProgressReporter(lambda percent, _: events.append(percent), token)
+        DataReader(str(EXAMPLE_CSV)).read(progress.sub(0, 30))
+        assert events[-1] == 30
+
+        generation = progress.sub(30, 100)
+        generation.report(0, "stage_sampling")
+        generation.report(50, "stage_blocks")
+        assert events[-2:] == [30, 65]
+        assert events == sorted(events)
+
+        token.cancel()
+        with pytest.raises(OperationCancelled):
+            generation.report(100)
+
+    def test_cancelled_read(self):
+        """測試取消後拋出 OperationCancelled 且不載入資料"""
+        token = CancelToken()
+        token.cancel()
+        reader = DataReader(str(EXAMPLE_CSV))
+
+        with pytest.raises(OperationCancelled):
+            reader.read(ProgressReporter(token=token))
+        assert reader.statistics is None
+
+
+class TestPointCache:
+    """測試點位解析快取"""
+
+    def test_cache_hit_is_memory_mapped(self, tmp_path):
+        """測試第二次讀取由快取以記憶體映射載入"""
+        cache = PointCache(tmp_path / "cache")
+        first = DataReader(str(EXAMPLE_CSV), cache=cache)
+        points = first.read()
+
+        second = DataReader(str(EXAMPLE_CSV), cache=cache)
+        cached = second.read()
+        assert isinstance(cached.columns, np.memmap)
+        np.testing.assert_array_equal(cached.columns, points.columns)
+        np.testing.assert_array_equal(second.inner_points.x, first.inner_points.x)
+        assert second.statistics == first.statistics
+
+    def test_fingerprint_changes_with_content(self, tmp_path):
+        """測試檔案內容變更後指紋不同"""
+        path = tmp_path / "points.csv"
+        path.write_text("1,2,3\n", encoding="utf-8")
+        before = file_fingerprint(path)
+        path.write_text("1,2,4\n", encoding="utf-8")
+        assert file_fingerprint(path) != before
+
+    def test_lru_eviction(self, tmp_path):
+        """測試超過大小上限時淘汰最久未使用的項目"""
+        cache = PointCache(tmp_path / "cache", max_bytes=1)
+        stats = DataStatistics(1, 0, 1, (0, 0), (0, 0), (0, 0), 0.0)
+        points = PointCloud.from_array(np.zeros((1, 3)))
+        cache.store("old", points, 0, stats)
+        cache.store("new", points, 0, stats)
+
+        assert cache.load("old") is None
+        assert cache.load("new") is not None
+
+    def test_corrupt_entry_recovers(self, tmp_path):
+        """測試損壞的項目在載入失敗後刪除，重新寫入即可命中"""
+        cache = PointCache(tmp_path / "cache")
+        stats = DataStatistics(2, 0, 2, (0, 0), (0, 0), (0, 0), 0.0)
+        points = PointCloud.from_array(np.arange(6.0).reshape(2, 3))
+        entry = cache.store("key", points, 1, stats)
+        (entry / PointCache.POINTS_FILE).write_bytes(b"\x93NUMPY truncated")
+
+        assert cache.load("key") is None
+        assert not entry.exists()
+        cache.store("key", points, 1, stats)
+        loaded = cache.load("key")
+        np.testing.assert_array_equal(loaded.points.columns, points.columns)
+        del loaded
+
+        # 未先載入時，寫入也會取代已存在的損壞項目
+        (entry / PointCache.POINTS_FILE).write_bytes(b"")
+        cache.store("key", points, 1, stats)
+        assert cache.load("key") is not None
+
+
+class TestChunkedIngest:
+    """測試分塊（超出記憶體）處理"""
+
+    def test_matches_in_memory_read(self, tmp_path):
+        """測試分塊結果與一次讀取一致"""
+        rng = np.random.default_rng(0)
+        z = rng.uniform(0.0, 10.0, 5000)
+        x = np.where(rng.random(5000) < 0.5, 1.0, 2.0) + 0.1 * np.sin(z)
+        path = tmp_path / "points.csv"
+        np.savetxt(path, np.column_stack([x, np.zeros_like(z), z]), delimiter=",")
+
+        expected = DataReader(str(path))
+        expected.read()
+        chunked = DataReader(str(path))
+        points = chunked.read_chunked(work_dir=str(tmp_path / "work"), chunk_rows=700)
+
+        assert isinstance(points.columns, np.memmap)
+        assert chunked.inner_points.is_sorted_z()
+        assert chunked.outer_points.is_sorted_z()
+        assert chunked.statistics.total_points == expected.statistics.total_points
+        assert chunked.statistics.inner_points == expected.statistics.inner_points
+        assert chunked.statistics.z_range == expected.statistics.z_range
+        assert chunked.statistics.avg_x == pytest.approx(expected.statistics.avg_x)
+        np.testing.assert_array_equal(chunked.inner_points.z, expected.inner_points.z)
+
+        for got, want in zip(chunked.sample_layers(9), expected.sample_layers(9)):
+            np.testing.assert_allclose(got.columns, want.columns)
+
+    def test_float32_storage(self, tmp_path):
+        """測試分塊讀取與一次讀取使用相同的儲存型別"""
+        rng = np.random.default_rng(1)
+        z = rng.uniform(0.0, 10.0, 2000)
+        x = np.where(rng.random(2000) < 0.5, 1.0, 2.0)
+        path = tmp_path / "points.csv"
+        np.savetxt(path, np.column_stack([x, np.zeros_like(z), z]), delimiter=",")
+
+        expected = DataReader(str(path), dtype=np.float32)
+        expected.read()
+        chunked = DataReader(str(path), dtype=np.float32)
+        points = chunked.read_chunked(work_dir=str(tmp_path / "work"), chunk_rows=300)
+
+        assert points.dtype == np.float32
+        assert chunked.inner_points.is_sorted_z()
+        np.testing.assert_array_equal(chunked.inner_points.z, expected.inner_points.z)
+        np.testing.assert_array_equal(chunked.outer_points.z, expected.outer_points.z)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+層取樣測試
+"""
+import numpy as np
+import pytest
+
+from src.core import layer_sampler
+from src.core.layer_sampler import LayerSampler, WallCurve
+from src.models.point_cloud import PointCloud
+
+
+def _curve(n: int, seed: int, offset: float) -> PointCloud:
+    """產生依 Z 排序的測試曲線"""
+    rng = np.random.default_rng(seed)
+    z = np.sort(rng.uniform(0.0, 10.0, n))
+    return PointCloud.from_columns(offset + np.sin(z), 0.1 * np.cos(z), z)
+
+
+class TestWallCurve:
+    """測試單一曲線插值"""
+
+    def test_matches_interp1d(self):
+        """測試與 scipy interp1d（含外插）一致"""
+        interp1d = pytest.importorskip("scipy.interpolate").interp1d
+        points = _curve(500, 0, 1.0)
+        z = np.linspace(-1.0, 11.0, 257)
+
+        expected = np.stack(
+            [
+                interp1d(points.z, column, fill_value="extrapolate")(z)
+                for column in (points.x, points.y)
+            ]
+        )
+        np.testing.assert_allclose(WallCurve(points).evaluate(z), expected, atol=1e-12)
+
+    def test_sparse_index(self, monkeypatch):
+        """測試稀疏索引的搜尋結果與完整搜尋一致"""
+        monkeypatch.setattr(layer_sampler, "MAX_INDEX_SIZE", 16)
+        points = _curve(1000, 1, 1.0)
+        points.z[100:110] = points.z[100]  # 重複 Z 值
+        z = np.concatenate([points.z, np.linspace(-1.0, 11.0, 101)])
+
+        np.testing.assert_array_equal(
+            WallCurve(points).searchsorted(z), np.searchsorted(points.z, z)
+        )
+
+
+class TestLayerSampler:
+    """測試層取樣器"""
+
+    def test_sample_is_cached(self):
+        """測試相同層數直接回傳快取（唯讀）結果"""
+        sampler = LayerSampler(_curve(200, 2, 1.0), _curve(300, 3, 3.0), cache_size=2)
+        first = sampler.sample(10)
+        assert sampler.sample(10) is first
+        assert not first[0].columns.flags.writeable
+
+        sampler.sample(11)
+        sampler.sample(12)
+        assert sampler.sample(10) is not first
+
+    def test_common_z_range(self):
+        """測試取樣範圍為內外曲線共同的 Z 範圍"""
+        inner = _curve(200, 4, 1.0)
+        outer = _curve(300, 5, 3.0)
+        inner_samples, outer_samples = LayerSampler(inner, outer).sample(5)
+
+        z_min = max(inner.z[0], outer.z[0])
+        z_max = min(inner.z[-1], outer.z[-1])
+        np.testing.assert_allclose(inner_samples.z, np.linspace(z_min, z_max, 5))
+        np.testing.assert_array_equal(inner_samples.z, outer_samples.z)
+
+
+def _bend(n: int = 5000) -> PointCloud:
+    """前段為直線、後段彎曲的測試曲線"""
+    z = np.linspace(0.0, 100.0, n)
+    x = 10.0 + np.where(z > 70.0, 3.0 * np.sin((z - 70.0) / 5.0) ** 2, 0.0)
+    return PointCloud.from_columns(x, np.zeros(n), z)
+
+
+def _max_deviation(curve: PointCloud, samples: PointCloud) -> float:
+    """分段線性重建與量測曲線的最大偏差"""
+    return float(np.abs(np.interp(curve.z, samples.z, samples.x) - curve.x).max())
+
+
+class TestAdaptiveLayers:
+    """測試自適應層取樣"""
+
+    def test_within_tolerance_with_fewer_layers(self):
+        """測試偏差不超過容許值，且層數遠少於同精度的均勻取樣"""
+        inner = _bend()
+        outer = PointCloud.from_columns(20.0 + 0.05 * inner.z, inner.y, inner.z)
+        sampler = LayerSampler(inner, outer)
+
+        adaptive, adaptive_outer = sampler.sample_adaptive(0.01, 500)
+        assert _max_deviation(inner, adaptive) <= 0.01
+        assert _max_deviation(outer, adaptive_outer) <= 0.01
+        assert adaptive.z[0] == 0.0 and adaptive.z[-1] == 100.0
+        assert np.all(np.diff(adaptive.z) > 0)
+
+        # 直線段只需很少的層，彎曲段加密
+        assert np.count_nonzero(adaptive.z < 70.0) <= 8
+        uniform = sampler.sample(2 * len(adaptive))[0]
+        assert _max_deviation(inner, uniform) > 0.01
+
+    def test_straight_walls(self):
+        """測試直線壁面只需兩端兩層"""
+        z = np.linspace(0.0, 1.0, 100)
+        inner = PointCloud.from_columns(1.0 + z, np.zeros(100), z)
+        outer = PointCloud.from_columns(2.0 + z, np.zeros(100), z)
+        samples = LayerSampler(inner, outer).sample_adaptive(1e-6, 100)[0]
+        np.testing.assert_array_equal(samples.z, [0.0, 1.0])
+
+    def test_layer_cap(self):
+        """測試層數不超過上限，且結果依參數快取"""
+        inner = _bend()
+        sampler = LayerSampler(inner, _curve(300, 6, 30.0))
+        samples = sampler.sample_adaptive(1e-9, 40)
+        assert len(samples[0]) == 40
+        assert sampler.sample_adaptive(1e-9, 40) is samples
+
+    def test_invalid_tolerance(self):
+        """測試容許偏差必須大於 0"""
+        with pytest.raises(ValueError):
+            layer_sampler.adaptive_layers([], 0.0, 1.0, 0.0, 10)
+
+    def test_edge_points(self):
+        """測試曲線邊中間點：重建經過中間點，同精度所需的層數較少"""
+        inner = _bend()
+        outer = PointCloud.from_columns(20.0 + 0.05 * inner.z, inner.y, inner.z)
+        sampler = LayerSampler(inner, outer)
+
+        straight = sampler.sample_adaptive(0.01, 500)[0]
+        curved = sampler.sample_adaptive(0.01, 500, edge_points=3)[0]
+        assert (len(curved) - 1) % 4 == 0
+        assert _max_deviation(inner, curved) <= 0.01
+        assert (len(curved) - 1) // 4 + 1 < len(straight) // 2
+
+        # 中間點在相鄰兩層之間等距
+        layers = curved.z[::4]
+        np.testing.assert_allclose(
+            curved.z, layer_sampler.refine_layers(layers, 3), atol=1e-12
+        )
+        assert len(sampler.sample(5, edge_points=2)[0]) == 13
@@ -0,0 +1,1005 @@
+# -*- coding: utf-8 -*-
+"""
+網格生成器測試
+"""
+import gzip
+import io
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core import dict_writer
+from src.core.artifact_cache import ArtifactCache
+from src.core.output_profile import compact_float
+from src.core.cylinder_mesh import CylinderMeshGenerator
+from src.core.mesh_generator import MeshGenerator
+from src.core.output_writer import atomic_output, write_if_changed
+from src.core.consolidation import consolidate_layers
+from src.core.foam_io import read_foam_list, read_polymesh, write_foam_list
+from src.core.grading import grading_text, section_fractions, wall_grading
+from src.core.polymesh import annulus_polymesh
+from src.core.progress import CancelToken, OperationCancelled, ProgressReporter
+from src.core.yplus import first_cell_height, minimal_layers, yplus_layers
+from src.models.mesh_params import (
+    BoundaryLayerParams,
+    CylinderMeshParams,
+    MeshParameters,
+    YPlusParams,
+)
+from src.models.point_cloud import PointCloud
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+
+def _samples(num_layers: int):
+    """產生內外曲線取樣點"""
+    z = np.linspace(0.0, 1.0, num_layers)
+    inner = np.column_stack([0.1 + 0.1 * z, np.zeros_like(z), z])
+    outer = np.column_stack([0.3 + 0.1 * z, np.zeros_like(z), z])
+    return inner, outer
+
+
+def _golden_samples():
+    """黃金檔案所用的內外曲線（內曲線帶有起伏）"""
+    z = np.linspace(0.0, 1.0, 5)
+    inner = np.column_stack([0.1 + 0.1 * z + 0.02 * np.sin(6 * z), np.zeros(5), z])
+    outer = np.column_stack([0.3 + 0.1 * z, np.zeros(5), z])
+    return inner, outer
+
+
+GOLDEN_FLOW_PARAMS = MeshParameters(
+    num_layers=5, n_cells_radial=10, n_cells_circum=16, n_cells_axial=3
+)
+
+
+class TestGoldenOutput:
+    """測試輸出與黃金檔案完全一致（以文字模式比對，不受平台換行影響）"""
+
+    def test_flow_channel(self, tmp_path):
+        """測試流道網格輸出"""
+        inner, outer = _golden_samples()
+        output = tmp_path / "blockMeshDict"
+        MeshGenerator(GOLDEN_FLOW_PARAMS).generate(inner, outer, output)
+
+        expected = (DATA_DIR / "flow_5_layers.blockMeshDict").read_text(
+            encoding="utf-8"
+        )
+        assert output.read_text(encoding="utf-8") == expected
+
+    def test_flow_channel_chunked(self, tmp_path, monkeypatch):
+        """測試分批格式化（每批 2 層）結果不變"""
+        monkeypatch.setattr(dict_writer, "EMIT_CHUNK_ROWS", 2)
+        inner, outer = _golden_samples()
+        output = tmp_path / "blockMeshDict"
+        MeshGenerator(GOLDEN_FLOW_PARAMS).generate(
+            PointCloud.from_array(inner), PointCloud.from_array(outer), output
+        )
+
+        expected = (DATA_DIR / "flow_5_layers.blockMeshDict").read_text(
+            encoding="utf-8"
+        )
+        assert output.read_text(encoding="utf-8") == expected
+
+    def test_cylinder(self, tmp_path):
+        """測試圓柱網格輸出"""
+        output = tmp_path / "blockMeshDict"
+        CylinderMeshGenerator(CylinderMeshParams()).generate(output)
+
+        expected = (DATA_DIR / "cylinder_default.blockMeshDict").read_text(
+            encoding="utf-8"
+        )
+        assert output.read_text(encoding="utf-8") == expected
+
+
+class TestStreaming:
+    """測試串流輸出 API"""
+
+    def test_to_bytes_matches_golden(self):
+        """測試 to_bytes 與黃金檔案一致"""
+        inner, outer = _golden_samples()
+        data = MeshGenerator(GOLDEN_FLOW_PARAMS).to_bytes(inner, outer)
+        assert data == (DATA_DIR / "flow_5_layers.blockMeshDict").read_bytes()
+
+        data = CylinderMeshGenerator(CylinderMeshParams()).to_bytes()
+        assert data == (DATA_DIR / "cylinder_default.blockMeshDict").read_bytes()
+
+    def test_chunks_are_bounded(self, monkeypatch):
+        """測試區塊大小只與批次大小有關，與層數無關"""
+        monkeypatch.setattr(dict_writer, "EMIT_CHUNK_ROWS", 4)
+        generator = MeshGenerator(MeshParameters(num_layers=400))
+        inner, outer = _samples(400)
+
+        chunks = list(generator.iter_chunks(inner, outer))
+        assert max(len(chunk) for chunk in chunks) < 4096
+
+        monkeypatch.setattr(dict_writer, "EMIT_CHUNK_ROWS", 512)
+        assert b"".join(chunks) == generator.to_bytes(inner, outer)
+
+    def test_write_to_gzip_stream(self):
+        """測試寫入 gzip 串流"""
+        generator = MeshGenerator(MeshParameters(num_layers=30))
+        inner, outer = _samples(30)
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode="wb") as stream:
+            written = generator.write_to(inner, outer, stream)
+
+        data = gzip.decompress(buffer.getvalue())
+        assert written == len(data)
+        assert data == generator.to_bytes(inner, outer)
+
+    def test_gzip_output(self, tmp_path):
+        """測試 gzip 輸出可解壓為相同內容，且相同內容的壓縮結果一致"""
+        inner, outer = _samples(50)
+        plain = MeshGenerator(MeshParameters(num_layers=50))
+        packed = MeshGenerator(MeshParameters(num_layers=50), compresslevel=9)
+        target = tmp_path / "blockMeshDict.gz"
+
+        packed.to_path(inner, outer, target)
+        data = target.read_bytes()
+        assert gzip.decompress(data) == plain.to_bytes(inner, outer)
+        assert len(data) < len(plain.to_bytes(inner, outer)) / 4
+        assert not packed.update_path(inner, outer, target)
+        assert packed.artifact_key(inner, outer) != plain.artifact_key(inner, outer)
+
+        cylinder = CylinderMeshGenerator(CylinderMeshParams(), compresslevel=1)
+        content = cylinder.generate(tmp_path / "cylinder.gz")
+        data = gzip.decompress((tmp_path / "cylinder.gz").read_bytes())
+        assert data.decode() == content
+
+        with pytest.raises(ValueError):
+            MeshGenerator(MeshParameters(), compresslevel=10)
+
+
+def _vertices(content: str) -> np.ndarray:
+    """取出 vertices 區段的座標"""
+    section = content.split("vertices\n(\n", 1)[1].split(");", 1)[0]
+    rows = [
+        line.split("//")[0].strip().strip("()").split()
+        for line in section.splitlines()
+        if line.strip().startswith("(")
+    ]
+    return np.array(rows, dtype=float)
+
+
+class TestOutputProfile:
+    """測試 compact 輸出格式"""
+
+    def test_compact_float(self):
+        """測試最短表示與去除多餘的零"""
+        assert compact_float(1.0) == "1"
+        assert compact_float(-0.0) == "0"
+        assert compact_float(0.25) == "0.25"
+        assert compact_float(-2.5e-07) == "-2.5e-07"
+        assert float(compact_float(0.1 + 0.2)) == 0.1 + 0.2
+
+    def test_flow_compact(self):
+        """測試流道 compact 格式無註解、座標可完整還原且結構不變"""
+        # 量測資料通常只有數位小數
+        inner, outer = (np.round(samples, 4) for samples in _golden_samples())
+        annotated = MeshGenerator(GOLDEN_FLOW_PARAMS).to_bytes(inner, outer).decode()
+        compact = MeshGenerator(GOLDEN_FLOW_PARAMS, profile="compact").to_bytes(
+            inner, outer
+        ).decode()
+
+        assert "//" not in compact
+        assert len(compact.encode()) < len(annotated.encode())
+        for keyword in ("hex", "arc"):
+            assert compact.count(keyword) == annotated.count(keyword)
+
+        expected = np.concatenate(
+            [
+                np.column_stack([[r, 0, -r, 0], [0, r, 0, -r], [z] * 4])
+                for i, z in enumerate(inner[:, 2])
+                for r in (inner[i, 0], outer[i, 0])
+            ]
+        )
+        np.testing.assert_array_equal(_vertices(compact), expected)
+        np.testing.assert_allclose(_vertices(annotated), expected, atol=5e-7)
+
+    def test_cylinder_compact(self):
+        """測試圓柱 compact 格式無註解且頂點與 annotated 一致"""
+        annotated = CylinderMeshGenerator(CylinderMeshParams()).to_bytes().decode()
+        compact = CylinderMeshGenerator(
+            CylinderMeshParams(), profile="compact"
+        ).to_bytes().decode()
+
+        assert "//" not in compact
+        np.testing.assert_allclose(
+            _vertices(compact), _vertices(annotated), atol=5e-7
+        )
+
+    def test_invalid_profile(self):
+        """測試不支援的輸出格式"""
+        with pytest.raises(ValueError):
+            MeshGenerator(MeshParameters(), profile="verbose")
+
+    def test_profile_in_artifact_key(self):
+        """測試輸出格式納入快取鍵值"""
+        params = CylinderMeshParams()
+        assert (
+            CylinderMeshGenerator(params).artifact_key()
+            != CylinderMeshGenerator(params, profile="compact").artifact_key()
+        )
+
+
+class TestAtomicOutput:
+    """測試原子寫入"""
+
+    def test_replaces_on_success(self, tmp_path):
+        """測試成功時取代目標檔案且不留下暫存檔"""
+        target = tmp_path / "system" / "blockMeshDict"
+        with atomic_output(target) as f:
+            f.write("new")
+
+        assert target.read_text(encoding="utf-8") == "new"
+        assert [p.name for p in target.parent.iterdir()] == ["blockMeshDict"]
+
+    def test_keeps_target_on_error(self, tmp_path):
+        """測試失敗時保留原檔案並刪除暫存檔"""
+        target = tmp_path / "blockMeshDict"
+        target.write_text("old", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            with atomic_output(target) as f:
+                f.write("partial")
+                raise RuntimeError("boom")
+
+        assert target.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["blockMeshDict"]
+
+
+class TestWriteIfChanged:
+    """測試僅在內容改變時寫入"""
+
+    def test_unchanged_keeps_mtime(self, tmp_path):
+        """測試內容相同時不取代檔案、保留修改時間"""
+        target = tmp_path / "blockMeshDict"
+        assert write_if_changed([b"a", b"b"], target)
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+        inode = target.stat().st_ino
+
+        assert not write_if_changed([b"ab"], target)
+        assert target.stat().st_mtime_ns == 1_000_000_000
+        assert target.stat().st_ino == inode
+        assert [p.name for p in tmp_path.iterdir()] == ["blockMeshDict"]
+
+        assert write_if_changed([b"ac"], target)
+        assert target.read_bytes() == b"ac"
+
+    def test_generators(self, tmp_path):
+        """測試兩種生成器重複生成時回報未改變，參數改變時回報已改變"""
+        inner, outer = _samples(4)
+        target = tmp_path / "flow"
+        generator = MeshGenerator(MeshParameters(num_layers=4))
+        assert generator.update_path(inner, outer, target)
+        assert not generator.update_path(inner, outer, target)
+        assert target.read_bytes() == generator.to_bytes(inner, outer)
+        assert MeshGenerator(MeshParameters(n_cells_axial=7)).update_path(
+            inner, outer, target
+        )
+
+        target = tmp_path / "cylinder"
+        cylinder = CylinderMeshGenerator(CylinderMeshParams())
+        assert cylinder.update_path(target)
+        assert not cylinder.update_path(target)
+
+
+class TestGenerationProgress:
+    """測試生成進度與取消"""
+
+    def test_progress_is_monotonic(self, tmp_path):
+        """測試流道網格逐段回報遞增進度"""
+        events = []
+        inner, outer = _samples(20)
+        MeshGenerator(MeshParameters(num_layers=20)).generate(
+            inner,
+            outer,
+            tmp_path / "blockMeshDict",
+            ProgressReporter(lambda percent, stage: events.append((percent, stage))),
+        )
+
+        percents = [percent for percent, _ in events]
+        assert percents == sorted(percents)
+        stages = {stage for _, stage in events}
+        assert {"stage_vertices", "stage_blocks", "stage_edges"} <= stages
+
+    def test_cancel_leaves_no_file(self, tmp_path):
+        """測試寫入途中取消時不留下檔案"""
+        token = CancelToken()
+
+        def on_progress(percent, stage):
+            if stage == "stage_edges":
+                token.cancel()
+
+        target = tmp_path / "blockMeshDict"
+        inner, outer = _samples(20)
+        with pytest.raises(OperationCancelled):
+            MeshGenerator(MeshParameters(num_layers=20)).generate(
+                inner, outer, target, ProgressReporter(on_progress, token)
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cylinder_cancel(self, tmp_path):
+        """測試圓柱網格取消時不留下檔案"""
+        token = CancelToken()
+        token.cancel()
+
+        with pytest.raises(OperationCancelled):
+            CylinderMeshGenerator(CylinderMeshParams()).generate(
+                tmp_path / "blockMeshDict", ProgressReporter(token=token)
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestArtifactCache:
+    """測試輸出快取"""
+
+    def test_hit_reuses_output(self, tmp_path):
+        """測試相同輸入第二次直接放置快取檔案，不再呼叫生成"""
+        cache = ArtifactCache(tmp_path / "cache")
+        inner, outer = _samples(4)
+        generator = MeshGenerator(MeshParameters(num_layers=4))
+        key = generator.artifact_key(inner, outer)
+        calls = []
+
+        def create(path):
+            calls.append(path)
+            generator.generate(inner, outer, path)
+
+        assert not cache.get_or_create(key, tmp_path / "a" / "blockMeshDict", create)
+        assert cache.get_or_create(key, tmp_path / "b" / "blockMeshDict", create)
+        assert len(calls) == 1
+        assert (tmp_path / "b" / "blockMeshDict").read_bytes() == generator.to_bytes(
+            inner, outer
+        )
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+        # 輸出已相同時命中也不取代檔案
+        target = tmp_path / "b" / "blockMeshDict"
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+        assert cache.fetch(key, target)
+        assert target.stat().st_mtime_ns == 1_000_000_000
+
+    def test_key_covers_params_and_data(self):
+        """測試任一參數欄位、取樣幾何或版本改變時鍵值隨之改變"""
+        inner, outer = _samples(4)
+        base = MeshGenerator(MeshParameters(num_layers=4))
+        key = base.artifact_key(inner, outer)
+
+        assert MeshGenerator(MeshParameters(num_layers=4)).artifact_key(
+            inner, outer
+        ) == key
+        assert MeshGenerator(
+            MeshParameters(num_layers=4, n_cells_axial=7)
+        ).artifact_key(inner, outer) != key
+
+        moved = inner.copy()
+        moved[0, 0] += 1e-9
+        assert base.artifact_key(moved, outer) != key
+
+        base.VERSION = MeshGenerator.VERSION + 1
+        assert base.artifact_key(inner, outer) != key
+
+        cylinder = CylinderMeshGenerator(CylinderMeshParams())
+        assert cylinder.artifact_key() != CylinderMeshGenerator(
+            CylinderMeshParams(height=2 * CylinderMeshParams().height)
+        ).artifact_key()
+
+    def test_modified_entry_is_miss(self, tmp_path):
+        """測試快取項目被修改（如就地編輯硬連結的輸出檔）時視為未命中"""
+        cache = ArtifactCache(tmp_path / "cache")
+        source = tmp_path / "source"
+        source.write_bytes(b"original")
+        cache.store("k", source)
+
+        with open(cache.entry_dir("k") / ArtifactCache.ARTIFACT_FILE, "r+b") as f:
+            f.write(b"modified")
+
+        assert not cache.fetch("k", tmp_path / "out")
+        assert not (tmp_path / "out").exists()
+        assert cache.read_meta("k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """測試超過大小上限時淘汰最久未使用的項目"""
+        cache = ArtifactCache(tmp_path / "cache", max_bytes=5000, link=False)
+        for name in ("a", "b", "c"):
+            source = tmp_path / name
+            source.write_bytes(name.encode() * 2000)
+            cache.store(name, source)
+
+        assert cache.read_meta("a") is None
+        assert cache.fetch("c", tmp_path / "out")
+        assert (tmp_path / "out").read_bytes() == b"c" * 2000
+
+
+class TestBlockMesh:
+    """測試中間表示"""
+
+    def test_flow_mesh(self):
+        """測試流道中間表示的陣列形狀、索引與網格數"""
+        inner, outer = _golden_samples()
+        mesh = MeshGenerator(GOLDEN_FLOW_PARAMS).build_mesh(inner, outer)
+
+        assert mesh.validate() == (True, "")
+        assert mesh.vertices.shape == (40, 3)
+        assert mesh.blocks.shape == (16, 8)
+        assert mesh.arc_edges.shape == (40, 2)
+        assert len(mesh.patch("innerWall").faces) == 16
+        assert mesh.n_cells == 16 * 10 * 4 * 3
+
+        # 圓弧中點位於兩端頂點之間的圓上
+        radius = np.hypot(*mesh.vertices[mesh.arc_edges[:, 0], :2].T)
+        np.testing.assert_allclose(np.hypot(*mesh.arc_points[:, :2].T), radius)
+
+    def test_cylinder_mesh(self):
+        """測試圓柱中間表示"""
+        mesh = CylinderMeshGenerator(CylinderMeshParams()).build_mesh()
+
+        assert mesh.validate() == (True, "")
+        zones = [mesh.zone_names[z] for z in mesh.zones]
+        assert zones == ["square"] + ["innerCircle"] * 4
+        assert [p.name for p in mesh.patches] == ["Enclosure", "inlet", "outlet"]
+
+    def test_compact_is_traversal(self):
+        """測試 compact 輸出的頂點即為中間表示的頂點"""
+        generator = CylinderMeshGenerator(CylinderMeshParams(), profile="compact")
+        content = generator.to_bytes().decode()
+        mesh = generator.build_mesh()
+        np.testing.assert_array_equal(_vertices(content), mesh.vertices)
+
+    def test_validate_index_range(self):
+        """測試頂點索引超出範圍"""
+        mesh = CylinderMeshGenerator(CylinderMeshParams()).build_mesh()
+        mesh.blocks[0, 0] = mesh.n_vertices
+        valid, msg = mesh.validate()
+        assert not valid and "索引" in msg
+
+
+def _cell_sums(polymesh):
+    """各網格的面積向量總和與體積（散度定理）"""
+    points = polymesh.points[polymesh.faces]
+    areas = 0.5 * np.cross(points[:, 2] - points[:, 0], points[:, 3] - points[:, 1])
+    moments = np.einsum("ij,ij->i", points.mean(axis=1), areas) / 3.0
+    n_internal = polymesh.n_internal_faces
+
+    closure = np.zeros((polymesh.n_cells, 3))
+    volumes = np.zeros(polymesh.n_cells)
+    np.add.at(closure, polymesh.owner, areas)
+    np.add.at(closure, polymesh.neighbour, -areas[:n_internal])
+    np.add.at(volumes, polymesh.owner, moments)
+    np.add.at(volumes, polymesh.neighbour, -moments[:n_internal])
+    return closure, volumes
+
+
+class TestPolyMesh:
+    """測試 polyMesh 直接輸出"""
+
+    def test_topology(self):
+        """測試網格數、面數與 upper-triangular 順序"""
+        inner, outer = _golden_samples()
+        generator = MeshGenerator(GOLDEN_FLOW_PARAMS)
+        polymesh = generator.build_polymesh(inner, outer)
+
+        assert polymesh.validate() == (True, "")
+        assert polymesh.n_cells == generator.build_mesh(inner, outer).n_cells
+        assert polymesh.n_points == 13 * 11 * 16
+        sizes = {p.name: p.n_faces for p in polymesh.patches}
+        assert sizes == {
+            "inlet": 160,
+            "outlet": 160,
+            "innerWall": 192,
+            "outerWall": 192,
+        }
+
+        # 每個網格 6 個面
+        counts = np.bincount(polymesh.owner) + np.bincount(
+            polymesh.neighbour, minlength=polymesh.n_cells
+        )
+        assert np.all(counts == 6)
+
+    def test_closed_cells(self):
+        """測試各網格封閉且體積為正（面法向量由 owner 指向 neighbour、指向域外）"""
+        radii = ([1.0, 1.2, 1.1], [2.0, 2.5, 2.2], [0.0, 0.5, 1.2])
+        polymesh = annulus_polymesh(*radii, 4, 12, 3, radial_grading=3.0)
+        closure, volumes = _cell_sums(polymesh)
+        np.testing.assert_allclose(closure, 0.0, atol=1e-12)
+        assert np.all(volumes > 0)
+
+    def test_points_on_block_vertices(self):
+        """測試 blockMeshDict 的頂點都是 polyMesh 的點（含 scale）"""
+        inner, outer = _golden_samples()
+        params = MeshParameters(
+            scale_factor=0.001, num_layers=5, n_cells_radial=3, n_cells_circum=8
+        )
+        generator = MeshGenerator(params)
+        mesh = generator.build_mesh(inner, outer)
+        points = generator.build_polymesh(inner, outer).points.reshape(-1, 4, 8, 3)
+
+        layers = mesh.vertices.reshape(-1, 8, 3) * 0.001
+        stations = points[:: params.n_cells_axial]
+        np.testing.assert_allclose(stations[:, 0, ::2], layers[:, :4], atol=1e-15)
+        np.testing.assert_allclose(stations[:, -1, ::2], layers[:, 4:], atol=1e-15)
+
+    def test_ascii_binary_parity(self, tmp_path):
+        """測試 ascii 與 binary 格式內容一致"""
+        inner, outer = _samples(4)
+        generator = MeshGenerator(
+            MeshParameters(num_layers=4, n_cells_radial=2, n_cells_circum=8)
+        )
+        polymesh = generator.build_polymesh(inner, outer)
+        ascii_dir = generator.write_polymesh(inner, outer, tmp_path / "a")
+        binary_dir = generator.write_polymesh(inner, outer, tmp_path / "b", "binary")
+        assert ascii_dir == tmp_path / "a" / "constant" / "polyMesh"
+
+        for directory in (ascii_dir, binary_dir):
+            loaded = read_polymesh(directory)
+            np.testing.assert_array_equal(loaded.points, polymesh.points)
+            np.testing.assert_array_equal(loaded.faces, polymesh.faces)
+            np.testing.assert_array_equal(loaded.owner, polymesh.owner)
+            np.testing.assert_array_equal(loaded.neighbour, polymesh.neighbour)
+            assert loaded.patches == polymesh.patches
+            assert loaded.validate() == (True, "")
+
+        # binary 的面串列為 faceCompactList，點座標不經文字格式化
+        header = (binary_dir / "faces").read_bytes()[:200]
+        assert b"faceCompactList" in header
+        sizes = [(d / "points").stat().st_size for d in (binary_dir, ascii_dir)]
+        assert sizes[0] < sizes[1]
+
+
+class TestFoamIO:
+    """測試 OpenFOAM 串列檔案讀寫"""
+
+    @pytest.mark.parametrize("fmt", ["ascii", "binary"])
+    def test_round_trip(self, tmp_path, fmt):
+        """測試各種串列寫出後讀回完全相同"""
+        rng = np.random.default_rng(0)
+        lists = {
+            "labels": rng.integers(0, 1000, 50),
+            "scalars": rng.normal(size=50) * 1e-7,
+            "vectors": rng.normal(size=(50, 3)),
+            "faces": rng.integers(0, 100, (50, 4)),
+            "empty": np.empty(0, dtype=np.int64),
+        }
+        for name, values in lists.items():
+            path = write_foam_list(tmp_path / name, values, fmt, note="test")
+            loaded = read_foam_list(path)
+            assert loaded.shape == values.shape
+            np.testing.assert_array_equal(loaded, values)
+
+    def test_binary_is_raw_bytes(self, tmp_path):
+        """測試 binary 串列即為長度加上陣列的原始位元組"""
+        values = np.arange(5, dtype=np.int64)
+        data = write_foam_list(tmp_path / "owner", values, "binary").read_bytes()
+        assert data.endswith(b"5\n(" + values.astype("<i4").tobytes() + b")\n")
+        assert b'arch        "LSB;label=32;scalar=64";' in data
+
+    def test_invalid_format(self, tmp_path):
+        """測試不支援的格式"""
+        with pytest.raises(ValueError):
+            write_foam_list(tmp_path / "owner", np.arange(3), "hdf5")
+
+
+def _straight_then_bent(num_layers: int):
+    """前 70% 為錐形直管、之後彎曲的內外曲線"""
+    z = np.linspace(0.0, 100.0, num_layers)
+    x = 10.0 + np.where(z > 70.0, 1.4 + 3.0 * np.sin((z - 70.0) / 5.0) ** 2, 0.02 * z)
+    inner = np.column_stack([x, np.zeros_like(z), z])
+    outer = np.column_stack([20.0 + 0.05 * z, np.zeros_like(z), z])
+    return inner, outer
+
+
+class TestConsolidation:
+    """測試共線層合併"""
+
+    def test_collinear_runs(self):
+        """測試只保留共線段的首尾層"""
+        z = np.arange(7.0)
+        radii = np.array([[0, 1, 2, 3, 5, 7, 9.0], [1, 1, 1, 1, 1, 1, 1.0]])
+        result = consolidate_layers(z, radii, 1e-9)
+        np.testing.assert_array_equal(result.keep, [0, 3, 6])
+        np.testing.assert_array_equal(result.spans, [3, 3])
+        assert result.blocks_saved == 16
+
+        # 容許偏差大於轉折處的偏差時整段合併
+        assert consolidate_layers(z, radii, 2.0).keep.tolist() == [0, 6]
+
+    def test_merged_blocks(self):
+        """測試合併後塊數減少、總網格數與邊界面一致"""
+        inner, outer = _straight_then_bent(101)
+        params = MeshParameters(num_layers=101, n_cells_radial=3, n_cells_circum=8)
+        plain = MeshGenerator(params).build_mesh(inner, outer)
+        merged_params = MeshParameters(
+            num_layers=101, n_cells_radial=3, n_cells_circum=8, merge_tolerance=1e-6
+        )
+        generator = MeshGenerator(merged_params)
+        consolidation = generator.consolidate(inner, outer)
+        mesh = generator.build_mesh(inner, outer)
+
+        assert consolidation.blocks_saved == 4 * 69
+        assert mesh.n_blocks == plain.n_blocks - consolidation.blocks_saved
+        assert mesh.validate() == (True, "")
+        assert mesh.n_cells == plain.n_cells
+        assert mesh.cells[0, 2] == 2 * 70
+        assert len(mesh.arc_edges) == 8 * len(consolidation.keep)
+        assert len(mesh.patch("innerWall").faces) == mesh.n_blocks
+
+        # 合併塊的 hex 寫出對應的軸向網格數
+        content = generator.to_bytes(inner, outer).decode()
+        assert "(3 2 140) simpleGrading" in content
+
+    def test_merged_polymesh(self):
+        """測試合併塊的 polyMesh 與逐層網格的點位一致"""
+        inner, outer = _straight_then_bent(21)
+        params = MeshParameters(num_layers=21, n_cells_radial=2, n_cells_circum=8)
+        merged = MeshParameters(
+            num_layers=21, n_cells_radial=2, n_cells_circum=8, merge_tolerance=1e-6
+        )
+        expected = MeshGenerator(params).build_polymesh(inner, outer)
+        polymesh = MeshGenerator(merged).build_polymesh(inner, outer)
+
+        assert polymesh.validate() == (True, "")
+        np.testing.assert_allclose(polymesh.points, expected.points, atol=1e-9)
+        np.testing.assert_array_equal(polymesh.faces, expected.faces)
+
+
+class TestAxialEdges:
+    """測試沿 Z 的曲線邊"""
+
+    def _params(self, **kwargs) -> MeshParameters:
+        return MeshParameters(n_cells_radial=2, n_cells_circum=8, **kwargs)
+
+    def test_curve_edges(self):
+        """測試每對相鄰層 8 條曲線邊，中間點取自兩層之間的取樣點"""
+        inner, outer = _straight_then_bent(31)
+        mesh = MeshGenerator(self._params(axial_edge_points=2)).build_mesh(
+            inner, outer
+        )
+
+        assert mesh.validate() == (True, "")
+        assert mesh.n_vertices == 8 * 11
+        assert mesh.curve_edges.shape == (8 * 10, 2)
+        assert mesh.curve_points.shape == (8 * 10, 2, 3)
+        np.testing.assert_array_equal(mesh.curve_edges[:8], np.c_[0:8, 8:16])
+
+        # 第 0 對的中間點為取樣點 1、2，依象限旋轉
+        np.testing.assert_allclose(mesh.curve_points[0], inner[1:3])
+        np.testing.assert_allclose(mesh.curve_points[1, :, 1], inner[1:3, 0])
+        np.testing.assert_allclose(mesh.curve_points[6, :, 0], -outer[1:3, 0])
+        interior = np.delete(inner[:, 2], np.arange(0, 31, 3)).reshape(10, 2)
+        np.testing.assert_allclose(mesh.curve_points[::8, :, 2], interior)
+
+    def test_emitted_edges(self):
+        """測試兩種輸出格式皆寫出曲線邊，直線邊時輸出不變"""
+        inner, outer = _straight_then_bent(31)
+        for profile in ("annotated", "compact"):
+            params = self._params(axial_edge_points=2, axial_edge_type="polyLine")
+            generator = MeshGenerator(params, profile=profile)
+            content = generator.to_bytes(inner, outer).decode()
+            edges = content[content.index("edges") : content.index("boundary")]
+            assert edges.count("    polyLine ") == 80
+            assert "spline" not in content
+
+        inner, outer = _straight_then_bent(11)
+        content = MeshGenerator(self._params()).to_bytes(inner, outer).decode()
+        assert "spline" not in content and "polyLine" not in content
+
+    def test_merged_pairs_are_straight(self):
+        """測試合併塊為直線邊，共線判斷涵蓋中間點"""
+        inner, outer = _straight_then_bent(101)
+        params = self._params(axial_edge_points=4, merge_tolerance=1e-6)
+        generator = MeshGenerator(params)
+        consolidation = generator.consolidate(inner, outer)
+        mesh = generator.build_mesh(inner, outer)
+
+        assert consolidation.n_layers == 21
+        assert consolidation.keep.tolist()[:2] == [0, 14]
+        assert mesh.validate() == (True, "")
+        assert len(mesh.curve_edges) == 8 * int(np.sum(consolidation.spans == 1))
+        assert mesh.cells[0, 2] == 2 * 14
+
+    def test_curved_polymesh(self):
+        """測試 polyMesh 的站位半徑沿經過中間點的剖面"""
+        inner, outer = _straight_then_bent(31)
+        params = self._params(axial_edge_points=2, n_cells_axial=3)
+        polymesh = MeshGenerator(params).build_polymesh(inner, outer)
+
+        assert polymesh.validate() == (True, "")
+        # 每段 3 格、中間點與站位重合，內壁 0° 的點即為取樣點
+        points = polymesh.points.reshape(31, 3, 8, 3)
+        np.testing.assert_allclose(points[:, 0, 0], inner, atol=1e-12)
+        np.testing.assert_allclose(points[:, -1, 0, 0], outer[:, 0], atol=1e-12)
+
+    def test_sample_count_mismatch(self):
+        """測試取樣點數與中間點數不符時報錯"""
+        inner, outer = _straight_then_bent(30)
+        with pytest.raises(ValueError):
+            MeshGenerator(self._params(axial_edge_points=2)).build_mesh(inner, outer)
+        assert self._params(axial_edge_type="bezier").validate()[0] is False
+
+
+class TestWedge:
+    """測試軸對稱楔形模式"""
+
+    def test_wedge_mesh(self):
+        """測試每層 4 個頂點、每對相鄰層 1 個塊，front、back 為 wedge patch"""
+        inner, outer = _samples(5)
+        params = MeshParameters(num_layers=5, n_cells_radial=4, axisymmetric=True)
+        mesh = MeshGenerator(params).build_mesh(inner, outer)
+        full = MeshGenerator(MeshParameters(n_cells_radial=4)).build_mesh(inner, outer)
+
+        assert mesh.validate() == (True, "")
+        assert mesh.n_vertices == 4 * 5 and mesh.n_blocks == 4
+        assert mesh.n_cells * 400 == full.n_cells
+        patches = {patch.name: patch for patch in mesh.patches}
+        assert patches["front"].type == patches["back"].type == "wedge"
+        assert len(patches["front"].faces) == 4
+
+        # 頂點位於 ±2.5° 的兩個平面上，半徑與取樣相同，圓弧中點在 0°
+        layers = mesh.vertices.reshape(5, 4, 3)
+        angles = np.degrees(np.arctan2(layers[..., 1], layers[..., 0]))
+        np.testing.assert_allclose(angles, np.tile([-2.5, 2.5], (5, 2)))
+        radii = np.hypot(layers[:, 0, 0], layers[:, 0, 1])
+        np.testing.assert_allclose(radii, inner[:, 0])
+        np.testing.assert_allclose(mesh.arc_points[1::2, 0], outer[:, 0])
+
+        # front 面的頂點皆在 +2.5°
+        front = mesh.vertices[patches["front"].faces]
+        assert np.all(front[..., 1] > 0)
+
+    def test_wedge_output(self):
+        """測試兩種輸出格式，曲線邊沿楔形平面"""
+        inner, outer = _straight_then_bent(31)
+        params = MeshParameters(axisymmetric=True, axial_edge_points=2)
+        for profile in ("annotated", "compact"):
+            generator = MeshGenerator(params, profile=profile)
+            content = generator.to_bytes(inner, outer).decode()
+            assert content.count("hex ") == 10
+            assert content.count("type wedge;") == 2
+            assert content.count("    spline ") == 40
+
+        mesh = MeshGenerator(params).build_mesh(inner, outer)
+        points = mesh.curve_points[1]
+        np.testing.assert_allclose(
+            np.degrees(np.arctan2(points[:, 1], points[:, 0])), 2.5
+        )
+        with pytest.raises(ValueError):
+            MeshGenerator(params).build_polymesh(inner, outer)
+
+
+class TestCylinderSymmetry:
+    """測試圓柱的半域、四分之一域模式"""
+
+    @pytest.mark.parametrize("mode, fraction", [("half", 2), ("quarter", 4)])
+    def test_section_mesh(self, mode, fraction):
+        """測試網格數減少比例，且每個塊的邊界面都屬於某個 patch"""
+        generator = CylinderMeshGenerator(CylinderMeshParams(symmetry=mode))
+        mesh = generator.build_mesh()
+
+        assert mesh.validate() == (True, "")
+        cells, full = generator.cell_counts()
+        assert cells * fraction == full
+
+        # 各塊為右手座標（底面自 +X 看為逆時針）
+        hexes = mesh.vertices[mesh.blocks]
+        edges = hexes[:, [1, 3, 4]] - hexes[:, :1]
+        assert np.all(np.linalg.det(edges) > 0)
+
+        # 只出現一次的塊面即為邊界面，須與各 patch 的面一致
+        corners = [(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4)]
+        corners += [(1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+        faces = [
+            frozenset(block[list(c)].tolist()) for block in mesh.blocks for c in corners
+        ]
+        boundary = {face for face in faces if faces.count(face) == 1}
+        patched = [frozenset(f.tolist()) for p in mesh.patches for f in p.faces]
+        assert sorted(map(sorted, patched)) == sorted(map(sorted, boundary))
+
+        # 入口、出口面的法向量與完整模式相同，皆指向域外（-X、+X）
+        full_mesh = CylinderMeshGenerator(CylinderMeshParams()).build_mesh()
+        for name, sign in (("inlet", -1), ("outlet", 1)):
+            for candidate in (mesh, full_mesh):
+                patch = next(p for p in candidate.patches if p.name == name)
+                points = candidate.vertices[patch.faces]
+                normals = np.cross(
+                    points[:, 2] - points[:, 0], points[:, 3] - points[:, 1]
+                )
+                assert np.all(sign * normals[:, 0] > 0)
+
+        # 切面為 symmetryPlane，面上的點落在對應的座標平面上
+        for patch in mesh.patches[3:]:
+            assert patch.type == "symmetryPlane"
+            axis = {"symmetryY": 1, "symmetryZ": 2}[patch.name]
+            assert np.all(mesh.vertices[patch.faces][..., axis] == 0)
+
+    def test_partial_arcs(self):
+        """測試部分圓環的圓弧中點位於外圓與內方形各邊的圓上"""
+        params = CylinderMeshParams(symmetry="quarter")
+        mesh = CylinderMeshGenerator(params).build_mesh()
+
+        outer = mesh.arc_points[:4, 1:]
+        np.testing.assert_allclose(np.hypot(*outer.T), params.radius)
+
+        # 內方形 +Y 邊的圓：經過 (s, ±s) 與 (sc, 0)，圓心在 Y 軸上
+        s, sc = params.inner_square_side, params.inner_square_curve
+        center = (2 * s * s - sc * sc) / (2 * (s - sc))
+        y, z = mesh.arc_points[4, 1:]
+        assert np.hypot(y - center, z) == pytest.approx(sc - center)
+        assert 0 < z < s
+
+    def test_section_output(self):
+        """測試兩種輸出格式皆含切面 patch，完整模式輸出不變"""
+        for profile in ("annotated", "compact"):
+            params = CylinderMeshParams(symmetry="half")
+            content = CylinderMeshGenerator(params, profile).to_bytes().decode()
+            assert content.count("hex ") == 4
+            assert "symmetryPlane" in content
+        odd = CylinderMeshParams(symmetry="half", n_cells_square=31)
+        assert odd.validate()[0] is False
+        assert CylinderMeshParams(symmetry="eighth").validate()[0] is False
+
+
+class TestGrading:
+    """測試多段漸變"""
+
+    def test_wall_grading(self):
+        """測試第一格高度、最大網格尺寸，且網格數遠少於均勻分割"""
+        length, first, largest = 5.33, 5e-4, 0.05
+        grading = wall_grading(length, first, largest)
+
+        sizes = np.diff(section_fractions(grading.n_cells, grading.sections)) * length
+        assert sizes.sum() == pytest.approx(length)
+        assert sizes[0] == pytest.approx(first) and sizes[-1] == pytest.approx(first)
+        assert sizes.max() <= largest * (1 + 1e-9)
+        assert np.all(sizes[1:] / sizes[:-1] <= 1.2 + 1e-9)
+        assert grading.n_cells * 50 < length / first
+
+    def test_short_length(self):
+        """測試全長不足時縮短漸變段"""
+        grading = wall_grading(1.0, 0.1, 10.0, ends=1)
+        assert len(grading.sections) == 1
+        assert grading.sections[0, 0] == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            wall_grading(1.0, 0.6, 1.0)
+
+    def test_cylinder_axial_grading(self):
+        """測試圓柱高度方向的擴展比與多段漸變輸出"""
+        params = CylinderMeshParams(axial_grading=4.0)
+        content = CylinderMeshGenerator(params).to_bytes().decode()
+        assert content.count("simpleGrading (1 1 4)") == 5
+
+        sections = ((0.2, 0.3, 4.0), (0.6, 0.4, 1.0), (0.2, 0.3, 0.25))
+        params = CylinderMeshParams(axial_sections=sections)
+        assert grading_text(sections) == "((0.2 0.3 4) (0.6 0.4 1) (0.2 0.3 0.25))"
+        for profile in ("annotated", "compact"):
+            generator = CylinderMeshGenerator(params, profile)
+            content = generator.to_bytes().decode()
+            assert content.count(f"(1 1 {grading_text(sections)})") == 5
+
+        params = CylinderMeshParams(first_cell_height=5e-4, max_cell_height=0.05)
+        mesh = CylinderMeshGenerator(params).build_mesh()
+        assert mesh.validate() == (True, "")
+        assert np.all(mesh.cells[:, 2] == wall_grading(5.33, 5e-4, 0.05).n_cells)
+        assert CylinderMeshParams(axial_sections=((1, 0, 1),)).validate()[0] is False
+
+
+class TestBoundaryLayer:
+    """測試以徑向多段漸變表示的邊界層"""
+
+    BL = BoundaryLayerParams(
+        enabled=True, inner_thickness=0.05, outer_thickness=0.1, inner_layers=6
+    )
+
+    def test_radial_multi_grading(self):
+        """測試塊數不變，徑向網格數加上邊界層層數"""
+        inner, outer = _golden_samples()
+        plain = MeshGenerator(GOLDEN_FLOW_PARAMS).build_mesh(inner, outer)
+        mesh = MeshGenerator(GOLDEN_FLOW_PARAMS, self.BL).build_mesh(inner, outer)
+
+        assert mesh.validate() == (True, "")
+        assert mesh.n_blocks == plain.n_blocks
+        assert mesh.n_vertices == plain.n_vertices
+        assert np.all(mesh.cells[:, 0] == 10 + 6 + 5)
+        np.testing.assert_allclose(
+            mesh.multi_grading[0],
+            [[0.05, 6 / 21, 1.2**5], [0.85, 10 / 21, 1.0], [0.1, 5 / 21, 1.2**-4]],
+        )
+
+        text = grading_text(mesh.multi_grading[0])
+        for profile in ("annotated", "compact"):
+            generator = MeshGenerator(GOLDEN_FLOW_PARAMS, self.BL, profile=profile)
+            content = generator.to_bytes(inner, outer).decode()
+            assert content.count(f"simpleGrading ({text} 1 1)") == 16
+
+    def test_polymesh_layers(self):
+        """測試 polyMesh 的邊界層厚度、逐層擴展比與網格封閉"""
+        inner, outer = _golden_samples()
+        generator = MeshGenerator(GOLDEN_FLOW_PARAMS, self.BL)
+        polymesh = generator.build_polymesh(inner, outer)
+        closure, volumes = _cell_sums(polymesh)
+        np.testing.assert_allclose(closure, 0.0, atol=1e-12)
+        assert np.all(volumes > 0)
+
+        # 入口 0° 方向沿徑向的點
+        radii = polymesh.points.reshape(-1, 22, 16, 3)[0, :, 0, 0]
+        sizes = np.diff(radii)
+        gap = outer[0, 0] - inner[0, 0]
+        assert sizes[:6].sum() == pytest.approx(0.05 * gap)
+        assert sizes[-5:].sum() == pytest.approx(0.1 * gap)
+        np.testing.assert_allclose(sizes[1:6] / sizes[:5], 1.2)
+        np.testing.assert_allclose(sizes[-5:-1] / sizes[-4:], 1.2)
+        np.testing.assert_allclose(sizes[6:-5], 0.085 * gap)
+
+    def test_wedge(self):
+        """測試軸對稱楔形模式同樣套用邊界層"""
+        inner, outer = _samples(5)
+        params = MeshParameters(num_layers=5, n_cells_radial=4, axisymmetric=True)
+        mesh = MeshGenerator(params, self.BL).build_mesh(inner, outer)
+        assert mesh.n_blocks == 4
+        assert np.all(mesh.cells[:, 0] == 4 + 6 + 5)
+        assert 0 in mesh.multi_grading
+
+
+class TestYPlus:
+    """測試依目標 y+ 計算邊界層"""
+
+    def test_first_cell_height(self):
+        """測試第一格中心的 y+ 等於目標值"""
+        density, viscosity, velocity = 998.0, 1e-3, 2.0
+        diameter = np.array([0.01, 0.02, 0.05])
+        height, reynolds = first_cell_height(
+            5.0, density, viscosity, velocity, diameter
+        )
+        np.testing.assert_allclose(reynolds, density * velocity * diameter / viscosity)
+
+        friction = (0.790 * np.log(reynolds) - 1.64) ** -2
+        u_tau = np.sqrt(friction / 8 * velocity**2)
+        np.testing.assert_allclose(density * u_tau * height / 2 / viscosity, 5.0)
+        with pytest.raises(ValueError):
+            first_cell_height(1.0, density, viscosity, 0.0, diameter)
+
+    def test_minimal_layers(self):
+        """測試層數為最少，且擴展比使第一格恰為目標高度"""
+        first = np.array([0.001, 0.004, 0.01, 0.05])
+        layers, expansion = minimal_layers(first, 0.05, 1.2)
+        np.testing.assert_array_equal(layers, [14, 7, 4, 1])
+
+        # 少一層時以上限擴展比也無法覆蓋厚度
+        n = layers[:3]
+        assert np.all(first[:3] * (1.2 ** (n - 1) - 1) / 0.2 < 0.05)
+        growth = expansion[:3]
+        achieved = 0.05 * (growth - 1) / (growth**n - 1)
+        np.testing.assert_allclose(achieved, first[:3], rtol=1e-9)
+        assert np.all(growth <= 1.2)
+
+    def test_fills_boundary_layer(self):
+        """測試沿 Z 間距變化時取最需要加密的一層，所有層的第一格皆不超過目標"""
+        z = np.linspace(0.0, 100.0, 9)
+        inner = np.column_stack([10 + 0.05 * z, np.zeros_like(z), z])
+        outer = np.column_stack([20 + 0.2 * z, np.zeros_like(z), z])
+        params = YPlusParams(enabled=True, target_yplus=5.0, velocity=5.0)
+        bl = BoundaryLayerParams(enabled=True, inner_thickness=0.1, outer_thickness=0.2)
+        result = yplus_layers(inner, outer, params, bl, scale=0.001)
+
+        assert result.first_cell.shape == (9,) and result.layers.shape == (2, 9)
+        assert result.critical_layer == 8
+        filled = result.boundary_layer_params(bl)
+        assert filled.validate() == (True, "")
+        assert filled.inner_layers < filled.outer_layers
+        assert (filled.inner_layers, filled.outer_layers) == tuple(result.layers[:, 8])
+
+        mesh_params = MeshParameters(num_layers=9, scale_factor=0.001, n_cells_circum=8)
+        polymesh = MeshGenerator(mesh_params, filled).build_polymesh(inner, outer)
+        radii = polymesh.points.reshape(-1, polymesh.n_points // 17 // 8, 8, 3)
+        stations = radii[:: mesh_params.n_cells_axial, :, 0, 0]
+        inner_first = stations[:, 1] - stations[:, 0]
+        outer_first = stations[:, -1] - stations[:, -2]
+        assert np.all(inner_first <= result.first_cell * (1 + 1e-9))
+        assert np.all(outer_first <= result.first_cell * (1 + 1e-9))
+        assert max(inner_first[8], outer_first[8]) == pytest.approx(
+            result.first_cell[8]
+        )
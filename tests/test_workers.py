@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+背景工作測試
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.ui.workers import TaskWorker
+
+
+def _collect(worker: TaskWorker) -> list:
+    """記錄工作發出的信號"""
+    events = []
+    worker.signals.progress.connect(lambda p, s: events.append(("progress", p, s)))
+    worker.signals.finished.connect(lambda r: events.append(("finished", r)))
+    worker.signals.failed.connect(lambda e: events.append(("failed", type(e))))
+    worker.signals.cancelled.connect(lambda: events.append(("cancelled",)))
+    return events
+
+
+class TestTaskWorker:
+    """測試通用背景工作（直接於目前執行緒執行）"""
+
+    def test_finished_with_progress(self):
+        """測試回報進度並回傳結果"""
+
+        def task(progress):
+            progress.report(50, "half")
+            return 42
+
+        worker = TaskWorker(task)
+        events = _collect(worker)
+        worker.run()
+
+        assert events == [("progress", 50, "half"), ("finished", 42)]
+
+    def test_cancel_before_start(self):
+        """測試開始前取消則不執行作業"""
+        calls = []
+        worker = TaskWorker(lambda progress: calls.append(1))
+        events = _collect(worker)
+        worker.cancel()
+        worker.run()
+
+        assert calls == []
+        assert events == [("cancelled",)]
+
+    def test_cancel_at_checkpoint(self):
+        """測試作業於檢查點回應取消"""
+        worker = TaskWorker(lambda progress: (worker.cancel(), progress.check()))
+        events = _collect(worker)
+        worker.run()
+
+        assert events == [("cancelled",)]
+
+    def test_failure(self):
+        """測試例外以 failed 信號傳回"""
+
+        def task(progress):
+            raise ValueError("bad data")
+
+        worker = TaskWorker(task)
+        events = _collect(worker)
+        worker.run()
+
+        assert events == [("failed", ValueError)]